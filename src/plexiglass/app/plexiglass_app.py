@@ -23,6 +23,7 @@ from plexapi.server import PlexServer
 from textual.widgets import Button, Checkbox, Footer, Header, Input, Static
 
 from plexiglass.config.loader import ConfigLoader
+from plexiglass.config.performance import PerformanceConfig
 from plexiglass.gallery.registry import DemoRegistry
 from plexiglass.gallery.demos.collections.list_collections import ListCollectionsDemo
 from plexiglass.gallery.demos.collections.list_playlists import ListPlaylistsDemo
@@ -60,6 +61,13 @@ from plexiglass.gallery.demos.utilities.get_download_url import GetDownloadURLDe
 from plexiglass.gallery.demos.utilities.get_thumbnail_url import GetThumbnailURLDemo
 from plexiglass.gallery.demos.advanced.get_server_capabilities import GetServerCapabilitiesDemo
 from plexiglass.gallery.demos.advanced.list_server_activities import ListServerActivitiesDemo
+from plexiglass.models.dashboard_snapshot import (
+    DashboardSnapshot,
+    extrapolate_progress,
+    format_age,
+)
+from plexiglass.services.dashboard_refresh import DashboardRefreshWorker, StatusCollector
+from plexiglass.services.disk_cache import DiskCache
 from plexiglass.services.server_manager import ServerManager
 from plexiglass.ui.screens.gallery_screen import GalleryScreen
 
@@ -122,9 +130,12 @@ class SessionDetailsPanel(Static):
             title = entry.get("title", "Unknown")
             user = entry.get("user", "Unknown")
             state = entry.get("state", "unknown")
-            progress = entry.get("progress_percent")
+            progress = extrapolate_progress(entry)
             progress_display = "-" if progress is None else f"{progress}%"
-            lines.append(f"{server}: {title} ({user}) [{state}] {progress_display}")
+            stale = ""
+            if entry.get("stale"):
+                stale = f" [yellow](as of {format_age(entry.get('fetched_at'))} ago)[/]"
+            lines.append(f"{server}: {title} ({user}) [{state}] {progress_display}{stale}")
 
         return "\n".join(lines)
 
@@ -399,30 +410,55 @@ class ServerStatusCard(Static):
         version = self.status.get("version", "-")
         platform = self.status.get("platform", "-")
         session_count = self.status.get("session_count", 0)
-        now_playing = self._format_now_playing(self.status.get("now_playing", []))
+        now_playing = self._format_now_playing(
+            self.status.get("now_playing", []), stale=bool(self.status.get("stale"))
+        )
         status_style = "[green]" if self.status.get("connected") else "[red]"
 
+        rtt = self.status.get("endpoint_rtt_ms")
+        endpoint = url if rtt is None else f"{url} ({rtt:.0f} ms)"
+
         lines = [
             f"{name}",
-            f"{status_style}{connected}[/] | {url}",
+            f"{status_style}{connected}[/] | {endpoint}",
             f"Version: {version} | Platform: {platform}",
             f"Sessions: {session_count}",
         ]
 
+        health_line = self._format_health()
+        if health_line:
+            lines.append(health_line)
+
+        if self.status.get("stale"):
+            fetched_at = self.status.get("fetched_at")
+            if fetched_at is None:
+                lines.append("[yellow]Waiting for first response[/]")
+            else:
+                lines.append(f"[yellow]Stale: last updated {format_age(fetched_at)} ago[/]")
+
         if now_playing:
             lines.append("Now Playing:")
             lines.extend(now_playing)
 
         return "\n".join(lines)
 
+    def _format_health(self) -> str | None:
+        health = self.status.get("health")
+        if not health or health == "unknown":
+            return None
+        style = {"healthy": "[green]", "degraded": "[yellow]", "down": "[red]"}.get(health, "")
+        latency = self.status.get("latency_ms")
+        latency_display = "" if latency is None else f" | Latency: {latency:.0f} ms"
+        return f"Health: {style}{health}[/]{latency_display}"
+
     @staticmethod
-    def _format_now_playing(entries: list[dict[str, Any]]) -> list[str]:
+    def _format_now_playing(entries: list[dict[str, Any]], stale: bool = False) -> list[str]:
         formatted: list[str] = []
         for entry in entries:
             title = entry.get("title", "Unknown")
             user = entry.get("user", "Unknown")
             state = entry.get("state", "unknown")
-            progress = entry.get("progress_percent")
+            progress = extrapolate_progress({**entry, "stale": stale})
             progress_display = "-" if progress is None else f"{progress}%"
             formatted.append(f"- {title} ({user}) [{state}] {progress_display}")
 
@@ -434,16 +470,41 @@ class MainScreen(Screen):
 
     refresh_handle = None
     last_manual_refresh = False
+    snapshot: DashboardSnapshot | None = None
+    refresh_worker: DashboardRefreshWorker | None = None
+    status_collector: StatusCollector | None = None
+    # Manager the refresh pipeline, health probing and session listener run against.
+    services_manager: ServerManager | None = None
+    live_sessions = False
+    # Latest alert-reported play state per server name and session key.
+    play_states: dict[str, dict[str, dict[str, Any]]] | None = None
 
     class DashboardRefresh(Message):
         """Message for refreshing dashboard data."""
 
+    class PlayStatesChanged(Message):
+        """Message carrying PlaySessionStateNotification entries from a server."""
+
+        def __init__(self, server: str, notes: list[dict[str, Any]] | None) -> None:
+            super().__init__()
+            self.server = server
+            self.notes = notes
+
+    class SnapshotReady(Message):
+        """Message carrying a snapshot captured by the refresh worker."""
+
+        def __init__(self, snapshot: DashboardSnapshot) -> None:
+            super().__init__()
+            self.snapshot = snapshot
+
     def compose(self) -> ComposeResult:
         yield Header()
 
+        snapshot = self._warm_start_snapshot()
+        self.snapshot = snapshot
+
         with Container(id="dashboard", classes="dashboard"):
-            summary = self._build_summary()
-            yield DashboardSummary(summary)
+            yield DashboardSummary(snapshot.summary)
 
             with Horizontal(classes="dashboard-row"):
                 actions = self._build_quick_actions()
@@ -454,39 +515,148 @@ class MainScreen(Screen):
 
             yield Static("", classes="panel-spacer")
 
-            sessions = self._build_session_details()
-            yield SessionDetailsPanel(sessions)
-
-            server_names: list[str] = []
-            app = self.app
-            if isinstance(app, PlexiGlassApp) and app.server_manager is not None:
-                server_names = app.server_manager.get_all_server_names()
+            yield SessionDetailsPanel(snapshot.sessions)
 
-            for name in server_names:
-                status = self._get_server_status(name)
-                yield ServerStatusCard(status)
+            for name in snapshot.server_names:
+                yield ServerStatusCard(snapshot.status_for(name))
 
         yield Footer()
 
     def on_mount(self) -> None:
-        app = self.app
-        refresh_interval = 5
-        if isinstance(app, PlexiGlassApp) and app.config_loader is not None:
-            refresh_interval = (
-                app.config_loader.get_settings().get("ui", {}).get("refresh_interval", 5)
-            )
-        self.refresh_handle = self.set_interval(refresh_interval, self._trigger_refresh)
+        # Per-server intervals live in the collector's RefreshScheduler; this
+        # tick only checks whether any server or endpoint is due.
+        self.refresh_handle = self.set_interval(
+            PerformanceConfig.REFRESH_SCHEDULER_TICK, self._scheduled_refresh
+        )
+        self.set_interval(PerformanceConfig.PROGRESS_RENDER_INTERVAL, self._repaint_progress)
+        snapshot = self.snapshot or self._capture_snapshot()
         summary_widget: DashboardSummary = self.query_one(DashboardSummary)
         summary_widget.update_summary(
-            self._build_summary(), last_update=self._format_timestamp(datetime.now())
+            snapshot.summary, last_update=self._format_timestamp(snapshot.captured_at)
+        )
+        self._start_services()
+
+    def on_unmount(self) -> None:
+        self._stop_services()
+
+    def _start_services(self) -> None:
+        """Build the refresh pipeline for the app's server manager and start polling it."""
+        app = self.app
+        live_sessions = PerformanceConfig.DEFAULT_LIVE_SESSIONS
+        settings: dict[str, Any] | None = None
+        if isinstance(app, PlexiGlassApp) and app.config_loader is not None:
+            settings = app.config_loader.get_settings()
+            live_sessions = settings.get("ui", {}).get("live_sessions", live_sessions)
+        self.refresh_worker = DashboardRefreshWorker.from_settings(settings)
+        self.status_collector = StatusCollector.from_settings(
+            settings, on_late_result=self._trigger_refresh, disk_cache=self._current_disk_cache()
         )
+        self._refresh_dashboard(connect=True)
+        server_manager = self._current_server_manager()
+        self.services_manager = server_manager
+        if server_manager is not None:
+            server_manager.start_health_probing()
+            if live_sessions:
+                self.play_states = {}
+                server_manager.add_session_listener(self._post_play_states)
+                self.live_sessions = True
+
+    def _stop_services(self) -> None:
+        """Stop polling and detach from the server manager _start_services() used."""
+        server_manager = self.services_manager
+        self.services_manager = None
+        if server_manager is not None:
+            server_manager.stop_health_probing()
+            if self.live_sessions:
+                server_manager.remove_session_listener(self._post_play_states)
+        self.live_sessions = False
+        self.play_states = None
+        if self.refresh_worker is not None:
+            self.refresh_worker.shutdown()
+            self.refresh_worker = None
+        if self.status_collector is not None:
+            self.status_collector.shutdown()
+            self.status_collector = None
+
+    async def reload_services(self) -> None:
+        """
+        Rebuild the dashboard for a replaced server manager (configuration reload).
+
+        The caller detaches the old manager with _stop_services() before shutting
+        it down; this re-composes the server cards and restarts polling.
+        """
+        self.snapshot = None
+        await self.recompose()
+        self._start_services()
 
     def _trigger_refresh(self) -> None:
         self.post_message(self.DashboardRefresh())
 
+    def _scheduled_refresh(self) -> None:
+        collector = self.status_collector
+        if collector is None or collector.has_due(self._current_server_manager()):
+            self._trigger_refresh()
+
     def on_main_screen_dashboard_refresh(self, message: "MainScreen.DashboardRefresh") -> None:
         del message
-        self._refresh_dashboard()
+        self._refresh_dashboard(scheduled=True)
+
+    def on_main_screen_snapshot_ready(self, message: "MainScreen.SnapshotReady") -> None:
+        self._apply_snapshot(message.snapshot)
+
+    def _repaint_progress(self) -> None:
+        """Re-render playing sessions so extrapolated progress advances between polls."""
+        panel = self.query_one(SessionDetailsPanel)
+        if not any(entry.get("state") == "playing" for entry in panel.sessions):
+            return
+        panel.update_sessions(panel.sessions)
+        for card in self.query(ServerStatusCard):
+            if any(entry.get("state") == "playing" for entry in card.status.get("now_playing", [])):
+                card.update_status(card.status)
+
+    def _post_play_states(self, server: str, notes: list[dict[str, Any]] | None) -> None:
+        # Called on the alert listener thread.
+        self.post_message(self.PlayStatesChanged(server, notes))
+
+    def on_main_screen_play_states_changed(self, message: "MainScreen.PlayStatesChanged") -> None:
+        """
+        Patch the affected session rows in place.
+
+        A session key the dashboard hasn't seen, or one that stopped, means the
+        session list itself changed; the alert already dropped the cached list,
+        so a refresh re-fetches it. Anything else is state/offset only. A
+        lost alert listener (``notes`` None) drops the server's play states,
+        since later changes won't be reported, and re-fetches.
+        """
+        if self.snapshot is None or self.play_states is None:
+            return
+        if message.notes is None:
+            self.play_states.pop(message.server, None)
+        known = self.snapshot.session_keys(message.server)
+        states = self.play_states.setdefault(message.server, {})
+        refetch = message.notes is None
+        for note in message.notes or []:
+            session_key = str(note.get("sessionKey", ""))
+            state = str(note.get("state", ""))
+            if state == "stopped" or session_key not in known:
+                states.pop(session_key, None)
+                refetch = True
+                continue
+            states[session_key] = {
+                "state": state,
+                "view_offset": note.get("viewOffset"),
+                "observed_at": datetime.now(),
+            }
+
+        snapshot = self.snapshot.with_play_states(self.play_states)
+        self.query_one(SessionDetailsPanel).update_sessions(snapshot.sessions)
+        for card in self.query(ServerStatusCard):
+            if card.status.get("name") == message.server:
+                card.update_status(snapshot.status_for(message.server))
+        if refetch:
+            if self.status_collector is not None:
+                self.status_collector.scheduler.snap_back(message.server, "now_playing")
+            self._trigger_refresh()
 
     def on_quick_actions_menu_action_triggered(
         self, message: "QuickActionsMenu.ActionTriggered"
@@ -515,7 +685,7 @@ class MainScreen(Screen):
             if isinstance(main_screen, MainScreen):
                 main_screen.last_manual_refresh = True
                 main_screen._refresh_dashboard()
-            self._set_command_output("Dashboard refreshed")
+            self._set_command_output("Dashboard refresh requested")
             return
         if normalized in {"connect", "connect_default", "connect default"}:
             app = self.app
@@ -602,11 +772,43 @@ class MainScreen(Screen):
 
         self._set_command_output(f"Unknown command: {command}")
 
-    def _refresh_dashboard(self) -> None:
-        app = self.app
+    def _refresh_dashboard(self, connect: bool = False, scheduled: bool = False) -> None:
+        """
+        Capture a new snapshot on the refresh worker and apply it via a message.
+
+        The capture is bounded by the collector's deadline; servers that miss it
+        are rendered from last known data and repainted when they answer.
+
+        Args:
+            connect: Also connect to all configured servers (in parallel, in the background)
+            scheduled: Only fetch servers/endpoints whose scheduled refresh is due
+                (default: fetch everything, e.g. for a manual refresh)
+        """
+        if self.refresh_worker is None or self.status_collector is None:
+            self._apply_snapshot(self._capture_snapshot())
+            return
+
+        server_manager = self._current_server_manager()
+        collector = self.status_collector
+
+        def job() -> DashboardSnapshot:
+            return collector.collect(server_manager, connect=connect, scheduled=scheduled)
+
+        self.refresh_worker.request(job, self._post_snapshot)
+
+    def _post_snapshot(self, snapshot: DashboardSnapshot) -> None:
+        self.post_message(self.SnapshotReady(snapshot))
+
+    def _apply_snapshot(self, snapshot: DashboardSnapshot) -> None:
+        self.snapshot = snapshot
+        if self.play_states:
+            # Cached session lists may predate the latest alerts; overlay those
+            # the poll hasn't caught up with and forget the rest.
+            self.play_states = snapshot.current_play_states(self.play_states)
+            snapshot = snapshot.with_play_states(self.play_states)
         summary_widget: DashboardSummary = self.query_one(DashboardSummary)
         summary_widget.update_summary(
-            self._build_summary(), last_update=self._format_timestamp(datetime.now())
+            snapshot.summary, last_update=self._format_timestamp(snapshot.captured_at)
         )
 
         actions_widget: QuickActionsMenu = self.query_one(QuickActionsMenu)
@@ -616,63 +818,33 @@ class MainScreen(Screen):
         commands_widget.update_commands(self._build_command_prompt_commands())
 
         sessions_widget: SessionDetailsPanel = self.query_one(SessionDetailsPanel)
-        sessions_widget.update_sessions(self._build_session_details())
+        sessions_widget.update_sessions(snapshot.sessions)
 
         for card in self.query(ServerStatusCard):
-            status = self._get_server_status(card.status.get("name", ""))
-            card.update_status(status)
-
-    def _get_server_status(self, name: str) -> dict[str, Any]:
-        app = self.app
-        status: dict[str, Any] = {
-            "name": name,
-            "connected": False,
-            "session_count": 0,
-            "now_playing": [],
-        }
-        if isinstance(app, PlexiGlassApp) and app.server_manager is not None:
-            status = app.server_manager.get_server_status(name)
-        return status
-
-    def _build_summary(self) -> dict[str, Any]:
-        app = self.app
-        server_names: list[str] = []
-        connected_count = 0
-        session_count = 0
-        library_count = 0
-        library_items = 0
+            card.update_status(snapshot.status_for(card.status.get("name", "")))
 
-        if isinstance(app, PlexiGlassApp) and app.server_manager is not None:
-            server_names = app.server_manager.get_all_server_names()
-            for name in server_names:
-                status = app.server_manager.get_server_status(name)
-                if status.get("connected"):
-                    connected_count += 1
-                session_count += int(status.get("session_count", 0))
-                library_count += int(status.get("library_count", 0))
-                library_items += int(status.get("library_items", 0))
+    def _capture_snapshot(self) -> DashboardSnapshot:
+        return DashboardSnapshot.capture(self._current_server_manager())
 
-        return {
-            "total_servers": len(server_names),
-            "connected_servers": connected_count,
-            "active_sessions": session_count,
-            "total_libraries": library_count,
-            "total_library_items": library_items,
-        }
+    def _warm_start_snapshot(self) -> DashboardSnapshot:
+        """First paint: servers with a last known status on disk are shown from it."""
+        disk_cache = self._current_disk_cache()
+        if disk_cache is None:
+            return self._capture_snapshot()
+        last_known = disk_cache.items(StatusCollector.DISK_NAMESPACE)
+        return DashboardSnapshot.capture(self._current_server_manager(), last_known=last_known)
 
-    def _build_session_details(self) -> list[dict[str, Any]]:
+    def _current_server_manager(self) -> ServerManager | None:
         app = self.app
-        sessions: list[dict[str, Any]] = []
-
-        if isinstance(app, PlexiGlassApp) and app.server_manager is not None:
-            for name in app.server_manager.get_all_server_names():
-                status = app.server_manager.get_server_status(name)
-                for entry in status.get("now_playing", []):
-                    session_entry = entry.copy()
-                    session_entry["server"] = name
-                    sessions.append(session_entry)
+        if isinstance(app, PlexiGlassApp):
+            return app.server_manager
+        return None
 
-        return sessions
+    def _current_disk_cache(self) -> DiskCache | None:
+        app = self.app
+        if isinstance(app, PlexiGlassApp):
+            return app.disk_cache
+        return None
 
     def _build_quick_actions(self) -> list[dict[str, str]]:
         return [
@@ -928,6 +1100,7 @@ class PlexiGlassApp(App):
         self.config_path = config_path or (Path.home() / ".config" / "plexiglass" / "servers.yaml")
         self.config_loader: ConfigLoader | None = None
         self.server_manager: ServerManager | None = None
+        self.disk_cache: DiskCache | None = None
         self.error_message: str | None = None
 
     def on_mount(self) -> None:
@@ -941,16 +1114,38 @@ class PlexiGlassApp(App):
             self.push_screen("main")
 
     def _load_configuration(self) -> None:
-        """Load configuration and initialize the server manager."""
+        """
+        Load configuration and initialize the server manager.
+
+        On reload the previous manager is shut down (prober, alert listeners,
+        HTTP sessions) and a mounted dashboard is rebuilt around the new one.
+        """
+        previous_manager, previous_disk_cache = self.server_manager, self.disk_cache
         try:
             loader = ConfigLoader(self.config_path)
             loader.load()
             self.config_loader = loader
             self.server_manager = ServerManager(loader)
+            self.disk_cache = DiskCache.from_settings(self.config_path, loader.get_settings())
         except Exception as exc:  # noqa: BLE001 - surface error to UI later
             self.error_message = str(exc)
             self.config_loader = None
             self.server_manager = None
+            # Warm-start data belongs to the configuration that just went away.
+            self.disk_cache = None
+
+        if previous_manager is None and previous_disk_cache is None:
+            return
+        main_screen = self.get_screen("main")
+        mounted = isinstance(main_screen, MainScreen) and main_screen.is_mounted
+        if mounted:
+            main_screen._stop_services()
+        if previous_manager is not None and previous_manager is not self.server_manager:
+            previous_manager.shutdown()
+        if previous_disk_cache is not None and previous_disk_cache is not self.disk_cache:
+            previous_disk_cache.close()
+        if mounted:
+            main_screen.call_later(main_screen.reload_services)
 
     def action_show_gallery(self) -> None:
         """Switch to the Gallery screen."""
@@ -24,6 +24,8 @@ class ConfigLoader:
 
     Supports:
     - Environment variable substitution (${VAR_NAME})
+    - Multiple candidate URLs per server (``urls``), normalized so ``url``
+      is always the first candidate
     - Configuration validation
     - Server and settings access methods
     - Default server selection
@@ -37,8 +39,8 @@ class ConfigLoader:
     # Pattern to match environment variable references: ${VAR_NAME}
     ENV_VAR_PATTERN = re.compile(r"\$\{([^}]+)\}")
 
-    # Required fields for server entries
-    REQUIRED_SERVER_FIELDS = {"name", "url", "token"}
+    # Required fields for server entries (plus at least one of "url" / "urls")
+    REQUIRED_SERVER_FIELDS = {"name", "token"}
 
     def __init__(self, config_path: Path) -> None:
         """
@@ -94,14 +96,16 @@ class ConfigLoader:
 
             # Validate required fields
             missing_fields = self.REQUIRED_SERVER_FIELDS - set(server.keys())
+            if "url" not in server and "urls" not in server:
+                missing_fields.add("url")
             if missing_fields:
                 raise ConfigurationError(
                     f"Server '{server.get('name', f'entry {idx}')}' is missing required "
-                    f"fields: {', '.join(missing_fields)}"
+                    f"fields: {', '.join(sorted(missing_fields))}"
                 )
 
             # Substitute environment variables in the entire server config
-            processed_server = self._substitute_env_vars(server)
+            processed_server = self._normalize_urls(self._substitute_env_vars(server), idx)
             self._servers.append(processed_server)
 
         # Update config with processed servers
@@ -112,6 +116,32 @@ class ConfigLoader:
 
         return self._config
 
+    @staticmethod
+    def _normalize_urls(server: dict[str, Any], idx: int) -> dict[str, Any]:
+        """
+        Merge ``url`` and ``urls`` into one ordered, de-duplicated candidate list.
+
+        ``url`` (when given) is the first candidate; afterwards ``url`` is always
+        set to the first candidate so single-URL callers keep working.
+
+        Raises:
+            ConfigurationError: If ``urls`` is not a non-empty list of strings
+        """
+        urls = server.get("urls")
+        if urls is None:
+            return server
+
+        label = server.get("name", f"entry {idx}")
+        if not isinstance(urls, list) or not all(isinstance(u, str) and u for u in urls):
+            raise ConfigurationError(f"Server '{label}' field 'urls' must be a list of URLs")
+
+        candidates = ([server["url"]] if server.get("url") else []) + urls
+        candidates = list(dict.fromkeys(candidates))
+        if not candidates:
+            raise ConfigurationError(f"Server '{label}' must define at least one URL")
+
+        return {**server, "url": candidates[0], "urls": candidates}
+
     def _substitute_env_vars(self, data: Any) -> Any:
         """
         Recursively substitute environment variables in configuration data.
@@ -26,22 +26,62 @@ class PerformanceConfig:
     DEFAULT_WORKER_THREADS = 4
     DEFAULT_CACHE_TTL = 60  # seconds
     DEFAULT_CACHE_SIZE = 1000  # max entries
+    DEFAULT_CACHE_MAX_BYTES = 64 * 1024 * 1024  # estimated bytes held by the cache
+    DEFAULT_CACHE_SHARDS = 8  # independently locked segments in ShardedCacheService
     DEFAULT_CONNECTION_TIMEOUT = 30  # seconds
     DEFAULT_REFRESH_INTERVAL = 5  # seconds
-    DEFAULT_POOL_MAX_SIZE = 10  # connections
+    DEFAULT_REFRESH_MAX_INTERVAL = 60  # seconds an unchanged server's polling backs off to
+    DEFAULT_REFRESH_BACKOFF = 2.0  # polling interval multiplier per unchanged poll
+    DEFAULT_REFRESH_JITTER = 0.2  # +/- fraction of the interval added to each next-due time
+    DEFAULT_LIVE_SESSIONS = True  # patch the sessions panel from Plex "playing" alerts
+    DEFAULT_REFRESH_DEADLINE = 1.5  # seconds a dashboard tick waits before showing stale data
+    DEFAULT_POOL_MAX_SIZE = 10  # keep-alive sockets per server
+    DEFAULT_MAX_CONNECTED_SERVERS = 8  # servers kept connected at once (0 = unlimited)
+    DEFAULT_POOL_IDLE_TIMEOUT = 900  # seconds (15 minutes) before idle connections close
+    DEFAULT_HEALTH_CHECK_INTERVAL = 15  # seconds between background /identity probes
+    DEFAULT_HEALTH_PROBE_TIMEOUT = 5  # seconds before a probe counts as failed
     DEFAULT_MAX_RETRIES = 3
+    DEFAULT_RETRY_BASE_DELAY = 0.5  # seconds, first backoff step
+    DEFAULT_RETRY_MAX_DELAY = 5.0  # seconds, backoff cap
+    DEFAULT_CIRCUIT_FAILURE_THRESHOLD = 3  # consecutive failures before a circuit opens
+    DEFAULT_CIRCUIT_RECOVERY_TIMEOUT = 30  # seconds an open circuit fails fast
+    DEFAULT_COALESCE_REQUESTS = True  # identical concurrent GETs share one response
+    DEFAULT_HEDGE_REQUESTS = False  # duplicate slow GETs on a second connection
+    DEFAULT_HEDGE_PERCENTILE = 95  # hedge once a GET is slower than this latency percentile
+    DEFAULT_HEDGE_MAX_EXTRA_RATIO = 0.1  # at most ~10% extra requests from hedging
+    DEFAULT_HEDGE_MIN_SAMPLES = 20  # latencies needed per endpoint before hedging it
     DEFAULT_MEMORY_CLEANUP_INTERVAL = 300  # seconds (5 minutes)
+    DEFAULT_DISK_CACHE = True  # persist last-known state next to servers.yaml for warm starts
+    DISK_CACHE_FILENAME = "cache.sqlite3"
+    DISK_CACHE_DEFAULT_TTL = 24 * 3600  # seconds, for namespaces without their own TTL
+    DEFAULT_ALERT_LISTENER = True  # drop cached data on Plex alerts (needs websocket-client)
+    DEFAULT_CACHE_DAEMON_SOCKET = None  # Unix socket of a shared cache daemon (None = off)
+    CACHE_DAEMON_SOCKET_NAME = "cache.sock"  # daemon's default socket, next to servers.yaml
 
     # Cache-specific defaults
     SERVER_INFO_CACHE_TTL = 120  # 2 minutes - server info changes infrequently
     LIBRARY_LIST_CACHE_TTL = 300  # 5 minutes - library lists change infrequently
     SESSION_LIST_CACHE_TTL = 10  # 10 seconds - sessions change frequently
+    HISTORY_CACHE_TTL = 60  # 1 minute - play history only grows as items finish
     DEMO_CODE_CACHE_TTL = 3600  # 1 hour - code examples never change
 
+    # TTLs while a server's alert listener is live: changes arrive as invalidations
+    SESSION_LIST_ALERT_TTL = 300  # 5 minutes
+    LIBRARY_LIST_ALERT_TTL = 6 * 3600  # 6 hours
+    HISTORY_ALERT_TTL = 1800  # 30 minutes
+
+    # Disk-tier TTLs: how old last-known state may be and still paint a warm start
+    SERVER_STATUS_DISK_TTL = 24 * 3600  # 1 day
+
     # Worker pool defaults
     GALLERY_DEMO_WORKER_THREADS = 2  # Separate pool for demo execution
     DASHBOARD_REFRESH_WORKER_THREADS = 1  # Single thread for dashboard refreshes
 
+    # Seconds between checks for servers whose refresh is due
+    REFRESH_SCHEDULER_TICK = 1
+    # Seconds between local repaints of playing sessions' extrapolated progress (no fetch)
+    PROGRESS_RENDER_INTERVAL = 1
+
     @staticmethod
     def get_defaults() -> dict[str, Any]:
         """
@@ -54,18 +94,52 @@ class PerformanceConfig:
             "worker_threads": PerformanceConfig.DEFAULT_WORKER_THREADS,
             "cache_ttl": PerformanceConfig.DEFAULT_CACHE_TTL,
             "cache_size": PerformanceConfig.DEFAULT_CACHE_SIZE,
+            "cache_max_bytes": PerformanceConfig.DEFAULT_CACHE_MAX_BYTES,
+            "cache_shards": PerformanceConfig.DEFAULT_CACHE_SHARDS,
             "connection_timeout": PerformanceConfig.DEFAULT_CONNECTION_TIMEOUT,
             "refresh_interval": PerformanceConfig.DEFAULT_REFRESH_INTERVAL,
+            "refresh_max_interval": PerformanceConfig.DEFAULT_REFRESH_MAX_INTERVAL,
+            "refresh_backoff": PerformanceConfig.DEFAULT_REFRESH_BACKOFF,
+            "refresh_jitter": PerformanceConfig.DEFAULT_REFRESH_JITTER,
+            "live_sessions": PerformanceConfig.DEFAULT_LIVE_SESSIONS,
+            "refresh_deadline": PerformanceConfig.DEFAULT_REFRESH_DEADLINE,
             "pool_max_size": PerformanceConfig.DEFAULT_POOL_MAX_SIZE,
+            "max_connected_servers": PerformanceConfig.DEFAULT_MAX_CONNECTED_SERVERS,
+            "pool_idle_timeout": PerformanceConfig.DEFAULT_POOL_IDLE_TIMEOUT,
+            "health_check_interval": PerformanceConfig.DEFAULT_HEALTH_CHECK_INTERVAL,
+            "health_probe_timeout": PerformanceConfig.DEFAULT_HEALTH_PROBE_TIMEOUT,
             "max_retries": PerformanceConfig.DEFAULT_MAX_RETRIES,
+            "retry_base_delay": PerformanceConfig.DEFAULT_RETRY_BASE_DELAY,
+            "retry_max_delay": PerformanceConfig.DEFAULT_RETRY_MAX_DELAY,
+            "circuit_failure_threshold": PerformanceConfig.DEFAULT_CIRCUIT_FAILURE_THRESHOLD,
+            "circuit_recovery_timeout": PerformanceConfig.DEFAULT_CIRCUIT_RECOVERY_TIMEOUT,
+            "coalesce_requests": PerformanceConfig.DEFAULT_COALESCE_REQUESTS,
+            "hedge_requests": PerformanceConfig.DEFAULT_HEDGE_REQUESTS,
+            "hedge_percentile": PerformanceConfig.DEFAULT_HEDGE_PERCENTILE,
+            "hedge_max_extra_ratio": PerformanceConfig.DEFAULT_HEDGE_MAX_EXTRA_RATIO,
+            "hedge_min_samples": PerformanceConfig.DEFAULT_HEDGE_MIN_SAMPLES,
             "memory_cleanup_interval": PerformanceConfig.DEFAULT_MEMORY_CLEANUP_INTERVAL,
+            "disk_cache": PerformanceConfig.DEFAULT_DISK_CACHE,
+            "alert_listener": PerformanceConfig.DEFAULT_ALERT_LISTENER,
+            "cache_daemon_socket": PerformanceConfig.DEFAULT_CACHE_DAEMON_SOCKET,
             # Cache-specific TTLs
             "cache_ttls": {
                 "server_info": PerformanceConfig.SERVER_INFO_CACHE_TTL,
                 "library_list": PerformanceConfig.LIBRARY_LIST_CACHE_TTL,
                 "sessions": PerformanceConfig.SESSION_LIST_CACHE_TTL,
+                "history": PerformanceConfig.HISTORY_CACHE_TTL,
                 "demo_code": PerformanceConfig.DEMO_CODE_CACHE_TTL,
             },
+            # Cache TTLs used instead while a server's alerts are being received
+            "alert_cache_ttls": {
+                "sessions": PerformanceConfig.SESSION_LIST_ALERT_TTL,
+                "library_list": PerformanceConfig.LIBRARY_LIST_ALERT_TTL,
+                "history": PerformanceConfig.HISTORY_ALERT_TTL,
+            },
+            # Disk-tier TTLs per namespace
+            "disk_cache_ttls": {
+                "server_status": PerformanceConfig.SERVER_STATUS_DISK_TTL,
+            },
             # Worker pool sizes
             "worker_pools": {
                 "gallery_demo": PerformanceConfig.GALLERY_DEMO_WORKER_THREADS,
@@ -132,6 +206,8 @@ class PerformanceConfig:
             errors.append("cache_size must be at least 10 entries")
         if settings.get("cache_size", 0) > 10000:
             errors.append("cache_size should not exceed 10000 entries")
+        if settings.get("cache_max_bytes", 1024 * 1024) < 1024 * 1024:
+            errors.append("cache_max_bytes must be at least 1 MB")
 
         # Validate connection settings
         if settings.get("connection_timeout", 0) < 5:
@@ -144,5 +220,9 @@ class PerformanceConfig:
             errors.append("refresh_interval must be at least 1 second")
         if settings.get("refresh_interval", 0) > 60:
             errors.append("refresh_interval should not exceed 60 seconds")
+        if settings.get("refresh_max_interval", 60) < settings.get("refresh_interval", 0):
+            errors.append("refresh_max_interval must not be below refresh_interval")
+        if settings.get("refresh_backoff", 1) < 1:
+            errors.append("refresh_backoff must be at least 1")
 
         return errors
@@ -12,6 +12,8 @@ from typing import TYPE_CHECKING, Any
 if TYPE_CHECKING:
     from plexapi.server import PlexServer
 
+    from plexiglass.services.plex_data_service import PlexDataService
+
 
 class BaseDemo(ABC):
     """
@@ -25,6 +27,10 @@ class BaseDemo(ABC):
 
     Each demo must implement:
     - execute(server, params): Execute the demo and return results
+
+    Demos read sessions, sections and history through fetch_sessions(),
+    fetch_sections() and fetch_history(), which use the shared
+    PlexDataService when the gallery has set ``data_service``.
     """
 
     # Required class attributes (must be defined by subclasses)
@@ -33,6 +39,9 @@ class BaseDemo(ABC):
     category: str
     operation_type: str
 
+    # Shared cached reads; None means demos query the server directly
+    data_service: PlexDataService | None = None
+
     @abstractmethod
     def execute(self, server: PlexServer | None, params: dict[str, Any]) -> dict[str, Any]:
         """
@@ -46,6 +55,24 @@ class BaseDemo(ABC):
             Dictionary containing demo results
         """
 
+    def fetch_sessions(self, server: PlexServer) -> list[Any]:
+        """Get active sessions, from the shared data service when available."""
+        if self.data_service is not None:
+            return self.data_service.sessions(server)
+        return list(server.sessions())
+
+    def fetch_sections(self, server: PlexServer) -> list[Any]:
+        """Get library sections, from the shared data service when available."""
+        if self.data_service is not None:
+            return self.data_service.sections(server)
+        return list(server.library.sections())
+
+    def fetch_history(self, server: PlexServer, maxresults: int = 10) -> list[Any]:
+        """Get recent play history, from the shared data service when available."""
+        if self.data_service is not None:
+            return self.data_service.history(server, maxresults)
+        return list(server.history(maxresults=maxresults))
+
     def get_code_example(self, params: dict[str, Any] | None = None) -> str:
         """
         Get the code example for this demo.
@@ -80,7 +80,7 @@ for session in sessions:
 
         try:
             # Get current sessions as a proxy for activity
-            sessions = server.sessions()
+            sessions = self.fetch_sessions(server)
 
             # Format activity info
             activities = []
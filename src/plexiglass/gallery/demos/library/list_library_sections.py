@@ -32,7 +32,7 @@ for section in sections:
             return {"error": "No server connection available"}
 
         sections = []
-        for section in list(server.library.sections()):
+        for section in self.fetch_sections(server):
             sections.append(
                 {
                     "title": getattr(section, "title", "Unknown"),
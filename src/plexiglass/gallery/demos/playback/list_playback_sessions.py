@@ -33,7 +33,7 @@ for session in sessions:
             return {"error": "No server connection available"}
 
         sessions = []
-        for session in list(server.sessions()):
+        for session in self.fetch_sessions(server):
             player = None
             players = getattr(session, "players", None)
             if players:
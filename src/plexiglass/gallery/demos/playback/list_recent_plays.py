@@ -55,7 +55,7 @@ entries = server.history(maxresults="""
             limit_value = 10
 
         plays = []
-        for entry in list(server.history(maxresults=limit_value)):
+        for entry in self.fetch_history(server, limit_value):
             viewed_at = getattr(entry, "viewedAt", None)
             timestamp = None
             if viewed_at:
@@ -32,7 +32,7 @@ for section in sections:
             return {"error": "No server connection available"}
 
         libraries = []
-        for section in list(server.library.sections()):
+        for section in self.fetch_sections(server):
             libraries.append(
                 {
                     "title": getattr(section, "title", "Unknown"),
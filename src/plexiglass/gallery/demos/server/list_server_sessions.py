@@ -32,7 +32,7 @@ for session in sessions:
             return {"error": "No server connection available"}
 
         sessions = []
-        for session in list(server.sessions()):
+        for session in self.fetch_sessions(server):
             sessions.append(
                 {
                     "title": getattr(session, "title", "Unknown"),
@@ -2,6 +2,7 @@
 Data models for PlexiGlass.
 """
 
+from plexiglass.models.dashboard_snapshot import DashboardSnapshot
 from plexiglass.models.undo_stack import UndoSnapshot, UndoStack
 
-__all__ = ["UndoSnapshot", "UndoStack"]
+__all__ = ["DashboardSnapshot", "UndoSnapshot", "UndoStack"]
@@ -0,0 +1,255 @@
+"""
+Dashboard snapshot model for PlexiGlass.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from plexiglass.services.server_manager import ServerManager
+
+# Playing sessions are extrapolated at most this far past their last observation.
+MAX_PROGRESS_EXTRAPOLATION = timedelta(minutes=10)
+
+
+@dataclass(frozen=True)
+class DashboardSnapshot:
+    """
+    Immutable point-in-time view of every configured server.
+
+    A snapshot is captured once per dashboard refresh tick and shared by the
+    summary, the sessions panel and the server cards, so each tick costs a
+    single status fetch per server.
+
+    Statuses may carry ``fetched_at`` (when the data was fetched) and
+    ``stale`` (True when a server missed the tick's deadline and its last
+    known data is shown instead).
+    """
+
+    captured_at: datetime
+    statuses: tuple[Mapping[str, Any], ...] = field(default_factory=tuple)
+
+    @classmethod
+    def capture(
+        cls,
+        server_manager: ServerManager | None,
+        last_known: Mapping[str, Mapping[str, Any]] | None = None,
+    ) -> DashboardSnapshot:
+        """
+        Fetch the status of every configured server exactly once.
+
+        Args:
+            server_manager: Manager to fetch from (None yields an empty snapshot)
+            last_known: Previously fetched statuses by server name (e.g. from the
+                disk cache); these are used, flagged stale, instead of fetching
+        """
+        statuses: list[dict[str, Any]] = []
+        if server_manager is not None:
+            for name in server_manager.get_all_server_names():
+                known = (last_known or {}).get(name)
+                if known is not None:
+                    statuses.append({**known, "name": name, "stale": True})
+                else:
+                    statuses.append(server_manager.get_server_status(name))
+        return cls.from_statuses(statuses)
+
+    @classmethod
+    def from_statuses(
+        cls, statuses: list[dict[str, Any]], captured_at: datetime | None = None
+    ) -> DashboardSnapshot:
+        """Build a snapshot from already-fetched status dictionaries."""
+        frozen = tuple(MappingProxyType(dict(status)) for status in statuses)
+        return cls(captured_at=captured_at or datetime.now(), statuses=frozen)
+
+    @property
+    def server_names(self) -> list[str]:
+        return [str(status.get("name", "")) for status in self.statuses]
+
+    @property
+    def stale_servers(self) -> list[str]:
+        """Names of servers rendered from last known data this tick."""
+        return [str(status.get("name", "")) for status in self.statuses if status.get("stale")]
+
+    def status_for(self, name: str) -> dict[str, Any]:
+        """Return a mutable copy of the named server's status (empty if unknown)."""
+        for status in self.statuses:
+            if status.get("name") == name:
+                return dict(status)
+        return {"name": name, "connected": False, "session_count": 0, "now_playing": []}
+
+    @property
+    def summary(self) -> dict[str, Any]:
+        """Aggregate counts across all servers."""
+        connected = 0
+        sessions = 0
+        libraries = 0
+        library_items = 0
+        for status in self.statuses:
+            if status.get("connected"):
+                connected += 1
+            sessions += int(status.get("session_count", 0))
+            libraries += int(status.get("library_count", 0))
+            library_items += int(status.get("library_items", 0))
+
+        return {
+            "total_servers": len(self.statuses),
+            "connected_servers": connected,
+            "active_sessions": sessions,
+            "total_libraries": libraries,
+            "total_library_items": library_items,
+        }
+
+    @property
+    def sessions(self) -> list[dict[str, Any]]:
+        """Flattened now-playing entries tagged with their server name."""
+        entries: list[dict[str, Any]] = []
+        for status in self.statuses:
+            name = status.get("name", "Unknown")
+            for entry in status.get("now_playing", []):
+                session_entry = dict(entry)
+                session_entry["server"] = name
+                if status.get("stale"):
+                    session_entry["stale"] = True
+                    session_entry["fetched_at"] = status.get("fetched_at")
+                entries.append(session_entry)
+        return entries
+
+    def session_keys(self, name: str) -> set[str]:
+        """Session keys of the named server's now-playing entries."""
+        return {
+            str(entry["session_key"])
+            for entry in self.status_for(name).get("now_playing", [])
+            if entry.get("session_key") is not None
+        }
+
+    def with_play_states(
+        self, play_states: Mapping[str, Mapping[str, Mapping[str, Any]]]
+    ) -> DashboardSnapshot:
+        """
+        Return a copy with now-playing entries patched from alert play states.
+
+        Args:
+            play_states: Server name -> session key -> ``{"state", "view_offset",
+                "observed_at"}`` as last reported by the server's alert listener
+
+        Returns:
+            Snapshot (same capture time) whose matching entries carry the
+            reported state, view offset, observation time and recomputed
+            progress, where the play state was observed after the entry was
+        """
+        if not play_states:
+            return self
+        statuses: list[dict[str, Any]] = []
+        for status in self.statuses:
+            patched = dict(status)
+            states = play_states.get(str(status.get("name", "")))
+            if states:
+                patched["now_playing"] = [
+                    _apply_play_state(entry, states.get(str(entry.get("session_key"))))
+                    for entry in status.get("now_playing", [])
+                ]
+            statuses.append(patched)
+        return self.from_statuses(statuses, captured_at=self.captured_at)
+
+    def current_play_states(
+        self, play_states: Mapping[str, Mapping[str, Mapping[str, Any]]]
+    ) -> dict[str, dict[str, Mapping[str, Any]]]:
+        """
+        Drop play states this snapshot has caught up with.
+
+        Args:
+            play_states: Server name -> session key -> play state (see
+                with_play_states)
+
+        Returns:
+            The play states of sessions still in the snapshot that were
+            observed after the snapshot's entry for them
+        """
+        current: dict[str, dict[str, Mapping[str, Any]]] = {}
+        for name, states in play_states.items():
+            entries = {
+                str(entry["session_key"]): entry
+                for entry in self.status_for(name).get("now_playing", [])
+                if entry.get("session_key") is not None
+            }
+            kept = {
+                key: state
+                for key, state in states.items()
+                if key in entries and _is_newer(state, entries[key])
+            }
+            if kept:
+                current[name] = kept
+        return current
+
+
+def _is_newer(play_state: Mapping[str, Any], entry: Mapping[str, Any]) -> bool:
+    """True if an alert play state was observed after the polled entry."""
+    polled_at = entry.get("observed_at")
+    if not isinstance(polled_at, datetime):
+        return True
+    observed_at = play_state.get("observed_at")
+    return isinstance(observed_at, datetime) and observed_at > polled_at
+
+
+def _apply_play_state(
+    entry: Mapping[str, Any], play_state: Mapping[str, Any] | None
+) -> dict[str, Any]:
+    patched = dict(entry)
+    if play_state is None or not _is_newer(play_state, entry):
+        return patched
+    if play_state.get("state"):
+        patched["state"] = play_state["state"]
+    if play_state.get("observed_at") is not None:
+        patched["observed_at"] = play_state["observed_at"]
+    view_offset = play_state.get("view_offset")
+    if view_offset is not None:
+        patched["view_offset"] = view_offset
+        duration = entry.get("duration")
+        if duration:
+            progress = int(float(view_offset) / float(duration) * 100)
+            patched["progress_percent"] = max(0, min(progress, 100))
+    return patched
+
+
+def extrapolate_progress(entry: Mapping[str, Any], now: datetime | None = None) -> int | None:
+    """
+    Progress percent of a now-playing entry as of ``now``.
+
+    A playing session advances from the ``view_offset`` observed at
+    ``observed_at``; polls and alerts only re-anchor it, and it stops
+    advancing MAX_PROGRESS_EXTRAPOLATION after the anchor. Paused, stale or
+    unanchored entries keep their reported ``progress_percent``.
+    """
+    reported = entry.get("progress_percent")
+    observed_at = entry.get("observed_at")
+    view_offset = entry.get("view_offset")
+    duration = entry.get("duration")
+    if entry.get("state") != "playing" or entry.get("stale") or not duration:
+        return reported
+    if not isinstance(observed_at, datetime) or view_offset is None:
+        return reported
+    elapsed = (now or datetime.now()) - observed_at
+    elapsed = max(timedelta(0), min(elapsed, MAX_PROGRESS_EXTRAPOLATION))
+    try:
+        position = float(view_offset) + elapsed.total_seconds() * 1000.0
+        progress = int(position / float(duration) * 100)
+    except (TypeError, ValueError, ZeroDivisionError):
+        return reported
+    return max(0, min(progress, 100))
+
+
+def format_age(fetched_at: datetime | None, now: datetime | None = None) -> str:
+    """Format how long ago data was fetched ("12s", "4m", "2h"); "-" if never."""
+    if fetched_at is None:
+        return "-"
+    seconds = max(0, int(((now or datetime.now()) - fetched_at).total_seconds()))
+    if seconds < 60:
+        return f"{seconds}s"
+    if seconds < 3600:
+        return f"{seconds // 60}m"
+    return f"{seconds // 3600}h"
@@ -8,18 +8,25 @@ This module provides service-level functionality including:
 - Service-level error handling
 """
 
-from plexiglass.services.cache_service import CacheService
+from plexiglass.services.cache_service import CacheKey, CacheService
+from plexiglass.services.disk_cache import DiskCache
 from plexiglass.services.exceptions import (
     ConnectionError,
     ServerNotFoundError,
     ServiceError,
 )
+from plexiglass.services.plex_data_service import PlexDataService
 from plexiglass.services.server_manager import ServerManager
+from plexiglass.services.sharded_cache_service import ShardedCacheService
 from plexiglass.services.undo_service import UndoService
 
 __all__ = [
+    "CacheKey",
     "CacheService",
+    "DiskCache",
+    "PlexDataService",
     "ServerManager",
+    "ShardedCacheService",
     "UndoService",
     "ServiceError",
     "ConnectionError",
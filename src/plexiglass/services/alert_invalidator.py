@@ -0,0 +1,315 @@
+"""
+Alert-driven Cache Invalidation for PlexiGlass.
+
+Plex pushes notifications over a websocket (plexapi's
+``PlexServer.startAlertListener``). Listening to them lets cached data be
+dropped the moment it changes instead of when its TTL runs out, so servers
+with a live listener can use much longer TTLs (``alert_cache_ttls``).
+
+Requires the optional ``websocket-client`` package; without it nothing is
+started and caching stays TTL-only.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import threading
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from plexapi.server import PlexServer
+
+    from plexiglass.services.plex_data_service import PlexDataService
+
+SessionListener = Callable[["PlexServer", list[dict[str, Any]] | None], None]
+
+# Timeline states for library items: 5 = processed, 9 = deleted (0-4 are progress).
+TIMELINE_DONE_STATES = {5, 9}
+
+
+class _Watch:
+    __slots__ = ("server", "listener")
+
+    def __init__(self, server: PlexServer) -> None:
+        self.server = server
+        self.listener: Any = None
+
+
+class AlertInvalidator:
+    """
+    Maps Plex alert notifications to targeted PlexDataService invalidations.
+
+    Features:
+    - One alert listener per connected server (keyed like the data cache,
+      so a failover connection keeps its listener)
+    - ``playing``: a session starting, changing state or stopping drops the
+      server's sessions (and its history when something stops); progress-only
+      updates are ignored
+    - Session listeners receive every ``PlaySessionStateNotification``; while
+      any are subscribed, a known session changing state is left to them to
+      patch in place, so only sessions appearing or stopping cost a re-fetch
+    - ``timeline``: a library item finishing processing or being deleted drops
+      the section list (and with it library stats)
+    - ``activity``: a library scan/refresh ending drops the section list
+    - A listener that errors or dies drops everything cached for its server,
+      since events may have been missed, and session listeners are told
+      (``notes`` None) so they drop their patches
+
+    Example:
+        >>> alerts = AlertInvalidator(data_service)
+        >>> alerts.watch(server)
+        >>> alerts.is_live(server)
+        True
+    """
+
+    def __init__(self, data: PlexDataService, enabled: bool = True) -> None:
+        """
+        Initialize the invalidator.
+
+        Args:
+            data: Data service whose cache is invalidated
+            enabled: Start listeners (ignored if websocket-client is missing)
+        """
+        self.data = data
+        self.enabled = enabled and self.available()
+        self._lock = threading.Lock()
+        self._watches: dict[str, _Watch] = {}
+        # Last known state per session key, per server, to skip progress-only updates.
+        self._session_states: dict[str, dict[str, str]] = {}
+        self._session_listeners: list[SessionListener] = []
+        self._events = 0
+        self._invalidations = 0
+        self._listener_failures = 0
+
+    @staticmethod
+    def available() -> bool:
+        """True if websocket-client (needed by plexapi's AlertListener) is installed."""
+        return importlib.util.find_spec("websocket") is not None
+
+    def watch(self, server: PlexServer) -> bool:
+        """
+        Start listening to a server's alerts (no-op if already listening).
+
+        Args:
+            server: Connected PlexServer
+
+        Returns:
+            True if a listener is running for the server
+        """
+        if not self.enabled:
+            return False
+        key = self.data.server_key(server)
+        with self._lock:
+            current = self._watches.get(key)
+            if current is not None and current.listener is not None:
+                if current.listener.is_alive():
+                    current.server = server
+                    return True
+            watch = self._watches[key] = _Watch(server)
+        try:
+            watch.listener = server.startAlertListener(
+                callback=self._callback(key),
+                callbackError=self._error_callback(key),
+            )
+        except Exception:
+            # No alerts from this server; its data just falls back to TTLs.
+            with self._lock:
+                if self._watches.get(key) is watch:
+                    del self._watches[key]
+            return False
+        return True
+
+    def unwatch(self, server: PlexServer) -> None:
+        """
+        Stop listening to a server's alerts.
+
+        Args:
+            server: Server passed to watch()
+        """
+        key = self.data.server_key(server)
+        with self._lock:
+            watch = self._watches.pop(key, None)
+            self._session_states.pop(key, None)
+        if watch is not None:
+            self._stop(watch)
+
+    def unwatch_all(self) -> None:
+        """Stop every listener."""
+        with self._lock:
+            watches = list(self._watches.values())
+            self._watches.clear()
+            self._session_states.clear()
+        for watch in watches:
+            self._stop(watch)
+
+    def is_live(self, server: PlexServer) -> bool:
+        """
+        True if the server's alerts are being received.
+
+        A listener found dead is dropped and the server's cache cleared.
+        """
+        key = self.data.server_key(server)
+        with self._lock:
+            watch = self._watches.get(key)
+        if watch is None or watch.listener is None:
+            return False
+        if watch.listener.is_alive():
+            return True
+        self._lost(key)
+        return False
+
+    def add_session_listener(self, listener: SessionListener) -> None:
+        """
+        Subscribe to play state notifications.
+
+        Args:
+            listener: Called from the listener thread with the server and the
+                alert's PlaySessionStateNotification entries, or with None
+                once the server's listener is lost
+        """
+        with self._lock:
+            if listener not in self._session_listeners:
+                self._session_listeners.append(listener)
+
+    def remove_session_listener(self, listener: SessionListener) -> None:
+        """Unsubscribe a listener passed to add_session_listener()."""
+        with self._lock:
+            if listener in self._session_listeners:
+                self._session_listeners.remove(listener)
+
+    def handle_alert(self, server: PlexServer, data: dict[str, Any]) -> set[str]:
+        """
+        Apply one alert notification.
+
+        Args:
+            server: Server the alert came from
+            data: plexapi's NotificationContainer dictionary
+
+        Returns:
+            Resources invalidated ("sessions", "sections", "history")
+        """
+        key = self.data.server_key(server)
+        with self._lock:
+            self._events += 1
+            states = self._session_states.setdefault(key, {})
+            listeners = list(self._session_listeners)
+            resources = self._resources_for(data, states, live_sessions=bool(listeners))
+            if resources:
+                self._invalidations += 1
+        if resources:
+            self.data.invalidate(server, resources)
+        if listeners and data.get("type") == "playing":
+            self._notify(listeners, server, list(data.get("PlaySessionStateNotification") or []))
+        return resources
+
+    @staticmethod
+    def _notify(
+        listeners: list[SessionListener],
+        server: PlexServer,
+        notes: list[dict[str, Any]] | None,
+    ) -> None:
+        for listener in listeners:
+            try:
+                listener(server, notes)
+            except Exception:
+                # A failing subscriber must not break the alert thread.
+                pass
+
+    @staticmethod
+    def _resources_for(
+        data: dict[str, Any], session_states: dict[str, str], live_sessions: bool = False
+    ) -> set[str]:
+        kind = data.get("type")
+        resources: set[str] = set()
+        if kind == "playing":
+            for note in data.get("PlaySessionStateNotification") or []:
+                session_key = str(note.get("sessionKey", ""))
+                state = str(note.get("state", ""))
+                known = session_states.get(session_key)
+                if known == state:
+                    continue
+                if state == "stopped":
+                    session_states.pop(session_key, None)
+                    resources.update(("sessions", "history"))
+                    continue
+                session_states[session_key] = state
+                if known is None or not live_sessions:
+                    resources.add("sessions")
+        elif kind == "timeline":
+            for entry in data.get("TimelineEntry") or []:
+                try:
+                    state = int(entry.get("state", -1))
+                except (TypeError, ValueError):
+                    continue
+                if state in TIMELINE_DONE_STATES:
+                    resources.add("sections")
+        elif kind == "activity":
+            for note in data.get("ActivityNotification") or []:
+                activity = note.get("Activity") or {}
+                if note.get("event") == "ended" and str(activity.get("type", "")).startswith(
+                    "library."
+                ):
+                    resources.add("sections")
+        return resources
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get alert statistics.
+
+        Returns:
+            Dictionary with servers watched, alerts received, alerts that
+            invalidated something and listener failures
+        """
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "watched": len(self._watches),
+                "events": self._events,
+                "invalidations": self._invalidations,
+                "listener_failures": self._listener_failures,
+            }
+
+    def _callback(self, key: str) -> Callable[[dict[str, Any]], None]:
+        def on_alert(data: dict[str, Any]) -> None:
+            with self._lock:
+                watch = self._watches.get(key)
+            if watch is not None:
+                self.handle_alert(watch.server, data)
+
+        return on_alert
+
+    def _error_callback(self, key: str) -> Callable[[Exception], None]:
+        def on_error(error: Exception) -> None:
+            self._lost(key)
+
+        return on_error
+
+    def _lost(self, key: str) -> None:
+        """Forget a failed listener and drop what may have gone stale without it."""
+        with self._lock:
+            watch = self._watches.pop(key, None)
+            if watch is None:
+                return
+            self._session_states.pop(key, None)
+            self._listener_failures += 1
+            listeners = list(self._session_listeners)
+        self.data.invalidate(watch.server)
+        self._notify(listeners, watch.server, None)
+        self._stop(watch)
+
+    @staticmethod
+    def _stop(watch: _Watch) -> None:
+        listener = watch.listener
+        if listener is None:
+            return
+
+        def stop() -> None:
+            try:
+                listener.stop()
+            except Exception:
+                # Already closed, or never connected.
+                pass
+
+        # Closing waits for the server's close frame; don't hold up the caller.
+        threading.Thread(target=stop, name="plex-alerts-stop", daemon=True).start()
@@ -0,0 +1,384 @@
+"""
+Shared Cache Daemon for PlexiGlass.
+
+When several operators run PlexiGlass against the same servers, each TUI
+polling sessions and library sections multiplies the load on Plex. The cache
+daemon is a small local process that fetches each resource once per TTL and
+serves the result to every TUI over a Unix socket.
+
+Run it with::
+
+    python -m plexiglass.services.cache_daemon --config ~/.config/plexiglass/servers.yaml
+
+and point each TUI at the socket with ``performance.cache_daemon_socket``.
+
+Protocol: newline-delimited JSON. A request is
+``{"server": "<name>", "resource": "<resource>"}``; the reply is
+``{"ok": true, "value": ...}`` or ``{"ok": false, "error": "..."}``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import socket
+import socketserver
+import sys
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from plexiglass.config.performance import PerformanceConfig
+from plexiglass.services.cache_service import CacheKey, CacheService
+from plexiglass.services.exceptions import ConnectionError, ServiceError
+
+# Resources the daemon serves, and the cache_ttls entry that sets each TTL.
+RESOURCE_TTL_KEYS = {
+    "now_playing": "sessions",
+    "library_stats": "library_list",
+}
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Answers newline-delimited JSON requests until the client disconnects."""
+
+    server: _UnixServer
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            response = self.server.cache_daemon.handle_request(line)
+            try:
+                self.wfile.write(json.dumps(response, default=str).encode("utf-8") + b"\n")
+                self.wfile.flush()
+            except OSError:
+                # Client went away mid-reply.
+                return
+
+
+class _UnixServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+    # Every TUI refreshes on the same interval, so connections arrive in bursts.
+    request_queue_size = 128
+    cache_daemon: CacheDaemon
+
+
+class CacheDaemon:
+    """
+    Local cache/proxy process shared by every PlexiGlass instance on a host.
+
+    Features:
+    - One fetch per (server, resource) per TTL, however many clients ask;
+      concurrent misses for the same key wait for a single fetch
+    - Failures are cached briefly (``error_ttl``) so a struggling server
+      isn't hit once per client
+    - TTLs come from ``performance.cache_ttls`` (sessions, library_list)
+
+    Example:
+        >>> daemon = CacheDaemon.from_config(Path("~/.config/plexiglass/servers.yaml"))
+        >>> daemon.serve_forever()
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[str, str], Any],
+        socket_path: Path,
+        ttls: dict[str, float] | None = None,
+        error_ttl: float = 5.0,
+    ) -> None:
+        """
+        Initialize the daemon (call ``start`` or ``serve_forever`` to listen).
+
+        Args:
+            fetch: Blocking fetch of ``(server_name, resource)``; raises on failure
+            socket_path: Unix socket to listen on
+            ttls: Seconds each resource is served from cache
+            error_ttl: Seconds a failed fetch is reported without retrying
+        """
+        self._fetch = fetch
+        self.socket_path = Path(socket_path)
+        self.ttls = dict(ttls or {})
+        self.error_ttl = error_ttl
+        self.cache = CacheService(max_entries=None)
+        self._lock = threading.Lock()
+        self._flight_locks: dict[str, threading.Lock] = {}
+        self._server: _UnixServer | None = None
+        self._thread: threading.Thread | None = None
+        self._requests = 0
+        self._fetches = 0
+
+    @classmethod
+    def from_config(cls, config_path: Path, socket_path: Path | None = None) -> CacheDaemon:
+        """
+        Build a daemon that fetches through its own ServerManager.
+
+        Args:
+            config_path: ``servers.yaml`` shared with the TUIs
+            socket_path: Socket to listen on (default: ``performance.cache_daemon_socket``,
+                else ``cache.sock`` next to the config file)
+        """
+        from plexiglass.config.loader import ConfigLoader
+        from plexiglass.services.server_manager import ServerManager
+
+        loader = ConfigLoader(Path(config_path))
+        loader.load()
+        settings = loader.get_settings()
+        manager = ServerManager(loader)
+        cache_ttls = PerformanceConfig.get_optimized_settings(settings)["cache_ttls"]
+        configured = settings.get("performance", {}).get("cache_daemon_socket")
+        return cls(
+            fetch=manager.fetch_resource,
+            socket_path=Path(
+                socket_path
+                or configured
+                or Path(config_path).with_name(PerformanceConfig.CACHE_DAEMON_SOCKET_NAME)
+            ).expanduser(),
+            ttls={resource: cache_ttls[ttl_key] for resource, ttl_key in RESOURCE_TTL_KEYS.items()},
+        )
+
+    def get(self, server: str, resource: str) -> Any:
+        """
+        Get a resource, fetching it at most once per TTL.
+
+        Args:
+            server: Server name from the shared config
+            resource: One of RESOURCE_TTL_KEYS
+
+        Returns:
+            The resource value (JSON-serializable)
+
+        Raises:
+            ValueError: Unknown resource
+            Exception: The fetch's error (also cached for ``error_ttl``)
+        """
+        if resource not in RESOURCE_TTL_KEYS:
+            raise ValueError(f"Unknown resource '{resource}'")
+        key = str(CacheKey("daemon", server, resource))
+        with self._lock:
+            flight = self._flight_locks.setdefault(key, threading.Lock())
+        # Single flight: the first client fetches, the rest wait and then hit the cache.
+        with flight:
+            return self.cache.get_or_set(
+                key,
+                lambda: self._counted_fetch(server, resource),
+                ttl=self.ttls.get(resource, PerformanceConfig.DEFAULT_CACHE_TTL),
+                error_ttl=self.error_ttl,
+            )
+
+    def _counted_fetch(self, server: str, resource: str) -> Any:
+        with self._lock:
+            self._fetches += 1
+        return self._fetch(server, resource)
+
+    def handle_request(self, raw: bytes) -> dict[str, Any]:
+        """
+        Answer one protocol request.
+
+        Args:
+            raw: One JSON request line
+
+        Returns:
+            The reply object
+        """
+        with self._lock:
+            self._requests += 1
+        try:
+            request = json.loads(raw)
+            server, resource = str(request["server"]), str(request["resource"])
+        except (ValueError, KeyError, TypeError):
+            return {"ok": False, "error": "Malformed request"}
+        try:
+            value = self.get(server, resource)
+        except Exception as e:
+            return {"ok": False, "error": str(e) or type(e).__name__}
+        return {"ok": True, "value": value}
+
+    def start(self) -> None:
+        """Listen on the socket, serving from a background thread."""
+        self._bind()
+        assert self._server is not None
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="cache-daemon", daemon=True
+        )
+        self._thread.start()
+
+    def serve_forever(self) -> None:
+        """Listen on the socket and serve until interrupted."""
+        self._bind()
+        assert self._server is not None
+        try:
+            self._server.serve_forever()
+        finally:
+            self.shutdown()
+
+    def _bind(self) -> None:
+        path = self.socket_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.exists():
+            if CacheDaemonClient(path, timeout=0.5).is_available():
+                raise ServiceError(f"A cache daemon is already listening on {path}")
+            # Left behind by a daemon that didn't shut down cleanly.
+            path.unlink()
+        server = _UnixServer(str(path), _RequestHandler)
+        server.cache_daemon = self
+        self._server = server
+
+    def shutdown(self) -> None:
+        """Stop serving and remove the socket file."""
+        server, self._server = self._server, None
+        if server is None:
+            return
+        if self._thread is not None:
+            server.shutdown()
+            self._thread = None
+        server.server_close()
+        try:
+            self.socket_path.unlink()
+        except OSError:
+            # Already gone.
+            pass
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get daemon statistics.
+
+        Returns:
+            Dictionary with requests answered, upstream fetches and the cache's stats
+        """
+        with self._lock:
+            return {
+                "requests": self._requests,
+                "fetches": self._fetches,
+                "cache": self.cache.get_stats(),
+            }
+
+
+class CacheDaemonClient:
+    """
+    Client for a CacheDaemon, used by ServerManager in place of direct fetches.
+
+    Connecting and waiting for the reply have separate timeouts: failing to
+    connect means no daemon (callers fetch directly), while a slow reply
+    usually means the daemon is waiting on Plex for every client at once.
+
+    Example:
+        >>> client = CacheDaemonClient(Path("~/.config/plexiglass/cache.sock").expanduser())
+        >>> client.fetch("Home Server", "now_playing")
+        [{'title': 'Movie', 'user': 'alice', ...}]
+    """
+
+    def __init__(
+        self,
+        socket_path: Path,
+        timeout: float = 2.0,
+        read_timeout: float = PerformanceConfig.DEFAULT_CONNECTION_TIMEOUT,
+    ) -> None:
+        """
+        Initialize the client.
+
+        Args:
+            socket_path: The daemon's Unix socket
+            timeout: Seconds to wait for the daemon to accept the connection
+            read_timeout: Seconds to wait for a reply once connected; size it to
+                the daemon's fetch timeout, since a reply may wait on a fetch
+        """
+        self.socket_path = Path(socket_path).expanduser()
+        self.timeout = timeout
+        self.read_timeout = read_timeout
+
+    def fetch(self, server: str, resource: str) -> Any:
+        """
+        Get a resource from the daemon.
+
+        Args:
+            server: Server name
+            resource: Resource name (see RESOURCE_TTL_KEYS)
+
+        Returns:
+            The resource value
+
+        Raises:
+            ConnectionError: The daemon is not reachable (nothing accepted the connection)
+            ServiceError: The daemon answered with an error (e.g. the server is
+                down), didn't answer within ``read_timeout`` or sent a bad reply
+        """
+        request = json.dumps({"server": server, "resource": resource}).encode("utf-8") + b"\n"
+        try:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        except OSError as e:
+            raise ConnectionError(f"Cache daemon unavailable at {self.socket_path}: {e}") from e
+        with sock:
+            try:
+                sock.settimeout(self.timeout)
+                sock.connect(str(self.socket_path))
+            except OSError as e:
+                raise ConnectionError(f"Cache daemon unavailable at {self.socket_path}: {e}") from e
+            try:
+                sock.settimeout(self.read_timeout)
+                sock.sendall(request)
+                with sock.makefile("rb") as reader:
+                    line = reader.readline()
+            except OSError as e:
+                raise ServiceError(f"Cache daemon at {self.socket_path} did not answer: {e}") from e
+        if not line:
+            raise ServiceError(f"Cache daemon at {self.socket_path} closed the connection")
+        try:
+            response = json.loads(line)
+        except ValueError as e:
+            raise ServiceError(f"Bad reply from cache daemon: {e}") from e
+        if not response.get("ok"):
+            raise ServiceError(response.get("error") or "Cache daemon error")
+        return response.get("value")
+
+    def is_available(self) -> bool:
+        """True if something is accepting connections on the socket."""
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.settimeout(self.timeout)
+                sock.connect(str(self.socket_path))
+            return True
+        except OSError:
+            return False
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the cache daemon in the foreground."""
+    parser = argparse.ArgumentParser(description="Shared PlexiGlass cache daemon")
+    parser.add_argument(
+        "--config",
+        type=Path,
+        default=Path.home() / ".config" / "plexiglass" / "servers.yaml",
+        help="servers.yaml shared with the PlexiGlass TUIs",
+    )
+    parser.add_argument("--socket", type=Path, default=None, help="Unix socket to listen on")
+    args = parser.parse_args(argv)
+
+    try:
+        daemon = CacheDaemon.from_config(args.config.expanduser(), args.socket)
+    except Exception as e:
+        print(f"❌ Could not start cache daemon: {e}", file=sys.stderr)
+        return 1
+
+    print(f"PlexiGlass cache daemon listening on {daemon.socket_path}", file=sys.stderr)
+    started = time.monotonic()
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        stats = daemon.get_stats()
+        uptime = time.monotonic() - started
+        print(
+            f"\nServed {stats['requests']} requests with {stats['fetches']} fetches "
+            f"in {uptime:.0f}s.",
+            file=sys.stderr,
+        )
+    except ServiceError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
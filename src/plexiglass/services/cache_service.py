@@ -1,36 +1,157 @@
 """
 Cache Service for PlexiGlass.
 
-Provides request caching with TTL (Time-To-Live) support for improved performance.
+Provides request caching with TTL (Time-To-Live) support, a bounded
+least-recently-used entry count and an optional byte budget that shrinks
+under memory pressure.
 """
 
 import hashlib
+import heapq
+import itertools
 import json
+import re
 import threading
 import time
-from datetime import datetime, timedelta
-from typing import Any, Callable, Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Optional, Union
 from fnmatch import fnmatch
 
+from plexiglass.config.performance import PerformanceConfig
+from plexiglass.utils.memory_optimizer import MemoryOptimizer
 
-class CacheEntry:
-    """Represents a single cache entry with expiration."""
 
-    def __init__(self, value: Any, ttl: int):
+class _Missing:
+    """Type of the MISSING sentinel."""
+
+    def __repr__(self) -> str:
+        return "MISSING"
+
+    def __bool__(self) -> bool:
+        return False
+
+
+# Returned by ``get(key, default=MISSING)`` on a miss, so a cached None is distinguishable.
+MISSING: Any = _Missing()
+
+
+class _CachedFailure:
+    """A failed computation held in the cache for a short negative TTL."""
+
+    __slots__ = ("error",)
+
+    def __init__(self, error: Exception):
+        self.error = error
+
+
+class _Computation:
+    """Factory calls in flight for one key, and how often the key was invalidated meanwhile."""
+
+    __slots__ = ("calls", "generation", "tags")
+
+    def __init__(self, tags: frozenset[str]):
+        self.calls = 0
+        self.generation = 0
+        self.tags = tags
+
+
+@dataclass(frozen=True)
+class CacheKey:
+    """
+    Structured cache key: namespace, server, resource and request params.
+
+    Renders as ``namespace:server:resource[:params-hash]`` so prefix
+    invalidation follows the structure, and carries the tags
+    ``namespace:<ns>``, ``server:<name>`` and ``resource:<name>`` that
+    ``set()`` indexes automatically.
+
+    Example:
+        >>> key = CacheKey.build("plex", "Office", "library", section=3)
+        >>> cache.set(key, items, tags={"library:3"})
+        >>> cache.invalidate_tags({"server:Office"})
+    """
+
+    namespace: str
+    server: Optional[str] = None
+    resource: Optional[str] = None
+    params: tuple[tuple[str, Any], ...] = ()
+
+    @classmethod
+    def build(
+        cls,
+        namespace: str,
+        server: Optional[str] = None,
+        resource: Optional[str] = None,
+        **params: Any,
+    ) -> "CacheKey":
+        """Create a key, sorting ``params`` so argument order doesn't matter."""
+        return cls(namespace, server, resource, tuple(sorted(params.items())))
+
+    @property
+    def tags(self) -> frozenset[str]:
+        """Tags derived from the key's structure."""
+        tags = {f"namespace:{self.namespace}"}
+        if self.server is not None:
+            tags.add(f"server:{self.server}")
+        if self.resource is not None:
+            tags.add(f"resource:{self.resource}")
+        return frozenset(tags)
+
+    def __str__(self) -> str:
+        parts = [self.namespace]
+        if self.server is not None:
+            parts.append(self.server)
+        if self.resource is not None:
+            parts.append(self.resource)
+        if self.params:
+            parts.append(CacheService.make_key(*self.params)[:12])
+        return ":".join(parts)
+
+
+KeyLike = Union[str, CacheKey]
+
+
+class CacheEntry:
+    """Represents a single cache entry with expiration (monotonic clock)."""
+
+    __slots__ = ("value", "created_at", "fresh_until", "expires_at", "seq", "size")
+
+    def __init__(
+        self,
+        value: Any,
+        ttl: int,
+        now: Optional[float] = None,
+        seq: int = 0,
+        stale_ttl: float = 0,
+    ):
         """
         Initialize a cache entry.
 
         Args:
             value: The cached value
             ttl: Time-to-live in seconds
+            now: Current ``time.monotonic()`` reading (read once if not given)
+            seq: Insertion sequence number, used to match expiry-heap records
+            stale_ttl: Extra seconds past ``ttl`` the entry is kept as stale
         """
+        created_at = time.monotonic() if now is None else now
         self.value = value
-        self.expiry = datetime.now() + timedelta(seconds=ttl)
-        self.created_at = datetime.now()
-
-    def is_expired(self) -> bool:
+        self.created_at = created_at
+        self.fresh_until = created_at + ttl
+        self.expires_at = self.fresh_until + stale_ttl
+        self.seq = seq
+        # Estimated bytes retained; only measured when the cache has a byte budget.
+        self.size = 0
+
+    def is_expired(self, now: Optional[float] = None) -> bool:
         """Check if this cache entry has expired."""
-        return datetime.now() >= self.expiry
+        return (time.monotonic() if now is None else now) >= self.expires_at
+
+    def is_stale(self, now: Optional[float] = None) -> bool:
+        """Check if this entry is past its fresh TTL (but possibly not yet expired)."""
+        return (time.monotonic() if now is None else now) >= self.fresh_until
 
 
 class CacheService:
@@ -38,9 +159,25 @@ class CacheService:
     Thread-safe caching service with TTL support.
 
     Features:
-    - TTL-based expiration
+    - TTL-based expiration on the monotonic clock, tracked in a min-heap so
+      cleanup costs O(log n) per expired entry and size() is O(1) amortised
+    - Bounded size with O(1) least-recently-used eviction
+    - Optional byte budget over estimated entry sizes (stale-if-error copies
+      that outlived their entry included), halved when the process's current
+      RSS crosses MemoryOptimizer.WARNING_THRESHOLD (quartered past
+      CRITICAL_THRESHOLD); orphaned stale copies go first, then the largest
+      of the coldest entries
     - Thread-safe operations
-    - Hit/miss statistics
+    - Hit/miss/eviction statistics
+    - Cached None values (MISSING sentinel), negative caching of failures
+      and stale-if-error fallback in get_or_set
+    - Stale-while-revalidate: get_or_set(stale_ttl=...) serves a stale value
+      immediately and refreshes it once in the background
+    - A value computed across an invalidation of its key is returned but
+      not stored, so the invalidation isn't undone by a pre-change result
+    - Structured keys (CacheKey) and tags, with keys grouped by their first
+      two segments (namespace:server) and a tag index, so prefix/tag
+      invalidation only touches matching entries and indexing a key is O(1)
     - Pattern-based invalidation
     - Key generation helpers
 
@@ -52,58 +189,345 @@ class CacheService:
         {'name': 'John'}
     """
 
-    def __init__(self, default_ttl: int = 60):
+    # Seconds between memory-pressure checks (get_current_rss reads /proc).
+    PRESSURE_CHECK_INTERVAL = 5.0
+    # Coldest entries considered per byte-budget eviction; the largest goes.
+    EVICTION_SAMPLE = 8
+
+    def __init__(
+        self,
+        default_ttl: int = 60,
+        max_entries: Optional[int] = PerformanceConfig.DEFAULT_CACHE_SIZE,
+        refresh_workers: int = 2,
+        max_bytes: Optional[int] = None,
+        sizer: Optional[Callable[[Any], int]] = None,
+        refresh_executor: Optional[ThreadPoolExecutor] = None,
+    ):
         """
         Initialize the cache service.
 
         Args:
             default_ttl: Default time-to-live in seconds (default: 60)
+            max_entries: Maximum number of entries before the least recently used
+                is evicted (None or 0 = unbounded)
+            refresh_workers: Threads used for stale-while-revalidate refreshes
+            max_bytes: Byte budget over estimated entry sizes (None or 0 = none)
+            sizer: Returns a value's size in bytes (default:
+                MemoryOptimizer.estimate_size)
+            refresh_executor: Pool to run refreshes on instead of a private
+                one of ``refresh_workers`` threads; shutdown() leaves it running
         """
         self.default_ttl = default_ttl
-        self._cache: dict[str, CacheEntry] = {}
+        self.max_entries = max_entries or None
+        self.max_bytes = max_bytes or None
+        self._sizer = sizer or MemoryOptimizer.estimate_size
+        self._bytes = 0
+        self._budget_factor = 1.0
+        self._pressure_checked_at: Optional[float] = None
+        # Ordered least- to most-recently used.
+        self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
+        # (expires_at, seq, key); records for replaced/removed entries are skipped lazily.
+        self._expiry_heap: list[tuple[float, int, str]] = []
+        self._seq = itertools.count()
         self._lock = threading.RLock()
+        # Last good values kept past expiry for stale-if-error:
+        # key -> (value, stale_until, size). Counted in _bytes once no live
+        # entry shares the value.
+        self._last_good: OrderedDict[str, tuple[Any, float, int]] = OrderedDict()
+        # Every key held in _cache or _last_good, by key group (see _key_group), plus tags.
+        self._key_groups: dict[str, set[str]] = {}
+        self._key_tags: dict[str, frozenset[str]] = {}
+        self._tag_index: dict[str, set[str]] = {}
         self._hits = 0
         self._misses = 0
+        self._evictions = 0
+        self._negative_hits = 0
+        self._stale_served = 0
+        self.refresh_workers = max(1, int(refresh_workers))
+        self._refresh_executor: Optional[ThreadPoolExecutor] = refresh_executor
+        self._owns_refresh_executor = refresh_executor is None
+        # Keys with a background refresh in flight (at most one per key).
+        self._refreshing: set[str] = set()
+        self._background_refreshes = 0
+        # Keys whose factory is running; invalidating one bumps its generation.
+        self._computing: dict[str, _Computation] = {}
+
+    @classmethod
+    def from_settings(cls, settings: Optional[dict[str, Any]]) -> "CacheService":
+        """
+        Build a cache sized from ``performance.cache_ttl``, ``cache_size`` and ``cache_max_bytes``.
 
-    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        Args:
+            settings: Application settings (as returned by ConfigLoader.get_settings)
+        """
+        optimized = PerformanceConfig.get_optimized_settings(settings)
+        return cls(
+            default_ttl=optimized["cache_ttl"],
+            max_entries=optimized["cache_size"],
+            max_bytes=optimized["cache_max_bytes"],
+        )
+
+    def set(
+        self,
+        key: KeyLike,
+        value: Any,
+        ttl: Optional[int] = None,
+        tags: Optional[Iterable[str]] = None,
+    ) -> None:
         """
         Set a value in the cache.
 
         Args:
-            key: Cache key
+            key: Cache key (a CacheKey also contributes its structural tags)
             value: Value to cache
             ttl: Optional custom TTL in seconds (uses default if not provided)
+            tags: Tags to invalidate the entry by (see invalidate_tags)
         """
+        key, tag_set = self._resolve(key, tags)
+        self._store(key, value, ttl if ttl is not None else self.default_ttl, tags=tag_set)
+
+    @staticmethod
+    def _resolve(key: KeyLike, tags: Optional[Iterable[str]] = None) -> tuple[str, frozenset[str]]:
+        """Normalize a key to its string form and merge in any structural tags."""
+        tag_set = frozenset(tags or ())
+        if isinstance(key, CacheKey):
+            return str(key), tag_set | key.tags
+        return key, tag_set
+
+    def _store(
+        self,
+        key: str,
+        value: Any,
+        ttl: float,
+        stale_ttl: float = 0,
+        tags: frozenset[str] = frozenset(),
+        generation: Optional[int] = None,
+    ) -> Optional[CacheEntry]:
+        entry = CacheEntry(value, ttl, seq=next(self._seq), stale_ttl=stale_ttl)
+        if self.max_bytes is not None:
+            # Measured outside the lock: walking a large value can take a while.
+            entry.size = self._measure(value)
         with self._lock:
-            ttl_to_use = ttl if ttl is not None else self.default_ttl
-            self._cache[key] = CacheEntry(value, ttl_to_use)
+            if generation is not None and not self._is_current(key, generation):
+                return None
+            self._bytes -= self._stale_only_size(key)
+            previous = self._cache.get(key)
+            if previous is not None:
+                self._bytes -= previous.size
+            self._cache[key] = entry
+            self._cache.move_to_end(key)
+            self._bytes += entry.size + self._stale_only_size(key)
+            self._index(key, tags)
+            heapq.heappush(self._expiry_heap, (entry.expires_at, entry.seq, key))
+            self._compact_expiry_heap()
+            if self.max_entries is not None:
+                while len(self._cache) > self.max_entries:
+                    self._drop_entry(next(iter(self._cache)))
+                    self._evictions += 1
+            if self.max_bytes is not None:
+                self._refresh_memory_pressure()
+                self._enforce_byte_budget()
+            return entry
+
+    def _measure(self, value: Any) -> int:
+        if isinstance(value, _CachedFailure):
+            return 0
+        try:
+            return max(0, int(self._sizer(value)))
+        except Exception:
+            # A sizer that can't handle a value shouldn't break caching it.
+            return 0
+
+    def _drop_entry(self, key: str) -> None:
+        """Remove a key's live entry and keep byte accounting and indexes in step (lock held)."""
+        self._bytes -= self._stale_only_size(key)
+        entry = self._cache.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
+        # A stale-if-error copy of the value now stands on its own.
+        self._bytes += self._stale_only_size(key)
+        self._unindex_if_unused(key)
+
+    def _stale_only_size(self, key: str) -> int:
+        """Bytes of ``key``'s stale-if-error copy not shared with its live entry (lock held)."""
+        record = self._last_good.get(key)
+        if record is None:
+            return 0
+        entry = self._cache.get(key)
+        if entry is not None and entry.value is record[0]:
+            return 0
+        return record[2]
+
+    def _drop_last_good(self, key: str) -> None:
+        """Forget ``key``'s stale-if-error copy and release its bytes (lock held)."""
+        self._bytes -= self._stale_only_size(key)
+        self._last_good.pop(key, None)
+        self._unindex_if_unused(key)
+
+    @property
+    def effective_max_bytes(self) -> Optional[int]:
+        """The byte budget after any memory-pressure shrink (None if unbounded)."""
+        if self.max_bytes is None:
+            return None
+        return int(self.max_bytes * self._budget_factor)
+
+    def _refresh_memory_pressure(self) -> None:
+        """Re-read process memory at most every PRESSURE_CHECK_INTERVAL seconds (lock held)."""
+        now = time.monotonic()
+        checked_at = self._pressure_checked_at
+        if checked_at is not None and now - checked_at < self.PRESSURE_CHECK_INTERVAL:
+            return
+        self._pressure_checked_at = now
+        try:
+            current = MemoryOptimizer.get_current_rss()
+        except Exception:
+            current = None
+        if current is None:
+            # Keep the last factor if memory can't be read.
+            return
+        if current >= MemoryOptimizer.CRITICAL_THRESHOLD:
+            self._budget_factor = 0.25
+        elif current >= MemoryOptimizer.WARNING_THRESHOLD:
+            self._budget_factor = 0.5
+        else:
+            self._budget_factor = 1.0
+
+    def _enforce_byte_budget(self) -> None:
+        """
+        Evict until within budget (lock held).
 
-    def get(self, key: str) -> Optional[Any]:
+        Stale-if-error copies whose entry is gone are dropped first, oldest
+        first; then the largest of the EVICTION_SAMPLE coldest entries, along
+        with its stale-if-error copy.
+        """
+        budget = self.effective_max_bytes
+        if budget is None:
+            return
+        if self._bytes > budget:
+            for key in [key for key in self._last_good if self._stale_only_size(key)]:
+                if self._bytes <= budget:
+                    break
+                self._drop_last_good(key)
+                self._evictions += 1
+        while self._bytes > budget and self._cache:
+            coldest = itertools.islice(self._cache.items(), self.EVICTION_SAMPLE)
+            victim = max(coldest, key=lambda item: item[1].size)[0]
+            self._remove(victim)
+            self._evictions += 1
+
+    def check_memory_pressure(self) -> Optional[int]:
+        """
+        Re-check process memory now and trim the cache to the resulting budget.
+
+        Returns:
+            The effective byte budget (None if the cache has none)
+        """
+        with self._lock:
+            if self.max_bytes is None:
+                return None
+            self._pressure_checked_at = None
+            self._refresh_memory_pressure()
+            self._enforce_byte_budget()
+            return self.effective_max_bytes
+
+    def _index(self, key: str, tags: frozenset[str]) -> None:
+        """Add a key to the key-group index and (re)tag it (lock held)."""
+        old_tags = self._key_tags.get(key)
+        if old_tags is None:
+            self._key_groups.setdefault(self._key_group(key), set()).add(key)
+            old_tags = frozenset()
+        for tag in old_tags - tags:
+            self._untag(tag, key)
+        for tag in tags - old_tags:
+            self._tag_index.setdefault(tag, set()).add(key)
+        self._key_tags[key] = tags
+
+    def _untag(self, tag: str, key: str) -> None:
+        keys = self._tag_index.get(tag)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._tag_index[tag]
+
+    def _unindex_if_unused(self, key: str) -> None:
+        """Drop a key from the indexes once neither _cache nor _last_good holds it (lock held)."""
+        if key in self._cache or key in self._last_good:
+            return
+        tags = self._key_tags.pop(key, None)
+        if tags is None:
+            return
+        for tag in tags:
+            self._untag(tag, key)
+        group = self._key_group(key)
+        keys = self._key_groups.get(group)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._key_groups[group]
+
+    def _remove(self, key: str) -> None:
+        """Remove a key, its stale-if-error value and its index records (lock held)."""
+        self._drop_last_good(key)
+        self._drop_entry(key)
+
+    @staticmethod
+    def _key_group(key: str) -> str:
+        """A key's first two ``:``-separated segments (``namespace:server`` for a CacheKey)."""
+        return ":".join(key.split(":", 2)[:2])
+
+    def _keys_with_prefix(self, prefix: str) -> list[str]:
+        """
+        Indexed keys starting with ``prefix`` (lock held).
+
+        A prefix spanning a whole group ("plex:<server>:...") only visits that
+        group's keys; a shorter one scans group names, not keys.
+        """
+        if prefix.count(":") >= 2:
+            groups = [self._key_group(prefix)]
+        else:
+            groups = [group for group in self._key_groups if group.startswith(prefix)]
+        return [
+            key
+            for group in groups
+            for key in self._key_groups.get(group, ())
+            if key.startswith(prefix)
+        ]
+
+    def _live_entry(self, key: str) -> Optional[CacheEntry]:
+        """Get the unexpired entry for a key, dropping it if expired (lock held)."""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        if entry.is_expired():
+            # Clean up expired entry
+            self._drop_entry(key)
+            return None
+        return entry
+
+    def get(self, key: KeyLike, default: Any = None) -> Any:
         """
         Get a value from the cache.
 
         Args:
             key: Cache key
+            default: Returned on a miss; pass ``MISSING`` to tell a miss apart
+                from a cached None
 
         Returns:
-            Cached value if exists and not expired, None otherwise
+            Cached value if exists and not expired, ``default`` otherwise
         """
+        key = str(key)
         with self._lock:
-            if key not in self._cache:
+            entry = self._live_entry(key)
+            if entry is None or isinstance(entry.value, _CachedFailure):
                 self._misses += 1
-                return None
-
-            entry = self._cache[key]
-            if entry.is_expired():
-                # Clean up expired entry
-                del self._cache[key]
-                self._misses += 1
-                return None
+                return default
 
+            self._cache.move_to_end(key)
             self._hits += 1
             return entry.value
 
-    def has(self, key: str) -> bool:
+    def has(self, key: KeyLike) -> bool:
         """
         Check if a key exists in the cache and is not expired.
 
@@ -113,40 +537,48 @@ class CacheService:
         Returns:
             True if key exists and not expired, False otherwise
         """
+        key = str(key)
         with self._lock:
-            if key not in self._cache:
-                return False
+            entry = self._live_entry(key)
+            return entry is not None and not isinstance(entry.value, _CachedFailure)
 
-            entry = self._cache[key]
-            if entry.is_expired():
-                # Clean up expired entry
-                del self._cache[key]
-                return False
-
-            return True
-
-    def delete(self, key: str) -> None:
+    def delete(self, key: KeyLike) -> None:
         """
         Delete a key from the cache.
 
         Args:
             key: Cache key to delete
         """
+        key = str(key)
         with self._lock:
-            if key in self._cache:
-                del self._cache[key]
+            self._remove(key)
+            self._invalidate_computations(lambda candidate, _: candidate == key)
 
     def clear(self) -> None:
         """Clear all entries from the cache."""
         with self._lock:
+            self._invalidate_computations(lambda _, __: True)
             self._cache.clear()
+            self._bytes = 0
+            self._expiry_heap.clear()
+            self._last_good.clear()
+            self._key_groups.clear()
+            self._key_tags.clear()
+            self._tag_index.clear()
             self._hits = 0
             self._misses = 0
+            self._evictions = 0
+            self._negative_hits = 0
+            self._stale_served = 0
+            self._background_refreshes = 0
 
     def size(self) -> int:
         """
         Get the number of valid (non-expired) entries in the cache.
 
+        O(1) unless entries have expired since the last call; each of those
+        costs O(log n) to remove.
+
         Returns:
             Number of cache entries
         """
@@ -164,26 +596,207 @@ class CacheService:
         """
         return self.size() == 0
 
-    def get_or_set(self, key: str, factory: Callable[[], Any], ttl: Optional[int] = None) -> Any:
+    def get_or_set(
+        self,
+        key: KeyLike,
+        factory: Callable[[], Any],
+        ttl: Optional[int] = None,
+        error_ttl: Optional[float] = None,
+        stale_if_error: Optional[float] = None,
+        stale_ttl: Optional[float] = None,
+        tags: Optional[Iterable[str]] = None,
+    ) -> Any:
         """
         Get a value from cache, or compute and cache it if not present.
 
+        A cached None is a hit like any other value. With ``stale_ttl``, a value
+        past its TTL but within ``stale_ttl`` more seconds is returned at once
+        and a single background refresh is scheduled for the key; only past the
+        stale window does the caller block on the factory.
+
         Args:
             key: Cache key
             factory: Function to compute value if not cached
             ttl: Optional custom TTL in seconds
+            error_ttl: Cache a factory failure for this many seconds; calls in that
+                window re-raise it without calling the factory again
+            stale_if_error: Keep the last good value this many seconds past its
+                expiry and serve it instead of raising while the factory fails
+            stale_ttl: Seconds past ``ttl`` the value is still served while it is
+                refreshed in the background
+            tags: Tags for the computed value (see set)
 
         Returns:
-            Cached or computed value
+            Cached, computed or (on failure) stale value
+
+        Raises:
+            The factory's exception when no stale value is available
         """
-        value = self.get(key)
-        if value is not None:
-            return value
+        key, tag_set = self._resolve(key, tags)
+        ttl_to_use = ttl if ttl is not None else self.default_ttl
+        with self._lock:
+            entry = self._live_entry(key)
+            if entry is not None and not isinstance(entry.value, _CachedFailure):
+                self._cache.move_to_end(key)
+                self._hits += 1
+                if entry.is_stale() and key not in self._refreshing:
+                    self._refreshing.add(key)
+                    self._schedule_refresh(
+                        key, factory, ttl_to_use, stale_ttl or 0, stale_if_error, tag_set
+                    )
+                return entry.value
+            failure = entry.value if entry is not None else None
+            if failure is not None:
+                self._negative_hits += 1
+            else:
+                self._misses += 1
+                generation = self._begin_computation(key, tag_set)
+
+        if failure is not None:
+            return self._stale_or_raise(key, failure.error)
 
         # Compute and cache
-        computed_value = factory()
-        self.set(key, computed_value, ttl)
-        return computed_value
+        try:
+            try:
+                computed_value = factory()
+            except Exception as e:
+                if error_ttl:
+                    self._store(
+                        key, _CachedFailure(e), error_ttl, tags=tag_set, generation=generation
+                    )
+                return self._stale_or_raise(key, e)
+
+            self._store_computed(
+                key, computed_value, ttl_to_use, stale_ttl or 0, stale_if_error, tag_set, generation
+            )
+            return computed_value
+        finally:
+            self._end_computation(key)
+
+    def _store_computed(
+        self,
+        key: str,
+        value: Any,
+        ttl: float,
+        stale_ttl: float,
+        stale_if_error: Optional[float],
+        tags: frozenset[str] = frozenset(),
+        generation: Optional[int] = None,
+    ) -> None:
+        entry = self._store(key, value, ttl, stale_ttl, tags, generation)
+        if entry is None:
+            return
+        if stale_if_error:
+            self._remember_last_good(key, value, entry.expires_at + stale_if_error, entry.size)
+
+    def _schedule_refresh(
+        self,
+        key: str,
+        factory: Callable[[], Any],
+        ttl: float,
+        stale_ttl: float,
+        stale_if_error: Optional[float],
+        tags: frozenset[str],
+    ) -> None:
+        """Submit a background refresh for ``key`` (lock held, key marked refreshing)."""
+        if self._refresh_executor is None:
+            self._refresh_executor = ThreadPoolExecutor(
+                max_workers=self.refresh_workers, thread_name_prefix="cache-refresh"
+            )
+        self._background_refreshes += 1
+        generation = self._begin_computation(key, tags)
+        try:
+            self._refresh_executor.submit(
+                self._refresh, key, factory, ttl, stale_ttl, stale_if_error, tags, generation
+            )
+        except RuntimeError:
+            # Executor shut down; the next blocking miss will recompute instead.
+            self._refreshing.discard(key)
+            self._end_computation(key)
+
+    def _refresh(
+        self,
+        key: str,
+        factory: Callable[[], Any],
+        ttl: float,
+        stale_ttl: float,
+        stale_if_error: Optional[float],
+        tags: frozenset[str],
+        generation: int,
+    ) -> None:
+        try:
+            value = factory()
+        except Exception:
+            # Keep serving the stale value; once it expires callers block and see the error.
+            pass
+        else:
+            self._store_computed(key, value, ttl, stale_ttl, stale_if_error, tags, generation)
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+                self._end_computation(key)
+
+    def _begin_computation(self, key: str, tags: frozenset[str]) -> int:
+        """Register a factory call for ``key`` and return its generation (lock held)."""
+        computation = self._computing.get(key)
+        if computation is None:
+            computation = self._computing[key] = _Computation(tags)
+        computation.calls += 1
+        return computation.generation
+
+    def _end_computation(self, key: str) -> None:
+        with self._lock:
+            computation = self._computing.get(key)
+            if computation is None:
+                return
+            computation.calls -= 1
+            if computation.calls <= 0:
+                del self._computing[key]
+
+    def _is_current(self, key: str, generation: int) -> bool:
+        """True if ``key`` wasn't invalidated since ``generation`` was taken (lock held)."""
+        computation = self._computing.get(key)
+        return computation is not None and computation.generation == generation
+
+    def _invalidate_computations(self, matches: Callable[[str, frozenset[str]], bool]) -> None:
+        """Bump the generation of in-flight keys ``matches`` selects (lock held)."""
+        for key, computation in self._computing.items():
+            if matches(key, computation.tags):
+                computation.generation += 1
+
+    def shutdown(self) -> None:
+        """Stop the background refresh pool without waiting for running refreshes."""
+        with self._lock:
+            self._refreshing.clear()
+            if not self._owns_refresh_executor:
+                return
+            executor, self._refresh_executor = self._refresh_executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _remember_last_good(self, key: str, value: Any, stale_until: float, size: int) -> None:
+        with self._lock:
+            self._bytes -= self._stale_only_size(key)
+            self._last_good[key] = (value, stale_until, size)
+            self._last_good.move_to_end(key)
+            self._bytes += self._stale_only_size(key)
+            if self.max_entries is not None:
+                while len(self._last_good) > self.max_entries:
+                    self._drop_last_good(next(iter(self._last_good)))
+            if self.max_bytes is not None:
+                self._enforce_byte_budget()
+
+    def _stale_or_raise(self, key: str, error: Exception) -> Any:
+        """Serve the last good value for ``key`` within its stale window, else raise."""
+        with self._lock:
+            record = self._last_good.get(key)
+            if record is not None:
+                value, stale_until, _ = record
+                if time.monotonic() < stale_until:
+                    self._stale_served += 1
+                    return value
+                self._drop_last_good(key)
+        raise error
 
     def get_stats(self) -> dict[str, Any]:
         """
@@ -195,6 +808,15 @@ class CacheService:
             - hits: Number of cache hits
             - misses: Number of cache misses
             - hit_rate: Cache hit rate (0.0 to 1.0)
+            - evictions: Entries evicted to stay within max_entries
+            - max_entries: Configured capacity (None = unbounded)
+            - negative_hits: get_or_set calls answered by a cached failure
+            - stale_served: Stale values served because the factory was failing
+            - background_refreshes: Stale-while-revalidate refreshes scheduled
+            - bytes: Estimated bytes held, including stale-if-error copies that
+              outlived their entry (0 unless a byte budget is set)
+            - max_bytes: Configured byte budget (None = none)
+            - effective_max_bytes: Byte budget after memory-pressure shrinking
         """
         with self._lock:
             self._cleanup_expired()
@@ -206,39 +828,87 @@ class CacheService:
                 "hits": self._hits,
                 "misses": self._misses,
                 "hit_rate": hit_rate,
+                "evictions": self._evictions,
+                "max_entries": self.max_entries,
+                "negative_hits": self._negative_hits,
+                "stale_served": self._stale_served,
+                "background_refreshes": self._background_refreshes,
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "effective_max_bytes": self.effective_max_bytes,
             }
 
     def invalidate_prefix(self, prefix: str) -> None:
         """
         Invalidate all cache entries with keys starting with the given prefix.
 
+        Uses the key-group index, so only keys sharing the prefix's group are visited.
+
         Args:
             prefix: Key prefix to match
         """
         with self._lock:
-            keys_to_delete = [key for key in self._cache.keys() if key.startswith(prefix)]
-            for key in keys_to_delete:
-                del self._cache[key]
+            for key in self._keys_with_prefix(prefix):
+                self._remove(key)
+            self._invalidate_computations(lambda key, _: key.startswith(prefix))
 
     def invalidate_pattern(self, pattern: str) -> None:
         """
         Invalidate all cache entries with keys matching the given pattern.
 
-        Supports glob-style patterns (*, ?, []).
+        Supports glob-style patterns (*, ?, []). Only keys sharing the pattern's
+        literal prefix are tested, so "server:home:*" doesn't scan the cache.
 
         Args:
             pattern: Pattern to match (e.g., "user:*:sessions")
         """
+        literal_prefix = re.split(r"[*?\[]", pattern, maxsplit=1)[0]
+        with self._lock:
+            for key in self._keys_with_prefix(literal_prefix):
+                if fnmatch(key, pattern):
+                    self._remove(key)
+            self._invalidate_computations(lambda key, _: fnmatch(key, pattern))
+
+    def invalidate_tags(self, tags: Iterable[str]) -> int:
+        """
+        Invalidate every entry carrying any of the given tags.
+
+        Only the tagged entries are visited, via the tag index.
+
+        Args:
+            tags: Tags to match (e.g. {"server:office", "library:3"})
+
+        Returns:
+            Number of keys invalidated
+        """
+        tag_set = frozenset(tags)
         with self._lock:
-            keys_to_delete = [key for key in self._cache.keys() if fnmatch(key, pattern)]
-            for key in keys_to_delete:
-                del self._cache[key]
+            keys: set[str] = set()
+            for tag in tag_set:
+                keys |= self._tag_index.get(tag, set())
+            for key in keys:
+                self._remove(key)
+            self._invalidate_computations(lambda _, key_tags: not tag_set.isdisjoint(key_tags))
+            return len(keys)
 
     def _cleanup_expired(self) -> None:
-        """Remove all expired entries from the cache (internal use)."""
-        keys_to_delete = [key for key, entry in self._cache.items() if entry.is_expired()]
-        for key in keys_to_delete:
-            del self._cache[key]
+        """Remove all expired entries from the cache (internal use, lock held)."""
+        now = time.monotonic()
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            _, seq, key = heapq.heappop(heap)
+            entry = self._cache.get(key)
+            if entry is not None and entry.seq == seq:
+                self._drop_entry(key)
+
+    def _compact_expiry_heap(self) -> None:
+        """Drop heap records of replaced/removed entries once they dominate (lock held)."""
+        if len(self._expiry_heap) <= 2 * len(self._cache) + 64:
+            return
+        self._expiry_heap = [
+            (entry.expires_at, entry.seq, key) for key, entry in self._cache.items()
+        ]
+        heapq.heapify(self._expiry_heap)
 
     @staticmethod
     def make_key(*args: Any, **kwargs: Any) -> str:
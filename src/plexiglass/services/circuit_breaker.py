@@ -0,0 +1,168 @@
+"""
+Circuit Breaker Service for PlexiGlass.
+
+Tracks failures per key (typically a server name) and short-circuits calls to
+keys that keep failing, so a flapping server costs one fast failure instead of
+a full network timeout on every attempt.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any
+
+
+class CircuitState(Enum):
+    """Circuit breaker states."""
+
+    CLOSED = "closed"  # Calls flow normally
+    OPEN = "open"  # Calls fail fast until the recovery timeout elapses
+    HALF_OPEN = "half_open"  # A single trial call decides whether to close again
+
+
+@dataclass
+class _Circuit:
+    state: CircuitState = CircuitState.CLOSED
+    consecutive_failures: int = 0
+    opened_at: float = 0.0
+    trial_in_flight: bool = False
+
+
+class CircuitBreaker:
+    """
+    Per-key circuit breaker with closed / open / half-open states.
+
+    Features:
+    - Opens after ``failure_threshold`` consecutive failures for a key
+    - Rejects calls while open, until ``recovery_timeout`` seconds have passed
+    - Half-open: lets exactly one trial call through; success closes the
+      circuit, failure re-opens it for another full timeout
+
+    Example:
+        >>> breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=30)
+        >>> if breaker.allow("Home Server"):
+        ...     try:
+        ...         fetch()
+        ...         breaker.record_success("Home Server")
+        ...     except Exception:
+        ...         breaker.record_failure("Home Server")
+    """
+
+    def __init__(self, failure_threshold: int = 3, recovery_timeout: float = 30.0) -> None:
+        """
+        Initialize the circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive failures before a key's circuit opens
+            recovery_timeout: Seconds an open circuit rejects calls before a trial
+        """
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.recovery_timeout = float(recovery_timeout)
+        self._circuits: dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def allow(self, key: str) -> bool:
+        """
+        Check whether a call for ``key`` may proceed.
+
+        Moves an open circuit to half-open once its recovery timeout has elapsed
+        and admits that caller as the single trial call.
+
+        Args:
+            key: Circuit key (e.g. server name)
+
+        Returns:
+            True if the call may proceed, False if it should fail fast
+        """
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is None or circuit.state is CircuitState.CLOSED:
+                return True
+
+            if circuit.state is CircuitState.OPEN:
+                if time.monotonic() - circuit.opened_at < self.recovery_timeout:
+                    return False
+                circuit.state = CircuitState.HALF_OPEN
+                circuit.trial_in_flight = True
+                return True
+
+            # Half-open: only the trial call is allowed through.
+            if circuit.trial_in_flight:
+                return False
+            circuit.trial_in_flight = True
+            return True
+
+    def record_success(self, key: str) -> None:
+        """Record a successful call, closing the key's circuit."""
+        with self._lock:
+            self._circuits.pop(key, None)
+
+    def record_failure(self, key: str) -> None:
+        """Record a failed call, opening the circuit when the threshold is reached."""
+        with self._lock:
+            circuit = self._circuits.setdefault(key, _Circuit())
+            circuit.consecutive_failures += 1
+            circuit.trial_in_flight = False
+            if (
+                circuit.state is CircuitState.HALF_OPEN
+                or circuit.consecutive_failures >= self.failure_threshold
+            ):
+                circuit.state = CircuitState.OPEN
+                circuit.opened_at = time.monotonic()
+
+    def release(self, key: str) -> None:
+        """
+        Release a half-open trial slot without judging the server.
+
+        Used when a call fails for reasons that say nothing about server health
+        (e.g. a 404), so the next caller can run the trial instead.
+        """
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is not None:
+                circuit.trial_in_flight = False
+
+    def get_state(self, key: str) -> CircuitState:
+        """Get the current state of a key's circuit."""
+        with self._lock:
+            circuit = self._circuits.get(key)
+            return CircuitState.CLOSED if circuit is None else circuit.state
+
+    def retry_after(self, key: str) -> float:
+        """Seconds until an open circuit admits a trial call (0 if not open)."""
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is None or circuit.state is not CircuitState.OPEN:
+                return 0.0
+            elapsed = time.monotonic() - circuit.opened_at
+            return max(0.0, self.recovery_timeout - elapsed)
+
+    def reset(self, key: str | None = None) -> None:
+        """
+        Close circuits.
+
+        Args:
+            key: Circuit to reset, or None to reset every circuit
+        """
+        with self._lock:
+            if key is None:
+                self._circuits.clear()
+            else:
+                self._circuits.pop(key, None)
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get breaker statistics.
+
+        Returns:
+            Dictionary with thresholds and the state of every circuit with recent failures
+        """
+        with self._lock:
+            return {
+                "failure_threshold": self.failure_threshold,
+                "recovery_timeout": self.recovery_timeout,
+                "circuits": {key: circuit.state.value for key, circuit in self._circuits.items()},
+            }
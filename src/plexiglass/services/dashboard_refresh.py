@@ -0,0 +1,574 @@
+"""
+Dashboard Refresh Worker for PlexiGlass.
+
+Runs dashboard refresh fetches on a dedicated thread pool so slow or
+unreachable servers never block the Textual event loop, and bounds each
+refresh tick by a deadline so late servers are shown from last known data.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable, Hashable
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from plexiglass.config.performance import PerformanceConfig
+from plexiglass.models.dashboard_snapshot import DashboardSnapshot
+from plexiglass.services.refresh_scheduler import RefreshScheduler
+
+if TYPE_CHECKING:
+    from plexiglass.services.disk_cache import DiskCache
+    from plexiglass.services.server_manager import ServerManager
+
+
+class DashboardRefreshWorker:
+    """
+    Background executor for dashboard refresh jobs.
+
+    Features:
+    - Dedicated, size-bounded thread pool
+    - Tick coalescing: while a refresh is in flight, further requests collapse
+      into a single follow-up run instead of queueing
+    - Results delivered through a callback (typically ``post_message``)
+
+    Example:
+        >>> worker = DashboardRefreshWorker(max_workers=1)
+        >>> worker.request(fetch_snapshot, on_result=apply_snapshot)
+        >>> worker.shutdown()
+    """
+
+    def __init__(self, max_workers: int = PerformanceConfig.DASHBOARD_REFRESH_WORKER_THREADS):
+        """
+        Initialize the refresh worker.
+
+        Args:
+            max_workers: Size of the refresh thread pool (minimum 1)
+        """
+        self.max_workers = max(1, int(max_workers))
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="dashboard-refresh"
+        )
+        self._lock = threading.Lock()
+        self._in_flight = False
+        self._pending: tuple[Callable[[], Any], Callable[[Any], None]] | None = None
+        self._shutdown = False
+        self._completed = 0
+        self._coalesced = 0
+        self._failed = 0
+
+    @classmethod
+    def from_settings(cls, settings: dict[str, Any] | None) -> DashboardRefreshWorker:
+        """
+        Build a worker sized from ``performance.worker_pools.dashboard_refresh``.
+
+        Args:
+            settings: Application settings (as returned by ConfigLoader.get_settings)
+        """
+        optimized = PerformanceConfig.get_optimized_settings(settings)
+        return cls(max_workers=optimized["worker_pools"]["dashboard_refresh"])
+
+    @property
+    def is_busy(self) -> bool:
+        """True while a refresh job is running."""
+        with self._lock:
+            return self._in_flight
+
+    def request(self, job: Callable[[], Any], on_result: Callable[[Any], None]) -> bool:
+        """
+        Request a refresh.
+
+        Args:
+            job: Blocking fetch to run on the pool
+            on_result: Called from the worker thread with the job's result
+
+        Returns:
+            True if the job was started now, False if it was coalesced into the
+            follow-up of the refresh already in flight (or the worker is shut down)
+        """
+        with self._lock:
+            if self._shutdown:
+                return False
+            if self._in_flight:
+                self._pending = (job, on_result)
+                self._coalesced += 1
+                return False
+            self._in_flight = True
+
+        self._submit(job, on_result)
+        return True
+
+    def _submit(self, job: Callable[[], Any], on_result: Callable[[Any], None]) -> None:
+        try:
+            self._executor.submit(self._run, job, on_result)
+        except RuntimeError:
+            # Executor was shut down between the check and the submit.
+            with self._lock:
+                self._in_flight = False
+
+    def _run(self, job: Callable[[], Any], on_result: Callable[[Any], None]) -> None:
+        try:
+            result = job()
+        except Exception:
+            with self._lock:
+                self._failed += 1
+        else:
+            try:
+                on_result(result)
+            except Exception:
+                # The UI may already be gone (e.g. app shutting down).
+                pass
+            with self._lock:
+                self._completed += 1
+
+        with self._lock:
+            next_run = self._pending if not self._shutdown else None
+            self._pending = None
+            if next_run is None:
+                self._in_flight = False
+                return
+
+        self._submit(*next_run)
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get worker statistics.
+
+        Returns:
+            Dictionary with pool size, in-flight flag and completed/coalesced/failed counts
+        """
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "in_flight": self._in_flight,
+                "completed": self._completed,
+                "coalesced": self._coalesced,
+                "failed": self._failed,
+            }
+
+    def shutdown(self) -> None:
+        """Stop accepting work and drop any coalesced follow-up run."""
+        with self._lock:
+            self._shutdown = True
+            self._pending = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+class StatusCollector:
+    """
+    Fetches every server's status in parallel under a per-tick deadline.
+
+    Features:
+    - A tick never waits longer than ``deadline`` seconds, however many
+      servers are slow or unreachable
+    - Servers that miss the deadline are shown from their last known status,
+      flagged ``stale`` with the time it was fetched
+    - At most one fetch per server is in flight; a fetch abandoned by an
+      earlier tick is awaited again instead of being duplicated
+    - ``max_workers`` bounds fetches that are still within their deadline; a
+      fetch that misses it gives up its slot, so hung servers never make
+      healthy ones queue behind them
+    - Fetches that finish after their tick call ``on_late_result`` so the
+      dashboard can repaint without waiting for the next tick
+    - With a disk cache, last known statuses are loaded from it on start and
+      written back when they change (or the stored copy is half its TTL
+      old), so they survive restarts without a SQLite write per poll
+    - Every polled server is pinned in the ServerManager, so
+      ``max_connected_servers`` never disconnects a server on the dashboard
+    - Scheduled ticks only fetch the servers and endpoints whose
+      RefreshScheduler next-due time has passed; the rest are shown from
+      their last fetch
+
+    Example:
+        >>> collector = StatusCollector(deadline=1.5, on_late_result=request_refresh)
+        >>> snapshot = collector.collect(server_manager)
+        >>> snapshot.stale_servers
+        ['Remote Server']
+    """
+
+    # Disk cache namespace holding last known statuses by server name.
+    DISK_NAMESPACE = "server_status"
+    # Endpoints scheduled independently, and the status fields each fills in.
+    RESOURCE_FIELDS: dict[str, tuple[str, ...]] = {
+        "now_playing": ("session_count", "now_playing"),
+        "library_stats": ("library_count", "library_items"),
+    }
+    # Move on every poll of a playing session; progress is extrapolated
+    # locally, so these alone don't count as a change.
+    VOLATILE_SESSION_FIELDS = frozenset({"view_offset", "progress_percent", "observed_at"})
+    # Status fields that change on every poll without the status changing.
+    VOLATILE_STATUS_FIELDS = frozenset({"fetched_at", "latency_ms"})
+
+    def __init__(
+        self,
+        deadline: float = PerformanceConfig.DEFAULT_REFRESH_DEADLINE,
+        max_workers: int = 5,
+        on_late_result: Callable[[], None] | None = None,
+        disk_cache: DiskCache | None = None,
+        scheduler: RefreshScheduler | None = None,
+    ) -> None:
+        """
+        Initialize the collector.
+
+        Args:
+            deadline: Seconds a tick waits for fetches before using stale data
+            max_workers: Concurrent status fetches (fetches that missed a
+                deadline no longer count)
+            on_late_result: Called (from a worker thread) when an abandoned fetch completes
+            disk_cache: Persistent store for last known statuses (optional)
+            scheduler: Per-server polling schedule for scheduled ticks
+                (default: a RefreshScheduler with default settings)
+        """
+        self.deadline = max(0.0, float(deadline))
+        self.on_late_result = on_late_result
+        self.scheduler = scheduler if scheduler is not None else RefreshScheduler()
+        self.max_workers = max(1, int(max_workers))
+        # One thread per in-flight fetch (so at most one per server); the
+        # semaphore bounds how many of them run within their deadline.
+        self._slots = threading.Semaphore(self.max_workers)
+        self._holding: set[str] = set()
+        self._closed = False
+        # Re-entrant: a done callback can run inline while the lock is held.
+        self._lock = threading.RLock()
+        self._in_flight: dict[str, Future] = {}
+        self._abandoned: set[str] = set()
+        self._last_known: dict[str, dict[str, Any]] = {}
+        self._late = 0
+        self.disk_cache = disk_cache
+        # Per server: fingerprint and monotonic time of the last disk write.
+        self._persisted: dict[str, tuple[Hashable, float]] = {}
+        if disk_cache is not None:
+            self._last_known.update(disk_cache.items(self.DISK_NAMESPACE))
+
+    @classmethod
+    def from_settings(
+        cls,
+        settings: dict[str, Any] | None,
+        on_late_result: Callable[[], None] | None = None,
+        disk_cache: DiskCache | None = None,
+    ) -> StatusCollector:
+        """
+        Build a collector from ``performance.refresh_deadline`` / ``max_concurrent_requests``
+        and a RefreshScheduler from the refresh interval settings.
+
+        Args:
+            settings: Application settings (as returned by ConfigLoader.get_settings)
+            on_late_result: See ``__init__``
+            disk_cache: See ``__init__``
+        """
+        performance = (settings or {}).get("performance", {})
+        optimized = PerformanceConfig.get_optimized_settings(settings)
+        return cls(
+            deadline=optimized["refresh_deadline"],
+            max_workers=performance.get("max_concurrent_requests", 5),
+            on_late_result=on_late_result,
+            disk_cache=disk_cache,
+            scheduler=RefreshScheduler.from_settings(settings),
+        )
+
+    def collect(
+        self, server_manager: ServerManager | None, connect: bool = False, scheduled: bool = False
+    ) -> DashboardSnapshot:
+        """
+        Capture a snapshot, waiting at most ``deadline`` seconds.
+
+        Args:
+            server_manager: Manager to fetch from (None yields an empty snapshot)
+            connect: Also start connecting every server in the background; the
+                tick does not wait for it, ``on_late_result`` fires when it is done
+            scheduled: Only fetch what the scheduler says is due (default:
+                fetch every server in full)
+
+        Returns:
+            Snapshot with fresh statuses for servers that answered in time,
+            last fetched statuses for servers that weren't due and stale
+            (last known) statuses for the rest
+        """
+        if server_manager is None:
+            return DashboardSnapshot.from_statuses([])
+
+        names = list(server_manager.get_all_server_names())
+        due = self._due_resources(names) if scheduled else dict.fromkeys(names)
+        with self._lock:
+            in_flight = {name for name, future in self._in_flight.items() if not future.done()}
+        # Servers being fetched from must not be evicted to make room for others;
+        # the rest may be, and reconnect when they are next due.
+        server_manager.set_pinned_servers(set(due) | in_flight)
+        if connect:
+            threading.Thread(
+                target=self._connect_all,
+                args=(server_manager,),
+                name="dashboard-refresh-connect",
+                daemon=True,
+            ).start()
+
+        with self._lock:
+            futures = {
+                name: self._fetch_future(server_manager, name, resources)
+                for name, resources in due.items()
+            }
+
+        wait(list(futures.values()), timeout=self.deadline)
+
+        statuses: list[dict[str, Any]] = []
+        with self._lock:
+            for name in names:
+                future = futures.get(name)
+                if future is None:
+                    last_known = self._last_known.get(name)
+                    statuses.append(
+                        dict(last_known) if last_known is not None else self._stale_status(name)
+                    )
+                    continue
+                if future.done() and not future.cancelled() and future.exception() is None:
+                    statuses.append(future.result())
+                    continue
+                if not future.done():
+                    self._abandoned.add(name)
+                    self._release_slot(name)
+                    self._late += 1
+                statuses.append(self._stale_status(name))
+        return DashboardSnapshot.from_statuses(statuses)
+
+    def has_due(self, server_manager: ServerManager | None) -> bool:
+        """
+        True if a scheduled tick would start a fetch.
+
+        Servers with a fetch still in flight don't count: their late result
+        already triggers ``on_late_result``.
+        """
+        if server_manager is None:
+            return False
+        with self._lock:
+            busy = {name for name, future in self._in_flight.items() if not future.done()}
+        names = [name for name in server_manager.get_all_server_names() if name not in busy]
+        return bool(self._due_resources(names))
+
+    def _due_resources(self, names: list[str]) -> dict[str, tuple[str, ...] | None]:
+        """Due endpoints per server; None = all of them, servers with none are left out."""
+        now = time.monotonic()
+        due: dict[str, tuple[str, ...] | None] = {}
+        for name in names:
+            resources = tuple(
+                resource
+                for resource in self.RESOURCE_FIELDS
+                if self.scheduler.is_due((name, resource), now)
+            )
+            if len(resources) == len(self.RESOURCE_FIELDS):
+                due[name] = None
+            elif resources:
+                due[name] = resources
+        return due
+
+    def _fetch_future(
+        self, server_manager: ServerManager, name: str, resources: tuple[str, ...] | None = None
+    ) -> Future:
+        """Reuse the in-flight fetch for ``name`` or start a new one (caller holds the lock)."""
+        future = self._in_flight.get(name)
+        if future is not None and not future.done():
+            return future
+
+        future: Future = Future()
+        self._in_flight[name] = future
+        future.add_done_callback(lambda done, name=name: self._on_fetch_done(name, done))
+        threading.Thread(
+            target=self._run_fetch,
+            args=(future, server_manager, name, resources),
+            name=f"dashboard-refresh-fetch-{name}",
+            daemon=True,
+        ).start()
+        return future
+
+    def _run_fetch(
+        self,
+        future: Future,
+        server_manager: ServerManager,
+        name: str,
+        resources: tuple[str, ...] | None,
+    ) -> None:
+        self._slots.acquire()
+        with self._lock:
+            if self._closed or not future.set_running_or_notify_cancel():
+                # Pass the slot on so other waiting fetches see the shutdown too.
+                self._slots.release()
+                return
+            self._holding.add(name)
+        try:
+            result = self._fetch(server_manager, name, resources)
+        except Exception as exc:
+            self._release_slot(name)
+            future.set_exception(exc)
+        else:
+            self._release_slot(name)
+            future.set_result(result)
+
+    def _release_slot(self, name: str) -> None:
+        """Give back the concurrency slot held by ``name``'s fetch, at most once."""
+        with self._lock:
+            if name not in self._holding:
+                return
+            self._holding.discard(name)
+        self._slots.release()
+
+    def _fetch(
+        self, server_manager: ServerManager, name: str, resources: tuple[str, ...] | None
+    ) -> dict[str, Any]:
+        fetched = tuple(self.RESOURCE_FIELDS) if resources is None else resources
+        try:
+            if resources is None:
+                status = dict(server_manager.get_server_status(name))
+            else:
+                status = dict(server_manager.get_server_status(name, resources=resources))
+        except Exception:
+            for resource in fetched:
+                self.scheduler.observe_failure((name, resource))
+            raise
+        # Scheduled before the result is published, so the next tick already sees it.
+        for resource in fetched:
+            self.scheduler.observe((name, resource), self._fingerprint(resource, status))
+        if resources is not None:
+            with self._lock:
+                previous = self._last_known.get(name, {})
+            # Endpoints that weren't due keep their last fetched values.
+            for resource, fields in self.RESOURCE_FIELDS.items():
+                if resource in resources:
+                    continue
+                for field in fields:
+                    if field in previous:
+                        status[field] = previous[field]
+        status["fetched_at"] = datetime.now()
+        return status
+
+    @classmethod
+    def _fingerprint(cls, resource: str, status: dict[str, Any]) -> Hashable:
+        """Comparable summary of one endpoint's data, for change detection."""
+        values: list[Any] = [status.get("connected")]
+        for field in cls.RESOURCE_FIELDS[resource]:
+            value = status.get(field)
+            if field == "now_playing":
+                value = [
+                    sorted(
+                        (key, repr(item))
+                        for key, item in entry.items()
+                        if key not in cls.VOLATILE_SESSION_FIELDS
+                    )
+                    for entry in value or []
+                ]
+            values.append(value)
+        return repr(values)
+
+    def _connect_all(self, server_manager: ServerManager) -> None:
+        try:
+            server_manager.connect_all()
+        except Exception:
+            # Per-server failures are reported through each server's status.
+            pass
+        # Statuses fetched before the connections existed are outdated.
+        self.scheduler.snap_back()
+        self._notify_late()
+
+    def _on_fetch_done(self, name: str, future: Future) -> None:
+        succeeded = not future.cancelled() and future.exception() is None
+        with self._lock:
+            if self._in_flight.get(name) is future:
+                del self._in_flight[name]
+            if succeeded:
+                self._last_known[name] = future.result()
+            late = name in self._abandoned
+            self._abandoned.discard(name)
+        if succeeded and self.disk_cache is not None:
+            self._persist(name, future.result())
+        if late:
+            self._notify_late()
+
+    def _persist(self, name: str, status: dict[str, Any]) -> None:
+        """Write ``status`` to the disk cache unless the stored copy is current."""
+        disk_cache = self.disk_cache
+        if disk_cache is None:
+            return
+        fingerprint = self._status_fingerprint(status)
+        now = time.monotonic()
+        rewrite_after = disk_cache.ttl_for(self.DISK_NAMESPACE) / 2
+        with self._lock:
+            persisted = self._persisted.get(name)
+            if (
+                persisted is not None
+                and persisted[0] == fingerprint
+                and now - persisted[1] < rewrite_after
+            ):
+                return
+            self._persisted[name] = (fingerprint, now)
+        disk_cache.set(self.DISK_NAMESPACE, name, status)
+
+    @classmethod
+    def _status_fingerprint(cls, status: dict[str, Any]) -> Hashable:
+        """Comparable summary of a whole status, ignoring per-poll noise."""
+        session_fields = cls.RESOURCE_FIELDS["now_playing"]
+        values = [
+            (key, repr(value))
+            for key, value in sorted(status.items())
+            if key not in cls.VOLATILE_STATUS_FIELDS and key not in session_fields
+        ]
+        values.append(("now_playing", cls._fingerprint("now_playing", status)))
+        return repr(values)
+
+    def _notify_late(self) -> None:
+        if self.on_late_result is None:
+            return
+        try:
+            self.on_late_result()
+        except Exception:
+            # The UI may already be gone (e.g. app shutting down).
+            pass
+
+    def _stale_status(self, name: str) -> dict[str, Any]:
+        """Last known status for ``name`` flagged stale (caller holds the lock)."""
+        last_known = self._last_known.get(name)
+        if last_known is None:
+            status: dict[str, Any] = {
+                "name": name,
+                "connected": False,
+                "session_count": 0,
+                "now_playing": [],
+                "fetched_at": None,
+            }
+        else:
+            status = dict(last_known)
+        status["stale"] = True
+        return status
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get collector statistics.
+
+        Returns:
+            Dictionary with the deadline, fetches in flight (and how many of
+            them have missed a deadline), deadline misses and the refresh
+            scheduler's statistics
+        """
+        with self._lock:
+            return {
+                "deadline": self.deadline,
+                "max_workers": self.max_workers,
+                "in_flight": len(self._in_flight),
+                "overdue": sum(
+                    1
+                    for name, future in self._in_flight.items()
+                    if name not in self._holding and future.running()
+                ),
+                "late": self._late,
+                "scheduler": self.scheduler.get_stats(),
+            }
+
+    def shutdown(self) -> None:
+        """Abandon in-flight fetches; fetches still waiting for a slot never start."""
+        self.on_late_result = None
+        with self._lock:
+            self._closed = True
+            pending = [future for future in self._in_flight.values() if not future.running()]
+        for future in pending:
+            future.cancel()
+        # Wake one waiting fetch; each passes the slot on after seeing the shutdown.
+        self._slots.release()
@@ -0,0 +1,299 @@
+"""
+Disk Cache Service for PlexiGlass.
+
+A small persistent second tier behind the in-memory caches: values are
+stored zlib-compressed in a SQLite file next to ``servers.yaml`` so the next
+launch can paint last-known state (server status, identity, library lists)
+before any server has answered.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from plexiglass.config.performance import PerformanceConfig
+
+_DATETIME_TAG = "$datetime"
+
+
+def _encode_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {_DATETIME_TAG: value.isoformat()}
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    raise TypeError(f"Cannot persist {type(value).__name__}")
+
+
+def _decode_hook(obj: dict[str, Any]) -> Any:
+    if len(obj) == 1 and _DATETIME_TAG in obj:
+        return datetime.fromisoformat(obj[_DATETIME_TAG])
+    return obj
+
+
+class DiskCache:
+    """
+    SQLite-backed persistent cache with per-namespace TTLs.
+
+    Features:
+    - One ``(namespace, key)`` table; values are JSON (datetimes preserved)
+      compressed with zlib
+    - Per-namespace TTLs on the wall clock, so entries age across restarts
+    - Thread-safe; storage errors are swallowed so a broken or read-only
+      cache file degrades to a cold start instead of a crash
+
+    Example:
+        >>> disk = DiskCache(Path("~/.config/plexiglass/cache.sqlite3").expanduser())
+        >>> disk.set("server_status", "Home Server", status)
+        >>> disk.items("server_status")
+        {'Home Server': {...}}
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS entries (
+            namespace TEXT NOT NULL,
+            key TEXT NOT NULL,
+            value BLOB NOT NULL,
+            stored_at REAL NOT NULL,
+            PRIMARY KEY (namespace, key)
+        )
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        ttls: dict[str, float] | None = None,
+        default_ttl: float = PerformanceConfig.DISK_CACHE_DEFAULT_TTL,
+    ) -> None:
+        """
+        Open (creating if needed) the cache file.
+
+        Args:
+            path: SQLite file location
+            ttls: Seconds entries stay valid, per namespace
+            default_ttl: TTL for namespaces not listed in ``ttls``
+        """
+        self.path = Path(path)
+        self.ttls = dict(ttls or {})
+        self.default_ttl = default_ttl
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        with self._conn:
+            self._conn.execute(self.SCHEMA)
+        self._reads = 0
+        self._hits = 0
+        self._writes = 0
+        self._errors = 0
+
+    @classmethod
+    def from_settings(cls, config_path: Path, settings: dict[str, Any] | None) -> DiskCache | None:
+        """
+        Open the disk cache next to the config file, if enabled.
+
+        Reads ``performance.disk_cache`` and ``performance.disk_cache_ttls``.
+
+        Args:
+            config_path: Path of ``servers.yaml``; the cache lives alongside it
+            settings: Application settings (as returned by ConfigLoader.get_settings)
+
+        Returns:
+            The cache, or None if disabled or the file can't be opened
+        """
+        optimized = PerformanceConfig.get_optimized_settings(settings)
+        if not optimized["disk_cache"]:
+            return None
+        try:
+            return cls(
+                Path(config_path).with_name(PerformanceConfig.DISK_CACHE_FILENAME),
+                ttls=optimized["disk_cache_ttls"],
+            )
+        except (OSError, sqlite3.Error):
+            return None
+
+    def ttl_for(self, namespace: str) -> float:
+        """TTL in seconds for a namespace."""
+        return float(self.ttls.get(namespace, self.default_ttl))
+
+    def get(self, namespace: str, key: str, default: Any = None) -> Any:
+        """
+        Read one value.
+
+        Args:
+            namespace: Value namespace (e.g. "server_status")
+            key: Key within the namespace
+            default: Returned if missing, expired or unreadable
+
+        Returns:
+            The stored value or ``default``
+        """
+        with self._lock:
+            self._reads += 1
+            try:
+                row = self._conn.execute(
+                    "SELECT value, stored_at FROM entries WHERE namespace = ? AND key = ?",
+                    (namespace, key),
+                ).fetchone()
+            except sqlite3.Error:
+                self._errors += 1
+                return default
+            if row is None or self._is_expired(namespace, row[1]):
+                return default
+            value = self._decode(row[0])
+            if value is None:
+                return default
+            self._hits += 1
+            return value[0]
+
+    def items(self, namespace: str) -> dict[str, Any]:
+        """
+        Read every unexpired value in a namespace.
+
+        Args:
+            namespace: Value namespace
+
+        Returns:
+            Mapping of key to value
+        """
+        with self._lock:
+            try:
+                rows = self._conn.execute(
+                    "SELECT key, value, stored_at FROM entries WHERE namespace = ?",
+                    (namespace,),
+                ).fetchall()
+            except sqlite3.Error:
+                self._errors += 1
+                return {}
+        result: dict[str, Any] = {}
+        for key, blob, stored_at in rows:
+            if self._is_expired(namespace, stored_at):
+                continue
+            value = self._decode(blob)
+            if value is not None:
+                result[key] = value[0]
+        return result
+
+    def set(self, namespace: str, key: str, value: Any) -> bool:
+        """
+        Store one value, replacing any previous one.
+
+        Args:
+            namespace: Value namespace
+            key: Key within the namespace
+            value: JSON-serializable value (datetimes, tuples and sets allowed)
+
+        Returns:
+            True if stored, False if the value couldn't be encoded or written
+        """
+        try:
+            blob = zlib.compress(json.dumps(value, default=_encode_default).encode("utf-8"))
+        except (TypeError, ValueError):
+            with self._lock:
+                self._errors += 1
+            return False
+        with self._lock:
+            try:
+                with self._conn:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO entries (namespace, key, value, stored_at) "
+                        "VALUES (?, ?, ?, ?)",
+                        (namespace, key, blob, time.time()),
+                    )
+            except sqlite3.Error:
+                self._errors += 1
+                return False
+            self._writes += 1
+            return True
+
+    def delete(self, namespace: str, key: str) -> None:
+        """Remove one value."""
+        self._execute("DELETE FROM entries WHERE namespace = ? AND key = ?", (namespace, key))
+
+    def clear(self, namespace: str | None = None) -> None:
+        """
+        Remove stored values.
+
+        Args:
+            namespace: Namespace to clear, or None for everything
+        """
+        if namespace is None:
+            self._execute("DELETE FROM entries", ())
+        else:
+            self._execute("DELETE FROM entries WHERE namespace = ?", (namespace,))
+
+    def purge_expired(self) -> int:
+        """
+        Delete expired rows from every namespace.
+
+        Returns:
+            Number of rows deleted
+        """
+        now = time.time()
+        with self._lock:
+            try:
+                namespaces = [
+                    row[0] for row in self._conn.execute("SELECT DISTINCT namespace FROM entries")
+                ]
+                removed = 0
+                with self._conn:
+                    for namespace in namespaces:
+                        cursor = self._conn.execute(
+                            "DELETE FROM entries WHERE namespace = ? AND stored_at <= ?",
+                            (namespace, now - self.ttl_for(namespace)),
+                        )
+                        removed += cursor.rowcount
+                return removed
+            except sqlite3.Error:
+                self._errors += 1
+                return 0
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get disk cache statistics.
+
+        Returns:
+            Dictionary with the file path, reads, hits, writes and storage errors
+        """
+        with self._lock:
+            return {
+                "path": str(self.path),
+                "reads": self._reads,
+                "hits": self._hits,
+                "writes": self._writes,
+                "errors": self._errors,
+            }
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        with self._lock:
+            try:
+                self._conn.close()
+            except sqlite3.Error:
+                # Closing is best effort during shutdown.
+                pass
+
+    def _is_expired(self, namespace: str, stored_at: float) -> bool:
+        # Wall clock on purpose: entries have to age across process restarts.
+        return time.time() - stored_at >= self.ttl_for(namespace)
+
+    @staticmethod
+    def _decode(blob: bytes) -> tuple[Any] | None:
+        """Decode a stored value, wrapped in a 1-tuple so a stored None is distinguishable."""
+        try:
+            return (json.loads(zlib.decompress(blob).decode("utf-8"), object_hook=_decode_hook),)
+        except (zlib.error, UnicodeDecodeError, ValueError):
+            return None
+
+    def _execute(self, sql: str, params: tuple[Any, ...]) -> None:
+        with self._lock:
+            try:
+                with self._conn:
+                    self._conn.execute(sql, params)
+            except sqlite3.Error:
+                self._errors += 1
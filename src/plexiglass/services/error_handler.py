@@ -3,21 +3,41 @@ Error handling service with user-friendly messages, retry logic, and graceful de
 
 This module provides comprehensive error handling capabilities:
 - User-friendly error message transformation
-- Automatic retry with exponential backoff
+- Automatic retry with exponential or decorrelated-jitter backoff
+- Per-key circuit breaking for synchronous calls
 - Error severity categorization
 - Error history tracking
 - Graceful degradation support
 """
 
 import asyncio
+import builtins
+import random
+import time
 from enum import Enum
 from typing import Any, Callable, TypeVar, Optional
 from datetime import datetime
 from collections import deque
 
-from plexiglass.services.exceptions import ServiceError, ConnectionError, ServerNotFoundError
+import requests
+
+from plexiglass.services.circuit_breaker import CircuitBreaker, CircuitState
+from plexiglass.services.exceptions import (
+    CircuitOpenError,
+    ServiceError,
+    ConnectionError,
+    ServerNotFoundError,
+)
 from plexiglass.config.exceptions import ConfigurationError
 
+# Transport-level failures raised by plexapi/requests that are worth retrying.
+TRANSIENT_NETWORK_ERRORS = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+    builtins.ConnectionError,
+    TimeoutError,
+)
+
 
 class ErrorSeverity(Enum):
     """Error severity levels for UI display."""
@@ -36,13 +56,20 @@ class ErrorHandler:
 
     Provides:
     - User-friendly error message transformation
-    - Automatic retry with exponential backoff
+    - Automatic retry with exponential backoff (async) or
+      decorrelated-jitter backoff (sync)
+    - Per-key circuit breaking so failing servers fail fast
     - Error categorization by severity
     - Error history tracking
     """
 
     def __init__(
-        self, retry_count: int = 3, retry_delay: float = 1.0, max_error_history: int = 100
+        self,
+        retry_count: int = 3,
+        retry_delay: float = 1.0,
+        max_error_history: int = 100,
+        max_retry_delay: float = 30.0,
+        circuit_breaker: Optional[CircuitBreaker] = None,
     ):
         """
         Initialize ErrorHandler.
@@ -51,10 +78,14 @@ class ErrorHandler:
             retry_count: Number of retry attempts for retryable errors
             retry_delay: Base delay between retries (seconds)
             max_error_history: Maximum number of errors to keep in history
+            max_retry_delay: Upper bound for a single jittered backoff delay (seconds)
+            circuit_breaker: Breaker used by call_with_retry (a default one is created)
         """
         self.retry_count = retry_count
         self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
         self.max_error_history = max_error_history
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
         self._error_history: deque = deque(maxlen=max_error_history)
 
     def get_user_friendly_message(self, error: Exception) -> str:
@@ -162,6 +193,80 @@ class ErrorHandler:
         if last_error:
             raise last_error
 
+    def call_with_retry(
+        self,
+        func: Callable[[], T],
+        key: Optional[str] = None,
+        retry_count: Optional[int] = None,
+    ) -> T:
+        """
+        Call a synchronous function with retries, jittered backoff and circuit breaking.
+
+        Each retryable failure counts against ``key``'s circuit. Once the circuit
+        opens, retrying stops and later calls raise CircuitOpenError immediately
+        instead of waiting on the network.
+
+        Args:
+            func: Blocking function to call
+            key: Circuit breaker key (e.g. server name); None disables breaking
+            retry_count: Attempts for this call (defaults to ``self.retry_count``)
+
+        Returns:
+            Result of the successful call
+
+        Raises:
+            CircuitOpenError: If ``key``'s circuit is open
+            Original exception if all retries exhausted or error is non-retryable
+        """
+        attempts = max(1, self.retry_count if retry_count is None else retry_count)
+        delay = self.retry_delay
+
+        for attempt in range(attempts):
+            if key is not None and not self.circuit_breaker.allow(key):
+                raise CircuitOpenError(key, self.circuit_breaker.retry_after(key))
+
+            try:
+                result = func()
+            except Exception as e:
+                if not self.is_retryable_error(e):
+                    # The server answered; the failure says nothing about its health.
+                    if key is not None:
+                        self.circuit_breaker.release(key)
+                    raise
+
+                if key is not None:
+                    self.circuit_breaker.record_failure(key)
+                    if self.circuit_breaker.get_state(key) is CircuitState.OPEN:
+                        raise
+
+                if attempt >= attempts - 1:
+                    raise
+
+                delay = self.next_backoff_delay(delay)
+                time.sleep(delay)
+            else:
+                if key is not None:
+                    self.circuit_breaker.record_success(key)
+                return result
+
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    def next_backoff_delay(self, previous_delay: float) -> float:
+        """
+        Compute the next decorrelated-jitter backoff delay.
+
+        Delays grow roughly threefold per attempt but are randomized between the
+        base delay and that bound, so clients retrying the same server spread out.
+
+        Args:
+            previous_delay: The previous delay (use ``retry_delay`` for the first retry)
+
+        Returns:
+            Next delay in seconds, capped at ``max_retry_delay``
+        """
+        upper = max(self.retry_delay, previous_delay * 3)
+        return min(self.max_retry_delay, random.uniform(self.retry_delay, upper))
+
     def is_retryable_error(self, error: Exception) -> bool:
         """
         Determine if an error is retryable.
@@ -180,6 +285,10 @@ class ErrorHandler:
         if isinstance(error, ServerNotFoundError):
             return False
 
+        # An open circuit means "stop calling"; retrying would defeat it
+        if isinstance(error, CircuitOpenError):
+            return False
+
         # Connection errors are retryable (transient)
         if isinstance(error, ConnectionError):
             return True
@@ -188,6 +297,10 @@ class ErrorHandler:
         if isinstance(error, ServiceError):
             return True
 
+        # Network failures and timeouts from plexapi/requests are transient
+        if isinstance(error, TRANSIENT_NETWORK_ERRORS):
+            return True
+
         # Default to not retryable for unknown errors
         return False
 
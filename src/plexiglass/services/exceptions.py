@@ -29,3 +29,17 @@ class ServerNotFoundError(ServiceError):
     """
 
     pass
+
+
+class CircuitOpenError(ConnectionError):
+    """
+    Raised instead of calling a server whose circuit breaker is open.
+
+    The server failed repeatedly, so calls fail fast until ``retry_after``
+    seconds have passed rather than waiting on another network timeout.
+    """
+
+    def __init__(self, key: str, retry_after: float = 0.0) -> None:
+        super().__init__(f"Circuit open for '{key}'; retrying in {retry_after:.0f}s")
+        self.key = key
+        self.retry_after = retry_after
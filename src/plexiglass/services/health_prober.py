@@ -0,0 +1,210 @@
+"""
+Health Prober Service for PlexiGlass.
+
+Periodically probes each connected server over the network and tracks a
+per-server health state machine (healthy / degraded / down) with a latency
+EWMA, so callers can skip servers that are down instead of blocking on them.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from datetime import datetime
+from enum import Enum
+
+
+class HealthState(Enum):
+    """Health states for a probed server."""
+
+    UNKNOWN = "unknown"  # Never probed
+    HEALTHY = "healthy"  # Responding within the latency threshold
+    DEGRADED = "degraded"  # Slow, or a single recent failure
+    DOWN = "down"  # Repeated consecutive failures
+
+
+@dataclass(frozen=True)
+class ServerHealth:
+    """Point-in-time health record for one server."""
+
+    name: str
+    state: HealthState = HealthState.UNKNOWN
+    latency_ewma_ms: float | None = None
+    last_latency_ms: float | None = None
+    last_success: datetime | None = None
+    last_checked: datetime | None = None
+    consecutive_failures: int = 0
+    last_error: str | None = None
+
+    @property
+    def is_down(self) -> bool:
+        return self.state is HealthState.DOWN
+
+
+class HealthProber:
+    """
+    Background health prober with a per-server state machine.
+
+    State transitions:
+    - success: HEALTHY, or DEGRADED when the latency EWMA exceeds the threshold
+    - failure: DEGRADED on the first failure, DOWN after ``down_after_failures``
+
+    Example:
+        >>> prober = HealthProber(probe=manager.probe_server, targets=manager.get_connected_servers)
+        >>> prober.start()
+        >>> prober.get_health("Home Server").state
+        <HealthState.HEALTHY: 'healthy'>
+    """
+
+    EWMA_ALPHA = 0.3
+    DEGRADED_LATENCY_MS = 1500.0
+    DOWN_AFTER_FAILURES = 2
+
+    def __init__(
+        self,
+        probe: Callable[[str], None],
+        targets: Callable[[], list[str]],
+        interval: float = 15.0,
+        max_workers: int = 5,
+        degraded_latency_ms: float = DEGRADED_LATENCY_MS,
+        down_after_failures: int = DOWN_AFTER_FAILURES,
+    ) -> None:
+        """
+        Initialize the prober.
+
+        Args:
+            probe: Blocking probe for one server name; raises on failure
+            targets: Returns the server names to probe each round
+            interval: Seconds between probe rounds
+            max_workers: Probes run concurrently so one dead server can't stall the round
+            degraded_latency_ms: Latency EWMA above which a responsive server is degraded
+            down_after_failures: Consecutive failures before a server is marked down
+        """
+        self._probe = probe
+        self._targets = targets
+        self.interval = interval
+        self.max_workers = max(1, int(max_workers))
+        self.degraded_latency_ms = degraded_latency_ms
+        self.down_after_failures = max(1, int(down_after_failures))
+        self._health: dict[str, ServerHealth] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def get_health(self, name: str) -> ServerHealth:
+        """Get the latest health record for a server (UNKNOWN if never probed)."""
+        with self._lock:
+            return self._health.get(name) or ServerHealth(name=name)
+
+    def get_all_health(self) -> dict[str, ServerHealth]:
+        """Get health records for every server probed so far."""
+        with self._lock:
+            return dict(self._health)
+
+    def is_down(self, name: str) -> bool:
+        """True if the server is currently marked down."""
+        return self.get_health(name).is_down
+
+    def forget(self, name: str) -> None:
+        """Drop the health record for a server (e.g. after disconnect)."""
+        with self._lock:
+            self._health.pop(name, None)
+
+    def probe_now(self, name: str) -> ServerHealth:
+        """
+        Probe a single server synchronously and record the outcome.
+
+        Args:
+            name: Server name to probe
+
+        Returns:
+            The updated health record
+        """
+        started = time.perf_counter()
+        try:
+            self._probe(name)
+        except Exception as e:
+            return self.record_failure(name, e)
+        return self.record_success(name, (time.perf_counter() - started) * 1000.0)
+
+    def probe_all(self) -> dict[str, ServerHealth]:
+        """Probe every target concurrently and return their updated records."""
+        names = list(dict.fromkeys(self._targets()))
+        if not names:
+            return {}
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(names)), thread_name_prefix="health-probe"
+        ) as executor:
+            results = list(executor.map(self.probe_now, names))
+        return {health.name: health for health in results}
+
+    def record_success(self, name: str, latency_ms: float) -> ServerHealth:
+        """Record a successful probe with its round-trip latency."""
+        with self._lock:
+            current = self._health.get(name) or ServerHealth(name=name)
+            if current.latency_ewma_ms is None:
+                ewma = latency_ms
+            else:
+                alpha = self.EWMA_ALPHA
+                ewma = alpha * latency_ms + (1 - alpha) * current.latency_ewma_ms
+            now = datetime.now()
+            state = HealthState.DEGRADED if ewma > self.degraded_latency_ms else HealthState.HEALTHY
+            updated = replace(
+                current,
+                state=state,
+                latency_ewma_ms=ewma,
+                last_latency_ms=latency_ms,
+                last_success=now,
+                last_checked=now,
+                consecutive_failures=0,
+                last_error=None,
+            )
+            self._health[name] = updated
+            return updated
+
+    def record_failure(self, name: str, error: Exception) -> ServerHealth:
+        """Record a failed probe."""
+        with self._lock:
+            current = self._health.get(name) or ServerHealth(name=name)
+            failures = current.consecutive_failures + 1
+            state = (
+                HealthState.DOWN if failures >= self.down_after_failures else HealthState.DEGRADED
+            )
+            updated = replace(
+                current,
+                state=state,
+                last_checked=datetime.now(),
+                consecutive_failures=failures,
+                last_error=str(error) or type(error).__name__,
+            )
+            self._health[name] = updated
+            return updated
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start probing in a background daemon thread (no-op if already running)."""
+        if self.is_running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="health-prober", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background thread after the current round."""
+        self._stop.set()
+        self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.probe_all()
+            except Exception:
+                # Never let a bad round kill the prober thread.
+                pass
+            self._stop.wait(self.interval)
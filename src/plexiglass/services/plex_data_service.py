@@ -0,0 +1,201 @@
+"""
+Plex Data Service for PlexiGlass.
+
+One cached read path for the Plex data several parts of the app need: the
+dashboard, the gallery screen's parameter defaults and the gallery demos all
+ask for sessions and library sections, and without a shared layer each of
+them fetched their own copy.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING, Any
+
+from plexiglass.config.performance import PerformanceConfig
+from plexiglass.services.cache_service import CacheKey
+from plexiglass.services.sharded_cache_service import ShardedCacheService
+
+if TYPE_CHECKING:
+    from plexapi.base import PlexPartialObject, PlexSession
+    from plexapi.library import LibrarySection
+    from plexapi.server import PlexServer
+
+# Runs a server fetch on a cache miss, e.g. with retries and endpoint failover.
+FetchRunner = Callable[[Callable[["PlexServer"], Iterable[Any]]], Iterable[Any]]
+
+
+class PlexDataService:
+    """
+    Cached, typed accessors for Plex server data shared across the app.
+
+    Features:
+    - ``sessions``, ``sections`` and ``history`` fetch once per TTL per server
+      and hand every caller the same result
+    - TTLs come from ``performance.cache_ttls`` (sessions, library_list, history)
+    - Entries are keyed ``plex:<machineIdentifier>:<resource>`` and tagged, so
+      ``invalidate`` drops one server's data (or one resource) at once
+    - While ``alerts_live(server)`` is true (see AlertInvalidator) the longer
+      ``alert_cache_ttls`` apply, since changes arrive as invalidations
+
+    Example:
+        >>> data = PlexDataService.from_settings(settings)
+        >>> data.sections(server)
+        [<MovieSection:1:Movies>, <ShowSection:2:TV Shows>]
+    """
+
+    NAMESPACE = "plex"
+
+    def __init__(
+        self,
+        cache: ShardedCacheService | None = None,
+        ttls: dict[str, float] | None = None,
+        alert_ttls: dict[str, float] | None = None,
+    ) -> None:
+        """
+        Initialize the data service.
+
+        Args:
+            cache: Cache to store results in (default: a new ShardedCacheService)
+            ttls: Seconds each category is cached (``cache_ttls`` keys)
+            alert_ttls: Seconds each category is cached while the server's
+                alerts are live (``alert_cache_ttls`` keys)
+        """
+        defaults = PerformanceConfig.get_defaults()
+        self.cache = cache if cache is not None else ShardedCacheService()
+        self.ttls = {**defaults["cache_ttls"], **(ttls or {})}
+        self.alert_ttls = {**defaults["alert_cache_ttls"], **(alert_ttls or {})}
+        # Set by the owner of an AlertInvalidator; None = TTL-only caching.
+        self.alerts_live: Callable[[PlexServer], bool] | None = None
+
+    @classmethod
+    def from_settings(cls, settings: dict[str, Any] | None) -> PlexDataService:
+        """
+        Build a data service from ``performance.cache_ttls`` and the cache sizing settings.
+
+        Args:
+            settings: Application settings (as returned by ConfigLoader.get_settings)
+        """
+        optimized = PerformanceConfig.get_optimized_settings(settings)
+        return cls(
+            cache=ShardedCacheService.from_settings(settings),
+            ttls=optimized["cache_ttls"],
+            alert_ttls=optimized["alert_cache_ttls"],
+        )
+
+    def sessions(self, server: PlexServer, via: FetchRunner | None = None) -> list[PlexSession]:
+        """
+        Get the server's active playback sessions.
+
+        Args:
+            server: Connected PlexServer
+            via: Runs the fetch on a cache miss (default: calls it with ``server``)
+
+        Returns:
+            Session objects (cached for ``cache_ttls.sessions``)
+        """
+        return self._cached(server, "sessions", "sessions", lambda s: s.sessions(), via)
+
+    def sections(self, server: PlexServer, via: FetchRunner | None = None) -> list[LibrarySection]:
+        """
+        Get the server's library sections.
+
+        Args:
+            server: Connected PlexServer
+            via: Runs the fetch on a cache miss (default: calls it with ``server``)
+
+        Returns:
+            Library sections (cached for ``cache_ttls.library_list``)
+        """
+        return self._cached(server, "sections", "library_list", lambda s: s.library.sections(), via)
+
+    def history(
+        self, server: PlexServer, maxresults: int = 10, via: FetchRunner | None = None
+    ) -> list[PlexPartialObject]:
+        """
+        Get the server's most recent play history.
+
+        Args:
+            server: Connected PlexServer
+            maxresults: Number of entries to return
+            via: Runs the fetch on a cache miss (default: calls it with ``server``)
+
+        Returns:
+            History entries, newest first (cached for ``cache_ttls.history``)
+        """
+        return self._cached(
+            server,
+            "history",
+            "history",
+            lambda s: s.history(maxresults=maxresults),
+            via,
+            maxresults=maxresults,
+        )
+
+    def invalidate(self, server: PlexServer | None = None, resources: Iterable[str] = ()) -> None:
+        """
+        Drop cached data so the next read fetches fresh values.
+
+        Args:
+            server: Server whose data to drop (None = every server)
+            resources: Resources to drop ("sessions", "sections", "history");
+                empty = all of them
+        """
+        resource_list = list(resources)
+        if server is None:
+            tags = {f"resource:{resource}" for resource in resource_list}
+            self.cache.invalidate_tags(tags or {f"namespace:{self.NAMESPACE}"})
+            return
+
+        prefix = f"{self.NAMESPACE}:{self.server_key(server)}:"
+        if not resource_list:
+            self.cache.invalidate_prefix(prefix)
+        for resource in resource_list:
+            self.cache.invalidate_prefix(f"{prefix}{resource}")
+
+    @staticmethod
+    def server_key(server: PlexServer) -> str:
+        """
+        Stable cache identity for a server connection.
+
+        Uses the machine identifier, so a failover connection to the same
+        server shares its cache entries.
+        """
+        identifier = getattr(server, "machineIdentifier", None)
+        if isinstance(identifier, str) and identifier:
+            return identifier
+        return f"{type(server).__name__}-{id(server):x}"
+
+    def ttl_for(self, server: PlexServer, ttl_key: str) -> float:
+        """TTL for a category, lengthened while the server's alerts are live."""
+        if self.alerts_live is not None and ttl_key in self.alert_ttls and self.alerts_live(server):
+            return self.alert_ttls[ttl_key]
+        return self.ttls.get(ttl_key, self.cache.default_ttl)
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get statistics of the underlying cache.
+
+        Returns:
+            The cache's get_stats() dictionary
+        """
+        return self.cache.get_stats()
+
+    def _cached(
+        self,
+        server: PlexServer,
+        resource: str,
+        ttl_key: str,
+        fetch: Callable[[PlexServer], Iterable[Any]],
+        via: FetchRunner | None = None,
+        **params: Any,
+    ) -> list[Any]:
+        key = CacheKey.build(self.NAMESPACE, self.server_key(server), resource, **params)
+
+        # Only a miss reaches ``via``, so retries and circuit breaking see real requests.
+        def factory() -> list[Any]:
+            return list(fetch(server) if via is None else via(fetch))
+
+        value = self.cache.get_or_set(key, factory, ttl=self.ttl_for(server, ttl_key))
+        # Callers get their own list; the cached one is shared.
+        return list(value)
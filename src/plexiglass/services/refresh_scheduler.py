@@ -0,0 +1,209 @@
+"""
+Adaptive Refresh Scheduler for PlexiGlass.
+
+Decides when each server's dashboard data is polled again. Instead of one
+fixed interval for the whole fleet, every (server, endpoint) pair has its own
+next-due time: data that keeps coming back unchanged is polled less and less
+often, and polling snaps back to the base interval as soon as it changes.
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from collections.abc import Hashable
+from dataclasses import dataclass
+from typing import Any
+
+from plexiglass.config.performance import PerformanceConfig
+
+ScheduleKey = tuple[str, str]
+
+
+@dataclass
+class _Schedule:
+    interval: float
+    next_due: float
+    fingerprint: Hashable | None = None
+    observed: bool = False
+
+
+class RefreshScheduler:
+    """
+    Per-server, per-endpoint polling intervals with backoff and jitter.
+
+    Features:
+    - Keys are ``(server, endpoint)``; unknown keys are due immediately
+    - An observation equal to the previous one multiplies the key's interval
+      by ``backoff`` (up to ``max_interval``); a change, or ``snap_back``,
+      resets it to ``base_interval``
+    - Failed polls back off like unchanged ones, so an unreachable server
+      isn't hammered
+    - Every next-due time is jittered by up to ``jitter`` of the interval, so
+      servers that started together drift apart instead of firing on one tick
+
+    Example:
+        >>> scheduler = RefreshScheduler(base_interval=5, max_interval=60)
+        >>> scheduler.is_due(("Home Server", "now_playing"))
+        True
+        >>> scheduler.observe(("Home Server", "now_playing"), fingerprint)
+        True
+        >>> scheduler.interval(("Home Server", "now_playing"))
+        5.0
+    """
+
+    def __init__(
+        self,
+        base_interval: float = PerformanceConfig.DEFAULT_REFRESH_INTERVAL,
+        max_interval: float = PerformanceConfig.DEFAULT_REFRESH_MAX_INTERVAL,
+        backoff: float = PerformanceConfig.DEFAULT_REFRESH_BACKOFF,
+        jitter: float = PerformanceConfig.DEFAULT_REFRESH_JITTER,
+        rng: random.Random | None = None,
+    ) -> None:
+        """
+        Initialize the scheduler.
+
+        Args:
+            base_interval: Seconds between polls of data that is changing
+            max_interval: Upper bound for backed-off intervals
+            backoff: Interval multiplier per unchanged poll (1 = no backoff)
+            jitter: Fraction of the interval next-due times are randomized by
+            rng: Random source for jitter (default: a private Random instance)
+        """
+        self.base_interval = max(0.1, float(base_interval))
+        self.max_interval = max(self.base_interval, float(max_interval))
+        self.backoff = max(1.0, float(backoff))
+        self.jitter = min(max(0.0, float(jitter)), 0.5)
+        self._rng = rng or random.Random()
+        self._lock = threading.Lock()
+        self._schedules: dict[ScheduleKey, _Schedule] = {}
+        self._polls = 0
+        self._changes = 0
+        self._failures = 0
+
+    @classmethod
+    def from_settings(cls, settings: dict[str, Any] | None) -> RefreshScheduler:
+        """
+        Build a scheduler from ``ui.refresh_interval`` and ``performance.refresh_*``.
+
+        Args:
+            settings: Application settings (as returned by ConfigLoader.get_settings)
+        """
+        optimized = PerformanceConfig.get_optimized_settings(settings)
+        ui = (settings or {}).get("ui", {})
+        return cls(
+            base_interval=ui.get("refresh_interval", optimized["refresh_interval"]),
+            max_interval=optimized["refresh_max_interval"],
+            backoff=optimized["refresh_backoff"],
+            jitter=optimized["refresh_jitter"],
+        )
+
+    def is_due(self, key: ScheduleKey, now: float | None = None) -> bool:
+        """True if ``key`` has never been polled or its next-due time has passed."""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            schedule = self._schedules.get(key)
+            return schedule is None or schedule.next_due <= now
+
+    def observe(self, key: ScheduleKey, fingerprint: Hashable, now: float | None = None) -> bool:
+        """
+        Record a successful poll and schedule the next one.
+
+        Args:
+            key: ``(server, endpoint)`` that was polled
+            fingerprint: Value identifying the polled data; equal fingerprints
+                mean nothing changed
+            now: Monotonic time of the poll (default: now)
+
+        Returns:
+            True if the data changed (or was polled for the first time)
+        """
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            self._polls += 1
+            schedule = self._schedules.get(key)
+            changed = (
+                schedule is None or not schedule.observed or schedule.fingerprint != fingerprint
+            )
+            if changed:
+                self._changes += 1
+                interval = self.base_interval
+            else:
+                interval = min(schedule.interval * self.backoff, self.max_interval)
+            self._schedules[key] = _Schedule(
+                interval=interval,
+                next_due=now + self._jittered(interval),
+                fingerprint=fingerprint,
+                observed=True,
+            )
+        return changed
+
+    def observe_failure(self, key: ScheduleKey, now: float | None = None) -> None:
+        """
+        Record a failed poll; the key backs off as if nothing changed.
+
+        Args:
+            key: ``(server, endpoint)`` whose poll failed
+            now: Monotonic time of the poll (default: now)
+        """
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            self._polls += 1
+            self._failures += 1
+            schedule = self._schedules.get(key)
+            if schedule is None:
+                schedule = self._schedules[key] = _Schedule(
+                    interval=self.base_interval, next_due=now
+                )
+            else:
+                schedule.interval = min(schedule.interval * self.backoff, self.max_interval)
+            schedule.next_due = now + self._jittered(schedule.interval)
+
+    def snap_back(self, server: str | None = None, endpoint: str | None = None) -> None:
+        """
+        Reset intervals to the base and make the keys due now.
+
+        Args:
+            server: Server to reset (None = every server)
+            endpoint: Endpoint to reset (None = every endpoint)
+        """
+        with self._lock:
+            for (name, resource), schedule in self._schedules.items():
+                if server is not None and name != server:
+                    continue
+                if endpoint is not None and resource != endpoint:
+                    continue
+                schedule.interval = self.base_interval
+                schedule.next_due = 0.0
+
+    def interval(self, key: ScheduleKey) -> float:
+        """Current polling interval for ``key`` (the base interval if unknown)."""
+        with self._lock:
+            schedule = self._schedules.get(key)
+            return self.base_interval if schedule is None else schedule.interval
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get scheduler statistics.
+
+        Returns:
+            Dictionary with tracked keys, polls, polls that found a change,
+            failed polls and the current interval per key
+        """
+        with self._lock:
+            return {
+                "keys": len(self._schedules),
+                "polls": self._polls,
+                "changes": self._changes,
+                "failures": self._failures,
+                "intervals": {
+                    f"{name}/{resource}": schedule.interval
+                    for (name, resource), schedule in self._schedules.items()
+                },
+            }
+
+    def _jittered(self, interval: float) -> float:
+        if not self.jitter:
+            return interval
+        return interval * (1.0 + self._rng.uniform(-self.jitter, self.jitter))
@@ -3,18 +3,76 @@ Server Manager Service for PlexiGlass.
 
 This module provides multi-server connection management including:
 - Connection pooling for multiple Plex servers
-- Health checking and status monitoring
+- Concurrent batch connection (bounded by max_concurrent_requests)
+- Shared keep-alive HTTP session per server (sized by pool_max_size)
+- LRU-bounded connection pool (max_connected_servers) with idle-timeout eviction
+- Multi-URL servers: latency-raced endpoint selection with failover
+- Coalescing of identical in-flight GETs and optional hedging of slow ones
+  (see services.transport)
+- Background health probing (healthy / degraded / down) and status monitoring
+- Shared cached reads of sessions/sections/history (see services.plex_data_service),
+  invalidated by Plex alerts where available (see services.alert_invalidator)
+- Optional shared cache daemon for sessions/library stats (see services.cache_daemon)
 - Connection caching
 - Error handling for network/auth issues
 """
 
-from typing import Any
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Collection, Iterable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, TypeVar
 
+import requests
 from plexapi.exceptions import Unauthorized
 from plexapi.server import PlexServer
+from requests.adapters import HTTPAdapter
 
 from plexiglass.config.loader import ConfigLoader
-from plexiglass.services.exceptions import ConnectionError, ServerNotFoundError
+from plexiglass.config.performance import PerformanceConfig
+from plexiglass.services.alert_invalidator import AlertInvalidator
+from plexiglass.services.cache_daemon import CacheDaemonClient
+from plexiglass.services.circuit_breaker import CircuitBreaker
+from plexiglass.services.error_handler import ErrorHandler
+from plexiglass.services.exceptions import (
+    CircuitOpenError,
+    ConnectionError,
+    ServerNotFoundError,
+    ServiceError,
+)
+from plexiglass.services.health_prober import HealthProber, ServerHealth
+from plexiglass.services.plex_data_service import PlexDataService
+from plexiglass.services.transport import (
+    CoalescingHedgingSession,
+    CoalescingSession,
+    HedgingSession,
+)
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class ConnectionResult:
+    """Outcome of connecting to a single server as part of a batch."""
+
+    name: str
+    server: PlexServer | None = None
+    error: ServiceError | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass(frozen=True)
+class Endpoint:
+    """The URL a server connection is using, with its measured round-trip time."""
+
+    url: str
+    rtt_ms: float | None = None
 
 
 class ServerManager:
@@ -22,9 +80,12 @@ class ServerManager:
     Manages connections to multiple Plex Media Servers.
 
     Features:
-    - Multi-server connection pooling
+    - Multi-server connection pooling (LRU-bounded, idle connections closed)
+    - Parallel connect_all / connect_many
+    - Keep-alive HTTP connection reuse per server
+    - Fastest-of-N endpoint selection (LAN / WAN / relay) with failover
     - Connection caching (lazy loading)
-    - Health status monitoring
+    - Health status monitoring (down servers are skipped, not waited on)
     - Read-only server protection
     - Graceful error handling
 
@@ -45,7 +106,85 @@ class ServerManager:
             config_loader: ConfigLoader instance with loaded configuration
         """
         self.config_loader = config_loader
-        self._connection_pool: dict[str, PlexServer] = {}
+        # Ordered least- to most-recently used; _last_used holds monotonic timestamps.
+        self._connection_pool: OrderedDict[str, PlexServer] = OrderedDict()
+        self._last_used: dict[str, float] = {}
+        self._http_sessions: dict[str, requests.Session] = {}
+        self._endpoints: dict[str, Endpoint] = {}
+        # Servers the dashboard polls; never evicted for capacity.
+        self._pinned: set[str] = set()
+        self._pool_lock = threading.RLock()
+        self._pool_hits = 0
+        self._pool_misses = 0
+        self._pool_evictions = 0
+        self.health = HealthProber(
+            probe=self.probe_server,
+            targets=self.get_connected_servers,
+            interval=float(
+                self._get_performance_setting(
+                    "health_check_interval", PerformanceConfig.DEFAULT_HEALTH_CHECK_INTERVAL
+                )
+            ),
+            max_workers=int(self._get_performance_setting("max_concurrent_requests", 5)),
+        )
+        self.error_handler = ErrorHandler(
+            retry_count=int(
+                self._get_performance_setting("max_retries", PerformanceConfig.DEFAULT_MAX_RETRIES)
+            ),
+            retry_delay=float(
+                self._get_performance_setting(
+                    "retry_base_delay", PerformanceConfig.DEFAULT_RETRY_BASE_DELAY
+                )
+            ),
+            max_retry_delay=float(
+                self._get_performance_setting(
+                    "retry_max_delay", PerformanceConfig.DEFAULT_RETRY_MAX_DELAY
+                )
+            ),
+            circuit_breaker=CircuitBreaker(
+                failure_threshold=int(
+                    self._get_performance_setting(
+                        "circuit_failure_threshold",
+                        PerformanceConfig.DEFAULT_CIRCUIT_FAILURE_THRESHOLD,
+                    )
+                ),
+                recovery_timeout=float(
+                    self._get_performance_setting(
+                        "circuit_recovery_timeout",
+                        PerformanceConfig.DEFAULT_CIRCUIT_RECOVERY_TIMEOUT,
+                    )
+                ),
+            ),
+        )
+        daemon_socket = self._get_performance_setting(
+            "cache_daemon_socket", PerformanceConfig.DEFAULT_CACHE_DAEMON_SOCKET
+        )
+        self.cache_daemon = (
+            CacheDaemonClient(
+                daemon_socket,
+                # The daemon may be mid-fetch for us; give it as long as a fetch takes.
+                read_timeout=float(
+                    self._get_performance_setting(
+                        "connection_timeout", PerformanceConfig.DEFAULT_CONNECTION_TIMEOUT
+                    )
+                ),
+            )
+            if daemon_socket
+            else None
+        )
+        self.data = PlexDataService.from_settings(self.config_loader.get_settings())
+        self.alerts = AlertInvalidator(
+            self.data,
+            enabled=bool(
+                self._get_performance_setting(
+                    "alert_listener", PerformanceConfig.DEFAULT_ALERT_LISTENER
+                )
+            ),
+        )
+        self.data.alerts_live = self.alerts.is_live
+        self._session_listeners: list[Callable[[str, list[dict[str, Any]] | None], None]] = []
+        # Per server: session key -> ((view_offset, state), when first seen).
+        self._playback_anchors: dict[str, dict[str, tuple[tuple[Any, Any], datetime]]] = {}
 
     def connect_to_default(self) -> PlexServer:
         """
@@ -84,43 +223,449 @@ class ServerManager:
         Raises:
             ServerNotFoundError: If server name not found in configuration
             ConnectionError: If connection fails
+            CircuitOpenError: If the server failed repeatedly and its circuit is open
         """
+        self.evict_idle_connections()
+
         # Return cached connection if available
-        if name in self._connection_pool:
-            return self._connection_pool[name]
+        with self._pool_lock:
+            cached = self._touch(name)
+            if cached is not None:
+                self._pool_hits += 1
+                return cached
+            self._pool_misses += 1
 
         # Get server configuration
         server_config = self.config_loader.get_server_by_name(name)
         if not server_config:
             raise ServerNotFoundError(f"Server '{name}' not found in configuration")
 
-        # Attempt connection
+        # Attempt connection over a dedicated keep-alive session; a single attempt,
+        # but a server whose circuit is open fails fast instead of timing out again
+        session = self._build_http_session(server_config)
         try:
-            server = PlexServer(
-                baseurl=server_config["url"],
-                token=server_config["token"],
-                timeout=self.config_loader.get_settings()
-                .get("performance", {})
-                .get("connection_timeout", 30),
-            )
 
-            # Cache the connection
-            self._connection_pool[name] = server
+            def open_fastest() -> tuple[Endpoint, PlexServer]:
+                endpoint = self._race_endpoints(server_config, self._candidate_urls(server_config))
+                return endpoint, self._open_server(server_config, endpoint.url, session)
 
+            endpoint, server = self.error_handler.call_with_retry(
+                open_fastest, key=name, retry_count=1
+            )
+
+            # Cache the connection (another thread may have won the race)
+            with self._pool_lock:
+                cached = self._touch(name)
+                if cached is not None:
+                    session.close()
+                    return cached
+                self._connection_pool[name] = server
+                self._http_sessions[name] = session
+                self._endpoints[name] = endpoint
+                self._last_used[name] = time.monotonic()
+                evicted = self._evict_over_capacity(keep=name)
+                pooled = self._connection_pool.get(name) is server
+            self._close_sessions(evicted)
+            if pooled:
+                self.alerts.watch(server)
             return server
 
         except Unauthorized as e:
+            session.close()
             raise ConnectionError(
                 f"Unauthorized: Failed to connect to '{name}'. Check your Plex token. Error: {e}"
             ) from e
+        except CircuitOpenError:
+            session.close()
+            raise
         except TimeoutError as e:
+            session.close()
             raise ConnectionError(
                 f"Connection timeout: Failed to connect to '{name}' at "
                 f"{server_config['url']}. Error: {e}"
             ) from e
         except Exception as e:
+            session.close()
             raise ConnectionError(f"Failed to connect to server '{name}': {e}") from e
 
+    def _open_server(
+        self, server_config: dict[str, Any], url: str, session: requests.Session
+    ) -> PlexServer:
+        return PlexServer(
+            baseurl=url,
+            token=server_config["token"],
+            session=session,
+            timeout=self._get_performance_setting("connection_timeout", 30),
+        )
+
+    @staticmethod
+    def _candidate_urls(server_config: dict[str, Any]) -> list[str]:
+        """Candidate URLs for a server, in configured order."""
+        return list(dict.fromkeys(server_config.get("urls") or [server_config["url"]]))
+
+    def _race_endpoints(
+        self, server_config: dict[str, Any], urls: list[str], probe_single: bool = False
+    ) -> Endpoint:
+        """
+        Probe every candidate URL in parallel and return the first to answer.
+
+        A single candidate is returned as-is without probing (unless
+        ``probe_single``). If no candidate answers, the first is returned with
+        no RTT so the real connect attempt reports the error.
+
+        Args:
+            server_config: Server configuration (token / ssl_verify)
+            urls: Candidate base URLs
+            probe_single: Probe a lone candidate too, so the caller can tell
+                whether it answered
+
+        Returns:
+            Endpoint for the fastest responsive URL
+        """
+        if len(urls) <= 1 and not probe_single:
+            return Endpoint(url=urls[0])
+
+        timeout = self._get_performance_setting(
+            "health_probe_timeout", PerformanceConfig.DEFAULT_HEALTH_PROBE_TIMEOUT
+        )
+        executor = ThreadPoolExecutor(
+            max_workers=len(urls), thread_name_prefix="plex-endpoint-race"
+        )
+        futures = {
+            executor.submit(self._measure_endpoint, server_config, url, timeout): url
+            for url in urls
+        }
+        try:
+            for future in as_completed(futures):
+                try:
+                    rtt_ms = future.result()
+                except Exception:
+                    continue
+                return Endpoint(url=futures[future], rtt_ms=rtt_ms)
+        finally:
+            # Losers finish in the background; nobody waits for the slowest route.
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        return Endpoint(url=urls[0])
+
+    @staticmethod
+    def _measure_endpoint(server_config: dict[str, Any], url: str, timeout: float) -> float:
+        """
+        Time a GET /identity against one candidate URL.
+
+        Returns:
+            Round-trip time in milliseconds
+
+        Raises:
+            requests.RequestException: If the endpoint does not answer successfully
+        """
+        started = time.perf_counter()
+        response = requests.get(
+            f"{url.rstrip('/')}/identity",
+            headers={"X-Plex-Token": server_config["token"], "Accept": "application/json"},
+            timeout=timeout,
+            verify=bool(server_config.get("ssl_verify", True)),
+        )
+        response.raise_for_status()
+        return (time.perf_counter() - started) * 1000.0
+
+    def _failover(self, name: str, require_answer: bool = False) -> PlexServer | None:
+        """
+        Move a connected server to the fastest of its other candidate URLs.
+
+        Args:
+            name: Server name whose current endpoint is failing
+            require_answer: Only switch to a URL that answered the race, so a
+                fully unreachable server fails fast instead of waiting out a
+                connect timeout
+
+        Returns:
+            The replacement PlexServer, or None if there is nothing to fail over to
+        """
+        server_config = self.config_loader.get_server_by_name(name)
+        with self._pool_lock:
+            current = self._endpoints.get(name)
+            session = self._http_sessions.get(name)
+        if not server_config or current is None or session is None:
+            return None
+
+        alternatives = [url for url in self._candidate_urls(server_config) if url != current.url]
+        if not alternatives:
+            return None
+
+        endpoint = self._race_endpoints(server_config, alternatives, probe_single=require_answer)
+        if require_answer and endpoint.rtt_ms is None:
+            return None
+        try:
+            server = self._open_server(server_config, endpoint.url, session)
+        except Exception:
+            return None
+
+        with self._pool_lock:
+            if name not in self._connection_pool:
+                return None
+            self._connection_pool[name] = server
+            self._endpoints[name] = endpoint
+        # Failures counted against the old endpoint say nothing about the new one.
+        self.error_handler.circuit_breaker.reset(name)
+        self.alerts.watch(server)
+        return server
+
+    def _call_with_failover(
+        self, name: str, server: PlexServer, fetch: Callable[[PlexServer], T]
+    ) -> T:
+        """
+        Run a fetch against a server, failing over to another endpoint on transport errors.
+
+        Args:
+            name: Server name (circuit breaker key)
+            server: Connected server to fetch from
+            fetch: Blocking fetch taking the server
+
+        Returns:
+            The fetch result
+        """
+        try:
+            return self.error_handler.call_with_retry(lambda: fetch(server), key=name)
+        except Exception as e:
+            if not self.error_handler.is_retryable_error(e):
+                raise
+            replacement = self._failover(name)
+            if replacement is None:
+                raise
+            return self.error_handler.call_with_retry(lambda: fetch(replacement), key=name)
+
+    def _failover_runner(
+        self, name: str, server: PlexServer
+    ) -> Callable[[Callable[[PlexServer], T]], T]:
+        """
+        Wrap _call_with_failover for PlexDataService's ``via``.
+
+        Passing this instead of wrapping the cached read keeps cache hits out
+        of the circuit breaker: they neither count as successes nor get
+        refused while the circuit is open.
+        """
+        return lambda fetch: self._call_with_failover(name, server, fetch)
+
+    def get_endpoint(self, name: str) -> Endpoint | None:
+        """
+        Get the endpoint a connected server is using.
+
+        Args:
+            name: Server name
+
+        Returns:
+            Endpoint (URL and measured RTT), or None if not connected
+        """
+        with self._pool_lock:
+            return self._endpoints.get(name)
+
+    def _build_http_session(self, server_config: dict[str, Any]) -> requests.Session:
+        """
+        Build the keep-alive HTTP session shared by every request to one server.
+
+        The adapter keeps up to ``_connections_per_server()`` sockets open so
+        concurrent fetches reuse TCP/TLS connections instead of re-handshaking.
+        With ``coalesce_requests`` (default) identical concurrent GETs share
+        one response; with ``hedge_requests`` the session hedges slow GETs.
+        """
+        session = self._new_http_session()
+        session.verify = bool(server_config.get("ssl_verify", True))
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self._connections_per_server())
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def _new_http_session(self) -> requests.Session:
+        coalesce = bool(
+            self._get_performance_setting(
+                "coalesce_requests", PerformanceConfig.DEFAULT_COALESCE_REQUESTS
+            )
+        )
+        if not self._get_performance_setting(
+            "hedge_requests", PerformanceConfig.DEFAULT_HEDGE_REQUESTS
+        ):
+            return CoalescingSession() if coalesce else requests.Session()
+
+        session_class = CoalescingHedgingSession if coalesce else HedgingSession
+        return session_class(
+            percentile=float(
+                self._get_performance_setting(
+                    "hedge_percentile", PerformanceConfig.DEFAULT_HEDGE_PERCENTILE
+                )
+            ),
+            max_extra_ratio=float(
+                self._get_performance_setting(
+                    "hedge_max_extra_ratio", PerformanceConfig.DEFAULT_HEDGE_MAX_EXTRA_RATIO
+                )
+            ),
+            min_samples=int(
+                self._get_performance_setting(
+                    "hedge_min_samples", PerformanceConfig.DEFAULT_HEDGE_MIN_SAMPLES
+                )
+            ),
+            # Room for a primary and its hedge per concurrent request.
+            max_workers=2 * self._connections_per_server(),
+        )
+
+    def _connections_per_server(self) -> int:
+        """
+        Keep-alive connections to hold open per server.
+
+        A server never needs more sockets than ``max_concurrent_requests``;
+        ``pool_max_size`` (when set) caps it further.
+        """
+        concurrent = max(1, int(self._get_performance_setting("max_concurrent_requests", 5)))
+        pool_max_size = int(self._get_performance_setting("pool_max_size", 0) or 0)
+        if pool_max_size > 0:
+            return min(concurrent, pool_max_size)
+        return concurrent
+
+    def connect_many(self, names: list[str]) -> dict[str, ConnectionResult]:
+        """
+        Connect to several servers in parallel.
+
+        Concurrency is bounded by ``performance.max_concurrent_requests``. A failing
+        server never aborts the batch; its error is reported in its result instead.
+
+        Args:
+            names: Server names as defined in configuration
+
+        Returns:
+            Mapping of server name to ConnectionResult, in the order given
+        """
+        unique_names = list(dict.fromkeys(names))
+        if not unique_names:
+            return {}
+
+        max_workers = max(1, int(self._get_performance_setting("max_concurrent_requests", 5)))
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(unique_names)),
+            thread_name_prefix="plex-connect",
+        ) as executor:
+            results = list(executor.map(self._connect_for_batch, unique_names))
+
+        return {result.name: result for result in results}
+
+    def connect_all(self) -> dict[str, ConnectionResult]:
+        """
+        Connect to every configured server in parallel.
+
+        Returns:
+            Mapping of server name to ConnectionResult
+        """
+        return self.connect_many(self.get_all_server_names())
+
+    def _connect_for_batch(self, name: str) -> ConnectionResult:
+        try:
+            return ConnectionResult(name=name, server=self.connect_to_server(name))
+        except ServiceError as e:
+            return ConnectionResult(name=name, error=e)
+        except Exception as e:
+            return ConnectionResult(name=name, error=ConnectionError(str(e)))
+
+    def _get_performance_setting(self, key: str, default: Any) -> Any:
+        return self.config_loader.get_settings().get("performance", {}).get(key, default)
+
+    def _touch(self, name: str) -> PlexServer | None:
+        """Mark a pooled connection as most recently used (caller holds the lock)."""
+        server = self._connection_pool.get(name)
+        if server is not None:
+            self._connection_pool.move_to_end(name)
+            self._last_used[name] = time.monotonic()
+        return server
+
+    def _remove_locked(self, name: str) -> requests.Session | None:
+        """Drop a connection from the pool (caller holds the lock)."""
+        server = self._connection_pool.pop(name, None)
+        if server is not None:
+            self.alerts.unwatch(server)
+        self._last_used.pop(name, None)
+        self._endpoints.pop(name, None)
+        self._playback_anchors.pop(name, None)
+        self.health.forget(name)
+        return self._http_sessions.pop(name, None)
+
+    def _evict_over_capacity(self, keep: str | None = None) -> list[requests.Session]:
+        """
+        Evict least-recently-used connections beyond max_connected_servers (caller holds lock).
+
+        Pinned servers and ``keep`` (the connection just made) are skipped, so
+        the pool may stay above the limit when every other connection is pinned.
+        """
+        max_size = int(
+            self._get_performance_setting(
+                "max_connected_servers", PerformanceConfig.DEFAULT_MAX_CONNECTED_SERVERS
+            )
+            or 0
+        )
+        evicted: list[requests.Session] = []
+        if max_size <= 0:
+            return evicted
+        candidates = [
+            name for name in self._connection_pool if name not in self._pinned and name != keep
+        ]
+        excess = len(self._connection_pool) - max_size
+        for name in candidates[: max(0, excess)]:
+            session = self._remove_locked(name)
+            self._pool_evictions += 1
+            if session is not None:
+                evicted.append(session)
+        return evicted
+
+    def set_pinned_servers(self, names: Iterable[str]) -> None:
+        """
+        Exempt servers from capacity eviction (replaces the previous set).
+
+        The dashboard pins the servers it is fetching from (due this tick or
+        still in flight), so max_connected_servers only evicts connections no
+        fetch is using; backed-off servers reconnect when they are next due.
+        Idle-timeout eviction still applies to pinned servers.
+
+        Args:
+            names: Server names to keep connected
+        """
+        with self._pool_lock:
+            self._pinned = set(names)
+
+    @staticmethod
+    def _close_sessions(sessions: list[requests.Session]) -> None:
+        for session in sessions:
+            session.close()
+
+    def evict_idle_connections(self) -> list[str]:
+        """
+        Close connections unused for longer than ``performance.pool_idle_timeout``.
+
+        The pool is kept in recency order, so only the idle prefix is visited.
+
+        Returns:
+            Names of the servers whose connections were closed
+        """
+        idle_timeout = float(
+            self._get_performance_setting(
+                "pool_idle_timeout", PerformanceConfig.DEFAULT_POOL_IDLE_TIMEOUT
+            )
+            or 0
+        )
+        if idle_timeout <= 0:
+            return []
+
+        cutoff = time.monotonic() - idle_timeout
+        evicted_names: list[str] = []
+        sessions: list[requests.Session] = []
+        with self._pool_lock:
+            for name in list(self._connection_pool):
+                if self._last_used.get(name, 0.0) > cutoff:
+                    break
+                session = self._remove_locked(name)
+                self._pool_evictions += 1
+                evicted_names.append(name)
+                if session is not None:
+                    sessions.append(session)
+        self._close_sessions(sessions)
+        return evicted_names
+
     def disconnect_server(self, name: str) -> None:
         """
         Disconnect from a specific server.
@@ -130,16 +675,97 @@ class ServerManager:
         Args:
             name: Server name to disconnect
         """
-        if name in self._connection_pool:
-            del self._connection_pool[name]
+        with self._pool_lock:
+            session = self._remove_locked(name)
+        if session is not None:
+            session.close()
 
     def disconnect_all(self) -> None:
         """
         Disconnect from all servers.
 
-        Clears the entire connection pool.
+        Clears the entire connection pool and closes every HTTP session.
+        """
+        with self._pool_lock:
+            for name in self._connection_pool:
+                self.health.forget(name)
+            self._connection_pool.clear()
+            self.alerts.unwatch_all()
+            self._last_used.clear()
+            self._endpoints.clear()
+            self._playback_anchors.clear()
+            sessions = list(self._http_sessions.values())
+            self._http_sessions.clear()
+        self._close_sessions(sessions)
+
+    def shutdown(self) -> None:
+        """
+        Release everything the manager holds before it is discarded.
+
+        Stops health probing, unsubscribes session listeners, closes every
+        connection (and with it each server's alert listener) and stops the
+        data cache's background refreshes.
+        """
+        self.stop_health_probing()
+        with self._pool_lock:
+            had_listeners = bool(self._session_listeners)
+            self._session_listeners.clear()
+        if had_listeners:
+            self.alerts.remove_session_listener(self._dispatch_play_states)
+        self.disconnect_all()
+        self.data.cache.shutdown()
+
+    def add_session_listener(
+        self, listener: Callable[[str, list[dict[str, Any]] | None], None]
+    ) -> None:
         """
-        self._connection_pool.clear()
+        Receive play state notifications from connected servers' alerts.
+
+        While any listener is subscribed, a session changing state no longer
+        drops the cached session list: listeners patch it in place, and only
+        sessions appearing or stopping trigger a re-fetch.
+
+        Args:
+            listener: Called from the alert thread with the server name and
+                its PlaySessionStateNotification entries, or with None when
+                the server's alert listener is lost
+        """
+        with self._pool_lock:
+            if listener in self._session_listeners:
+                return
+            self._session_listeners.append(listener)
+            first = len(self._session_listeners) == 1
+        if first:
+            self.alerts.add_session_listener(self._dispatch_play_states)
+
+    def remove_session_listener(
+        self, listener: Callable[[str, list[dict[str, Any]] | None], None]
+    ) -> None:
+        """Unsubscribe a listener passed to add_session_listener()."""
+        with self._pool_lock:
+            if listener not in self._session_listeners:
+                return
+            self._session_listeners.remove(listener)
+            last = not self._session_listeners
+        if last:
+            self.alerts.remove_session_listener(self._dispatch_play_states)
+
+    def _dispatch_play_states(self, server: PlexServer, notes: list[dict[str, Any]] | None) -> None:
+        key = self.data.server_key(server)
+        with self._pool_lock:
+            name = next(
+                (
+                    name
+                    for name, connected in self._connection_pool.items()
+                    if connected is server or self.data.server_key(connected) == key
+                ),
+                None,
+            )
+            listeners = list(self._session_listeners)
+        if name is None:
+            return
+        for listener in listeners:
+            listener(name, notes)
 
     def get_connected_servers(self) -> list[str]:
         """
@@ -148,7 +774,8 @@ class ServerManager:
         Returns:
             List of server names that are currently connected
         """
-        return list(self._connection_pool.keys())
+        with self._pool_lock:
+            return list(self._connection_pool.keys())
 
     def get_all_server_names(self) -> list[str]:
         """
@@ -169,19 +796,32 @@ class ServerManager:
         """
         return len(self.config_loader.get_servers())
 
-    def get_server_status(self, name: str) -> dict[str, Any]:
+    def get_server_status(
+        self, name: str, resources: Collection[str] | None = None
+    ) -> dict[str, Any]:
         """
         Get status information for a specific server.
 
         Args:
             name: Server name to check status
+            resources: Data to fetch, "now_playing" and/or "library_stats"
+                (None = both); skipped ones keep their zero defaults
 
         Returns:
             Dictionary with status information:
             - connected: bool
+            - url: Endpoint in use (configured primary URL if not connected)
+            - endpoint_rtt_ms: RTT measured when the endpoint was raced (if any)
             - version: str (if connected)
             - platform: str (if connected)
             - friendly_name: str (if connected)
+            - health: Prober state (healthy / degraded / down / unknown)
+            - latency_ms: Latency EWMA from the health prober (if probed)
+
+        Servers the prober has marked down are not queried for sessions or
+        libraries, so an unreachable server costs nothing per refresh. Fetches
+        go through the error handler's circuit breaker, so a flapping server
+        costs one fast failure per refresh rather than a timeout per call.
 
         Raises:
             ServerNotFoundError: If server name not found in configuration
@@ -190,36 +830,133 @@ class ServerManager:
         if not server_config:
             raise ServerNotFoundError(f"Server '{name}' not found in configuration")
 
+        with self._pool_lock:
+            server = self._touch(name)
+            endpoint = self._endpoints.get(name)
+
         status: dict[str, Any] = {
-            "connected": name in self._connection_pool,
+            "connected": server is not None,
             "name": name,
-            "url": server_config["url"],
+            "url": endpoint.url if endpoint is not None else server_config["url"],
+            "endpoint_rtt_ms": endpoint.rtt_ms if endpoint is not None else None,
             "session_count": 0,
             "now_playing": [],
             "library_count": 0,
             "library_items": 0,
         }
 
-        if name in self._connection_pool:
-            server = self._connection_pool[name]
+        health = self.health.get_health(name)
+        status["health"] = health.state.value
+        status["latency_ms"] = health.latency_ewma_ms
+
+        if server is not None:
             status["version"] = server.version
             status["platform"] = server.platform
             status["friendly_name"] = server.friendlyName
 
-            sessions = self._safe_get_sessions(server)
-            status["session_count"] = len(sessions)
-            status["now_playing"] = [self._build_now_playing_entry(session) for session in sessions]
-
-            library_stats = self._get_library_stats(server)
-            status["library_count"] = library_stats["library_count"]
-            status["library_items"] = library_stats["library_items"]
+            if health.is_down:
+                return status
+
+            if resources is None or "now_playing" in resources:
+                now_playing = self._fetch_shared(
+                    name,
+                    "now_playing",
+                    lambda: [
+                        self._build_now_playing_entry(session)
+                        for session in self._safe_get_sessions(name, server)
+                    ],
+                    fallback=[],
+                )
+                status["session_count"] = len(now_playing)
+                status["now_playing"] = self._anchor_sessions(name, now_playing)
+
+            if resources is None or "library_stats" in resources:
+                library_stats = self._fetch_shared(
+                    name,
+                    "library_stats",
+                    lambda: self._get_library_stats(name, server),
+                    fallback={"library_count": 0, "library_items": 0},
+                )
+                status["library_count"] = library_stats["library_count"]
+                status["library_items"] = library_stats["library_items"]
 
         return status
 
-    @staticmethod
-    def _safe_get_sessions(server: PlexServer) -> list[Any]:
+    def fetch_resource(self, name: str, resource: str) -> Any:
+        """
+        Fetch one shareable resource directly from a server.
+
+        This is what the cache daemon calls on behalf of its clients; unlike
+        get_server_status, failures are raised rather than replaced with zeros.
+
+        Args:
+            name: Server name as defined in configuration
+            resource: "now_playing" (list of session entries) or
+                "library_stats" (library_count / library_items)
+
+        Returns:
+            JSON-serializable resource value
+
+        Raises:
+            ValueError: Unknown resource
+            ServerNotFoundError: If server name not found in configuration
+            ConnectionError: If the server can't be reached
+        """
+        if resource not in ("now_playing", "library_stats"):
+            raise ValueError(f"Unknown resource '{resource}'")
+        server = self.connect_to_server(name)
+        if resource == "now_playing":
+            sessions = self.data.sessions(server, via=self._failover_runner(name, server))
+            return [self._build_now_playing_entry(session) for session in sessions]
+        sections = self.data.sections(server, via=self._failover_runner(name, server))
+        return self._summarize_sections(sections)
+
+    def _fetch_shared(
+        self, name: str, resource: str, direct: Callable[[], Any], fallback: Any
+    ) -> Any:
+        """
+        Get a resource through the cache daemon when one is configured.
+
+        Only if nothing accepts the connection is the resource fetched
+        directly. Once connected, an error reply, a reply slower than the
+        fetch timeout or a garbled one all yield ``fallback``, so a busy
+        daemon doesn't turn into every TUI hitting a struggling server on its own.
+        """
+        if self.cache_daemon is None:
+            return direct()
         try:
-            return list(server.sessions())
+            return self.cache_daemon.fetch(name, resource)
+        except ConnectionError:
+            return direct()
+        except ServiceError:
+            return fallback
+
+    def _anchor_sessions(self, name: str, entries: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Stamp now-playing entries with ``observed_at`` for progress extrapolation.
+
+        ``observed_at`` is when the entry's viewOffset and state were first
+        seen, not when it was built: a session list served from cache repeats
+        the same offset, and re-stamping it would make progress jump back.
+        """
+        now = datetime.now()
+        anchored: list[dict[str, Any]] = []
+        with self._pool_lock:
+            previous = self._playback_anchors.get(name, {})
+            current: dict[str, tuple[tuple[Any, Any], datetime]] = {}
+            for entry in entries:
+                observation = (entry.get("view_offset"), entry.get("state"))
+                known = previous.get(str(entry.get("session_key")))
+                observed_at = known[1] if known is not None and known[0] == observation else now
+                if entry.get("session_key") is not None:
+                    current[str(entry["session_key"])] = (observation, observed_at)
+                anchored.append({**entry, "observed_at": observed_at})
+            self._playback_anchors[name] = current
+        return anchored
+
+    def _safe_get_sessions(self, name: str, server: PlexServer) -> list[Any]:
+        try:
+            return self.data.sessions(server, via=self._failover_runner(name, server))
         except Exception:
             return []
 
@@ -234,13 +971,27 @@ class ServerManager:
         state = getattr(session, "state", None) or "unknown"
         progress_percent = ServerManager._calculate_progress(session)
 
+        session_key = getattr(session, "sessionKey", None)
+
         return {
             "title": title,
             "user": user,
             "state": state,
             "progress_percent": progress_percent,
+            "session_key": None if session_key is None else str(session_key),
+            "view_offset": ServerManager._optional_int(getattr(session, "viewOffset", None)),
+            "duration": ServerManager._optional_int(getattr(session, "duration", None)),
         }
 
+    @staticmethod
+    def _optional_int(value: Any) -> int | None:
+        if value is None:
+            return None
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return None
+
     @staticmethod
     def _extract_session_user(session: Any) -> str:
         usernames = getattr(session, "usernames", None)
@@ -274,13 +1025,17 @@ class ServerManager:
 
         return max(0, min(progress, 100))
 
-    @staticmethod
-    def _get_library_stats(server: PlexServer) -> dict[str, int]:
+    def _get_library_stats(self, name: str, server: PlexServer) -> dict[str, int]:
         try:
-            sections = list(server.library.sections())
+            sections = self.data.sections(server, via=self._failover_runner(name, server))
         except Exception:
             return {"library_count": 0, "library_items": 0}
 
+        return self._summarize_sections(sections)
+
+    @staticmethod
+    def _summarize_sections(sections: Any) -> dict[str, int]:
+        sections = list(sections)
         item_count = 0
         for section in sections:
             item_count += int(getattr(section, "totalSize", 0) or 0)
@@ -311,24 +1066,86 @@ class ServerManager:
 
     def check_connection_health(self, name: str) -> bool:
         """
-        Check if a server connection is healthy.
+        Check if a server connection is healthy by probing it now.
 
         Args:
             name: Server name to check
 
         Returns:
-            True if connection is healthy, False otherwise
+            True if the server answered a live /identity probe, False otherwise
         """
-        if name not in self._connection_pool:
-            return False
+        with self._pool_lock:
+            if name not in self._connection_pool:
+                return False
+
+        return self.health.probe_now(name).consecutive_failures == 0
+
+    def probe_server(self, name: str) -> None:
+        """
+        Issue a lightweight live request (``/identity``) to a connected server.
+
+        Does not count as pool usage, so probing never keeps idle connections alive.
+        If the current endpoint fails and the server has other candidate URLs,
+        they are raced and the server fails over to one that answers, so a
+        multi-URL server that only lost one route recovers on the next probe.
+
+        Args:
+            name: Server name to probe
 
-        server = self._connection_pool[name]
+        Raises:
+            ConnectionError: If the server is not connected
+            Exception: Any transport error raised by plexapi
+        """
+        with self._pool_lock:
+            server = self._connection_pool.get(name)
+        if server is None:
+            raise ConnectionError(f"Server '{name}' is not connected")
+
+        timeout = self._get_performance_setting(
+            "health_probe_timeout", PerformanceConfig.DEFAULT_HEALTH_PROBE_TIMEOUT
+        )
         try:
-            # Try to access a lightweight property
-            _ = server.friendlyName
-            return True
+            server.query("/identity", timeout=timeout)
         except Exception:
-            return False
+            replacement = self._failover(name, require_answer=True)
+            if replacement is None:
+                raise
+            replacement.query("/identity", timeout=timeout)
+
+    def get_server_health(self, name: str) -> ServerHealth:
+        """
+        Get the latest background health record for a server.
+
+        Args:
+            name: Server name
+
+        Returns:
+            ServerHealth (state UNKNOWN if never probed)
+        """
+        return self.health.get_health(name)
+
+    def is_server_available(self, name: str) -> bool:
+        """
+        Check whether callers should talk to a server right now.
+
+        Returns False only when the prober has marked the server down.
+        """
+        return not self.health.is_down(name)
+
+    def get_default_server_name(self) -> str | None:
+        """Get the configured default server's name, if any."""
+        default_server_config = self.config_loader.get_default_server()
+        if not default_server_config:
+            return None
+        return default_server_config["name"]
+
+    def start_health_probing(self) -> None:
+        """Start the background health prober."""
+        self.health.start()
+
+    def stop_health_probing(self) -> None:
+        """Stop the background health prober."""
+        self.health.stop()
 
     def get_pool_statistics(self) -> dict[str, Any]:
         """
@@ -338,16 +1155,81 @@ class ServerManager:
             Dictionary with pool statistics:
             - pool_size: Current number of connections
             - connected_servers: List of connected server names
-            - max_pool_size: Configured maximum pool size (0 = unlimited)
+            - max_pool_size: Configured keep-alive sockets per server (pool_max_size)
+            - max_connected_servers: Servers kept connected at once (0 = unlimited)
+            - pinned_servers: Servers exempt from capacity eviction
+            - connections_per_server: Keep-alive sockets allowed per server
+            - http_pools: Per-server HTTP pool utilisation (plus coalescing and
+              hedging counters when enabled)
+            - http_connections_in_use: Sockets currently checked out (all servers)
+            - http_connections_opened: Sockets opened since connect (all servers)
+            - requests_coalesced: GETs answered by an identical in-flight GET
+              instead of the network (all servers)
+            - hits / misses: connect_to_server calls served from / missing the pool
+            - evictions: Connections closed for capacity or idleness
+            - idle_timeout: Seconds of inactivity before a connection is closed
         """
-        settings = self.config_loader.get_settings()
-        max_size = settings.get("performance", {}).get("pool_max_size", 0)
+        max_size = self._get_performance_setting("pool_max_size", 0)
+        self.evict_idle_connections()
+
+        with self._pool_lock:
+            connected = list(self._connection_pool.keys())
+            pinned = sorted(self._pinned)
+            sessions = dict(self._http_sessions)
+            hits, misses, evictions = self._pool_hits, self._pool_misses, self._pool_evictions
 
+        http_pools = {name: self._http_pool_usage(session) for name, session in sessions.items()}
         return {
-            "pool_size": len(self._connection_pool),
-            "connected_servers": list(self._connection_pool.keys()),
+            "pool_size": len(connected),
+            "connected_servers": connected,
             "max_pool_size": max_size,
+            "max_connected_servers": self._get_performance_setting(
+                "max_connected_servers", PerformanceConfig.DEFAULT_MAX_CONNECTED_SERVERS
+            ),
+            "pinned_servers": pinned,
+            "connections_per_server": self._connections_per_server(),
+            "http_pools": http_pools,
+            "http_connections_in_use": sum(pool["in_use"] for pool in http_pools.values()),
+            "http_connections_opened": sum(pool["opened"] for pool in http_pools.values()),
+            "requests_coalesced": sum(
+                pool.get("coalescing", {}).get("coalesced", 0) for pool in http_pools.values()
+            ),
+            "hits": hits,
+            "misses": misses,
+            "evictions": evictions,
+            "idle_timeout": self._get_performance_setting(
+                "pool_idle_timeout", PerformanceConfig.DEFAULT_POOL_IDLE_TIMEOUT
+            ),
+        }
+
+    @staticmethod
+    def _http_pool_usage(session: requests.Session) -> dict[str, Any]:
+        adapter = session.get_adapter("https://")
+        usage: dict[str, Any] = {
+            "max_connections": getattr(adapter, "_pool_maxsize", 0),
+            "hosts": 0,
+            "in_use": 0,
+            "opened": 0,
+            "requests": 0,
         }
+        if isinstance(session, CoalescingSession):
+            usage["coalescing"] = session.get_coalescing_stats()
+        if isinstance(session, HedgingSession):
+            usage["hedging"] = session.get_stats()
+        poolmanager = getattr(adapter, "poolmanager", None)
+        if poolmanager is None:
+            return usage
+
+        for key in list(poolmanager.pools.keys()):
+            pool = poolmanager.pools.get(key)
+            if pool is None:
+                continue
+            usage["hosts"] += 1
+            usage["opened"] += pool.num_connections
+            usage["requests"] += pool.num_requests
+            if pool.pool is not None:
+                usage["in_use"] += max(0, pool.pool.maxsize - pool.pool.qsize())
+        return usage
 
     def clear_connection_pool(self) -> None:
         """
@@ -355,4 +1237,4 @@ class ServerManager:
 
         Disconnects from all servers.
         """
-        self._connection_pool.clear()
+        self.disconnect_all()
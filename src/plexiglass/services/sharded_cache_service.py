@@ -0,0 +1,226 @@
+"""
+Sharded Cache Service for PlexiGlass.
+
+Spreads keys over several independently locked CacheService segments so
+worker threads (dashboard refresh, gallery demos) touching different keys
+don't queue on a single lock.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from plexiglass.config.performance import PerformanceConfig
+from plexiglass.services.cache_service import CacheService, KeyLike
+
+
+class ShardedCacheService:
+    """
+    Lock-striped cache: N CacheService shards, each with its own lock.
+
+    Features:
+    - Keys hash to one shard; operations on a key lock only that shard
+    - Same API as CacheService; capacity (entries and bytes) is split evenly
+      across shards
+    - Invalidation fans out to every shard and uses each shard's indexes
+    - Background refreshes of all shards share one pool of ``refresh_workers``
+      threads
+    - Statistics aggregated across shards
+
+    Example:
+        >>> cache = ShardedCacheService(shards=8, default_ttl=60)
+        >>> cache.set("user:1", {"name": "John"})
+        >>> cache.get("user:1")
+        {'name': 'John'}
+    """
+
+    def __init__(
+        self,
+        shards: int = PerformanceConfig.DEFAULT_CACHE_SHARDS,
+        default_ttl: int = 60,
+        max_entries: int | None = PerformanceConfig.DEFAULT_CACHE_SIZE,
+        refresh_workers: int = 2,
+        max_bytes: int | None = None,
+        sizer: Callable[[Any], int] | None = None,
+    ):
+        """
+        Initialize the sharded cache.
+
+        Args:
+            shards: Number of independently locked segments
+            default_ttl: Default time-to-live in seconds
+            max_entries: Total entry capacity across shards (None or 0 = unbounded)
+            refresh_workers: Stale-while-revalidate threads, one pool shared by
+                every shard
+            max_bytes: Total byte budget across shards (None or 0 = none)
+            sizer: Returns a value's size in bytes (see CacheService)
+        """
+        count = max(1, int(shards))
+        self.default_ttl = default_ttl
+        self.max_entries = max_entries or None
+        self.max_bytes = max_bytes or None
+        self.refresh_workers = max(1, int(refresh_workers))
+        # Threads start on the first refresh; idle shards cost nothing.
+        self._refresh_executor = ThreadPoolExecutor(
+            max_workers=self.refresh_workers, thread_name_prefix="cache-refresh"
+        )
+        self._shards = [
+            CacheService(
+                default_ttl=default_ttl,
+                max_entries=_split(self.max_entries, count),
+                refresh_workers=self.refresh_workers,
+                max_bytes=_split(self.max_bytes, count),
+                sizer=sizer,
+                refresh_executor=self._refresh_executor,
+            )
+            for _ in range(count)
+        ]
+
+    @classmethod
+    def from_settings(cls, settings: dict[str, Any] | None) -> ShardedCacheService:
+        """
+        Build a sharded cache from ``performance.cache_shards`` and the cache sizing settings.
+
+        Args:
+            settings: Application settings (as returned by ConfigLoader.get_settings)
+        """
+        optimized = PerformanceConfig.get_optimized_settings(settings)
+        return cls(
+            shards=optimized["cache_shards"],
+            default_ttl=optimized["cache_ttl"],
+            max_entries=optimized["cache_size"],
+            max_bytes=optimized["cache_max_bytes"],
+        )
+
+    @property
+    def shard_count(self) -> int:
+        return len(self._shards)
+
+    def _shard(self, key: KeyLike) -> CacheService:
+        return self._shards[hash(str(key)) % len(self._shards)]
+
+    def set(
+        self,
+        key: KeyLike,
+        value: Any,
+        ttl: int | None = None,
+        tags: Iterable[str] | None = None,
+    ) -> None:
+        """Set a value in the key's shard (see CacheService.set)."""
+        self._shard(key).set(key, value, ttl, tags)
+
+    def get(self, key: KeyLike, default: Any = None) -> Any:
+        """Get a value from the key's shard (see CacheService.get)."""
+        return self._shard(key).get(key, default)
+
+    def has(self, key: KeyLike) -> bool:
+        """Check the key's shard for a live entry."""
+        return self._shard(key).has(key)
+
+    def delete(self, key: KeyLike) -> None:
+        """Delete a key from its shard."""
+        self._shard(key).delete(key)
+
+    def get_or_set(self, key: KeyLike, factory: Callable[[], Any], **kwargs: Any) -> Any:
+        """
+        Get or compute a value in the key's shard.
+
+        Accepts the same keyword options as CacheService.get_or_set
+        (ttl, error_ttl, stale_if_error, stale_ttl, tags).
+        """
+        return self._shard(key).get_or_set(key, factory, **kwargs)
+
+    def clear(self) -> None:
+        """Clear every shard."""
+        for shard in self._shards:
+            shard.clear()
+
+    def size(self) -> int:
+        """Total number of live entries across shards."""
+        return sum(shard.size() for shard in self._shards)
+
+    def is_empty(self) -> bool:
+        return self.size() == 0
+
+    def invalidate_prefix(self, prefix: str) -> None:
+        """Invalidate keys starting with ``prefix`` in every shard."""
+        for shard in self._shards:
+            shard.invalidate_prefix(prefix)
+
+    def invalidate_pattern(self, pattern: str) -> None:
+        """Invalidate keys matching a glob pattern in every shard."""
+        for shard in self._shards:
+            shard.invalidate_pattern(pattern)
+
+    def invalidate_tags(self, tags: Iterable[str]) -> int:
+        """
+        Invalidate entries carrying any of the given tags in every shard.
+
+        Returns:
+            Number of keys invalidated
+        """
+        tag_list = list(tags)
+        return sum(shard.invalidate_tags(tag_list) for shard in self._shards)
+
+    def check_memory_pressure(self) -> int | None:
+        """
+        Re-check process memory and trim every shard.
+
+        Returns:
+            Total effective byte budget (None if the cache has none)
+        """
+        budgets = [shard.check_memory_pressure() for shard in self._shards]
+        if self.max_bytes is None:
+            return None
+        return sum(budget or 0 for budget in budgets)
+
+    def shutdown(self) -> None:
+        """Stop the shared background refresh pool without waiting for running refreshes."""
+        for shard in self._shards:
+            shard.shutdown()
+        self._refresh_executor.shutdown(wait=False, cancel_futures=True)
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get statistics aggregated across shards.
+
+        Returns:
+            Same keys as CacheService.get_stats, with counters summed,
+            hit_rate recomputed over all shards, and ``shards``
+        """
+        per_shard = [shard.get_stats() for shard in self._shards]
+        totals: dict[str, Any] = {
+            name: sum(stats[name] for stats in per_shard)
+            for name in (
+                "size",
+                "hits",
+                "misses",
+                "evictions",
+                "negative_hits",
+                "stale_served",
+                "background_refreshes",
+                "bytes",
+            )
+        }
+        lookups = totals["hits"] + totals["misses"]
+        totals["hit_rate"] = totals["hits"] / lookups if lookups > 0 else 0.0
+        totals["max_entries"] = self.max_entries
+        totals["max_bytes"] = self.max_bytes
+        totals["effective_max_bytes"] = (
+            None
+            if self.max_bytes is None
+            else sum(stats["effective_max_bytes"] for stats in per_shard)
+        )
+        totals["shards"] = len(self._shards)
+        return totals
+
+    make_key = staticmethod(CacheService.make_key)
+
+
+def _split(total: int | None, parts: int) -> int | None:
+    """Per-shard share of a capacity, rounded up (None stays None)."""
+    if total is None:
+        return None
+    return max(1, -(-total // parts))
@@ -0,0 +1,351 @@
+"""
+HTTP Transport for PlexiGlass.
+
+Provides the ``requests.Session`` subclasses handed to plexapi's PlexServer:
+
+- Coalescing: identical GETs already in flight share one response instead
+  of each going out on the wire
+- Hedging (optional): a read that is slower than usual gets a duplicate on
+  another connection, and whichever answers first wins
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from collections.abc import Mapping
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any
+from urllib.parse import urlsplit
+
+import requests
+
+
+class LatencyTracker:
+    """
+    Sliding window of recent request latencies per endpoint path.
+
+    Example:
+        >>> tracker = LatencyTracker(window=100)
+        >>> tracker.record("/status/sessions", 42.0)
+        >>> tracker.percentile("/status/sessions", 95)
+        42.0
+    """
+
+    def __init__(self, window: int = 100) -> None:
+        """
+        Initialize the tracker.
+
+        Args:
+            window: Latencies kept per endpoint
+        """
+        self.window = max(1, int(window))
+        self._samples: dict[str, deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, key: str, latency_ms: float) -> None:
+        """Record one observed latency for an endpoint."""
+        with self._lock:
+            samples = self._samples.get(key)
+            if samples is None:
+                samples = self._samples[key] = deque(maxlen=self.window)
+            samples.append(latency_ms)
+
+    def sample_count(self, key: str) -> int:
+        """Number of latencies currently held for an endpoint."""
+        with self._lock:
+            return len(self._samples.get(key, ()))
+
+    def percentile(self, key: str, percentile: float) -> float | None:
+        """
+        Get a latency percentile for an endpoint (nearest-rank).
+
+        Returns:
+            Latency in milliseconds, or None if nothing was recorded
+        """
+        with self._lock:
+            samples = sorted(self._samples.get(key, ()))
+        if not samples:
+            return None
+        rank = min(len(samples) - 1, max(0, round(percentile / 100 * len(samples)) - 1))
+        return samples[rank]
+
+
+class HedgeBudget:
+    """
+    Token bucket capping hedged (duplicate) requests to a fraction of traffic.
+
+    Every request deposits ``ratio`` tokens; a hedge spends one. With
+    ``ratio=0.1`` at most ~10% extra requests are sent, with a small burst.
+    """
+
+    def __init__(self, ratio: float = 0.1, burst: float = 3.0) -> None:
+        """
+        Initialize the budget.
+
+        Args:
+            ratio: Hedges allowed per request, on average
+            burst: Maximum tokens that can accumulate
+        """
+        self.ratio = max(0.0, float(ratio))
+        self.burst = max(1.0, float(burst))
+        self._tokens = 0.0
+        self._lock = threading.Lock()
+
+    def deposit(self) -> None:
+        """Credit the budget for one request."""
+        with self._lock:
+            self._tokens = min(self.burst, self._tokens + self.ratio)
+
+    def try_spend(self) -> bool:
+        """Spend one token for a hedge; False if the budget is exhausted."""
+        with self._lock:
+            # Tolerance: ten deposits of 0.1 sum to 0.999...
+            if self._tokens < 1.0 - 1e-9:
+                return False
+            self._tokens -= 1.0
+            return True
+
+
+class HedgingSession(requests.Session):
+    """
+    Session that hedges slow idempotent GETs.
+
+    Features:
+    - Per-endpoint latency tracking; the hedge delay is a configurable
+      percentile of recent latency (no hedging until ``min_samples`` exist)
+    - Only plain GETs are hedged; writes and streamed downloads pass through
+    - The duplicate goes out on a fresh pooled connection, the first
+      successful response wins and the loser is discarded
+    - Extra-request rate capped by a HedgeBudget
+
+    Example:
+        >>> session = HedgingSession(percentile=95, max_extra_ratio=0.1)
+        >>> server = PlexServer(baseurl, token, session=session)
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        max_extra_ratio: float = 0.1,
+        min_samples: int = 20,
+        max_workers: int = 8,
+    ) -> None:
+        """
+        Initialize the session.
+
+        Args:
+            percentile: Latency percentile after which a GET is hedged
+            max_extra_ratio: Cap on hedged requests as a fraction of all GETs
+            min_samples: Latencies required for an endpoint before hedging it
+            max_workers: Threads available for in-flight primaries and hedges
+        """
+        super().__init__()
+        self.percentile = float(percentile)
+        self.min_samples = max(1, int(min_samples))
+        self.tracker = LatencyTracker()
+        self.budget = HedgeBudget(ratio=max_extra_ratio)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(2, int(max_workers)), thread_name_prefix="plex-hedge"
+        )
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._hedged = 0
+        self._hedge_wins = 0
+
+    def request(self, method: str | bytes, url: str | bytes, *args: Any, **kwargs: Any) -> Any:
+        method_name = method.decode() if isinstance(method, bytes) else method
+        url_text = url.decode() if isinstance(url, bytes) else url
+        if method_name.upper() != "GET" or kwargs.get("stream"):
+            return super().request(method, url, *args, **kwargs)
+
+        key = urlsplit(url_text).path
+        with self._lock:
+            self._requests += 1
+        self.budget.deposit()
+
+        delay_ms = self.hedge_delay_ms(key)
+        if delay_ms is None:
+            return self._send(key, True, method, url, args, kwargs)
+
+        primary = self._executor.submit(self._send, key, True, method, url, args, kwargs)
+        done, _ = wait([primary], timeout=delay_ms / 1000.0)
+        if done or not self.budget.try_spend():
+            return primary.result()
+
+        hedge = self._executor.submit(self._send, key, False, method, url, args, kwargs)
+        with self._lock:
+            self._hedged += 1
+        return self._first_success(primary, hedge)
+
+    def hedge_delay_ms(self, key: str) -> float | None:
+        """Delay after which a GET to ``key`` is hedged, or None if not enough data yet."""
+        if self.tracker.sample_count(key) < self.min_samples:
+            return None
+        return self.tracker.percentile(key, self.percentile)
+
+    def _send(
+        self,
+        key: str,
+        record: bool,
+        method: str | bytes,
+        url: str | bytes,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> Any:
+        started = time.perf_counter()
+        response = super().request(method, url, *args, **kwargs)
+        if record:
+            self.tracker.record(key, (time.perf_counter() - started) * 1000.0)
+        return response
+
+    def _first_success(self, primary: Future, hedge: Future) -> Any:
+        pending = {primary, hedge}
+        error: BaseException | None = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    response = future.result()
+                except Exception as e:
+                    error = error or e
+                    continue
+                if future is hedge:
+                    with self._lock:
+                        self._hedge_wins += 1
+                for loser in pending:
+                    loser.add_done_callback(self._discard)
+                return response
+        assert error is not None
+        raise error
+
+    @staticmethod
+    def _discard(future: Future) -> None:
+        try:
+            future.result().close()
+        except Exception:
+            # The losing request failing is fine; nobody is waiting on it.
+            pass
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get hedging statistics.
+
+        Returns:
+            Dictionary with GET count, hedges sent and hedges that won
+        """
+        with self._lock:
+            return {
+                "requests": self._requests,
+                "hedged": self._hedged,
+                "hedge_wins": self._hedge_wins,
+            }
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        super().close()
+
+
+class CoalescingSession(requests.Session):
+    """
+    Session that single-flights identical concurrent GETs.
+
+    Features:
+    - GETs are keyed by URL (path and query), params and headers; a GET whose
+      key is already in flight waits for that response instead of sending
+    - The leader reads the body before sharing, so every caller can use
+      ``.content`` / ``.text``; each caller still parses it itself
+    - Writes, streamed downloads and GETs with a body always go out
+    - Counters for leaders sent and followers coalesced (requests saved)
+
+    Example:
+        >>> session = CoalescingSession()
+        >>> server = PlexServer(baseurl, token, session=session)
+        >>> session.get_coalescing_stats()
+        {'requests': 3, 'coalesced': 2, 'in_flight': 0}
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._flight_lock = threading.Lock()
+        self._in_flight: dict[tuple[Any, ...], Future] = {}
+        self._leaders = 0
+        self._coalesced = 0
+
+    def request(self, method: str | bytes, url: str | bytes, *args: Any, **kwargs: Any) -> Any:
+        key = self.coalesce_key(method, url, args, kwargs)
+        if key is None:
+            return super().request(method, url, *args, **kwargs)
+
+        with self._flight_lock:
+            pending = self._in_flight.get(key)
+            if pending is not None:
+                self._coalesced += 1
+            else:
+                flight: Future = Future()
+                self._in_flight[key] = flight
+                self._leaders += 1
+        if pending is not None:
+            return pending.result()
+
+        try:
+            response = super().request(method, url, *args, **kwargs)
+            # Load the body now so followers don't race on reading the stream.
+            response.content  # noqa: B018
+        except BaseException as e:
+            flight.set_exception(e)
+            raise
+        finally:
+            with self._flight_lock:
+                self._in_flight.pop(key, None)
+        flight.set_result(response)
+        return response
+
+    @staticmethod
+    def coalesce_key(
+        method: str | bytes, url: str | bytes, args: tuple[Any, ...], kwargs: dict[str, Any]
+    ) -> tuple[Any, ...] | None:
+        """
+        Identity of a request for coalescing, or None if it must not be shared.
+
+        Only plain GETs without a body, files or streaming qualify. Headers are
+        part of the key because plexapi pages with X-Plex-Container-* headers.
+        """
+        method_name = method.decode() if isinstance(method, bytes) else method
+        if method_name.upper() != "GET" or args or kwargs.get("stream"):
+            return None
+        if any(kwargs.get(name) is not None for name in ("data", "json", "files")):
+            return None
+        url_text = url.decode() if isinstance(url, bytes) else url
+        params = kwargs.get("params")
+        headers = kwargs.get("headers") or {}
+        return (
+            url_text,
+            tuple(sorted(params.items())) if isinstance(params, Mapping) else repr(params),
+            tuple(sorted((str(k).lower(), str(v)) for k, v in headers.items())),
+        )
+
+    def get_coalescing_stats(self) -> dict[str, Any]:
+        """
+        Get coalescing statistics.
+
+        Returns:
+            Dictionary with GETs sent, GETs coalesced (requests saved) and
+            GETs currently in flight
+        """
+        with self._flight_lock:
+            return {
+                "requests": self._leaders,
+                "coalesced": self._coalesced,
+                "in_flight": len(self._in_flight),
+            }
+
+
+class CoalescingHedgingSession(CoalescingSession, HedgingSession):
+    """
+    Hedging session that coalesces identical concurrent GETs first.
+
+    A GET is single-flighted by CoalescingSession and the leader's request is
+    then hedged by HedgingSession, so followers never spawn hedges of their own.
+    """
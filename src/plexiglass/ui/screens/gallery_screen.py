@@ -17,6 +17,7 @@ from textual.widgets import Button, Footer, Header, Static
 
 from plexiglass.services.undo_service import UndoService
 from plexiglass.services.exceptions import ConnectionError
+from plexiglass.services.plex_data_service import PlexDataService
 from plexiglass.ui.widgets.category_menu import CategoryMenu
 from plexiglass.ui.widgets.code_viewer import CodeViewer
 from plexiglass.ui.widgets.demo_list import DemoList
@@ -26,8 +27,11 @@ from plexiglass.ui.widgets.run_demo_button import RunDemoButton
 from plexiglass.ui.widgets.undo_button import UndoButton
 
 if TYPE_CHECKING:
+    from plexapi.server import PlexServer
+
     from plexiglass.gallery.base_demo import BaseDemo
     from plexiglass.gallery.registry import DemoRegistry
+    from plexiglass.services.server_manager import ServerManager
 
 
 class DemoPanel(Static):
@@ -169,7 +173,7 @@ class GalleryScreen(Screen):
         defaults: dict[str, object] = {}
         server_manager = getattr(self.app, "server_manager", None)
         server = None
-        if server_manager is not None:
+        if server_manager is not None and not self._default_server_down(server_manager):
             try:
                 if server_manager.get_connected_servers():
                     server = server_manager.connect_to_default()
@@ -180,7 +184,7 @@ class GalleryScreen(Screen):
             name = param_def.get("name")
             if name == "section_name" and server is not None:
                 try:
-                    sections = list(server.library.sections())
+                    sections = self._list_sections(server_manager, server)
                     if sections:
                         defaults[name] = getattr(sections[0], "title", "")
                 except Exception:
@@ -196,7 +200,7 @@ class GalleryScreen(Screen):
             return {}
         options: dict[str, list[str]] = {}
         server_manager = getattr(self.app, "server_manager", None)
-        if server_manager is None:
+        if server_manager is None or self._default_server_down(server_manager):
             return options
         try:
             if not server_manager.get_connected_servers():
@@ -209,12 +213,33 @@ class GalleryScreen(Screen):
             name = param_def.get("name")
             if name == "section_name":
                 try:
-                    sections = list(server.library.sections())
+                    sections = self._list_sections(server_manager, server)
                     options[name] = [getattr(section, "title", "") for section in sections]
                 except Exception:
                     continue
         return options
 
+    @staticmethod
+    def _data_service(server_manager: ServerManager | None) -> PlexDataService | None:
+        """The server manager's shared data service, if it has one."""
+        data = getattr(server_manager, "data", None)
+        return data if isinstance(data, PlexDataService) else None
+
+    def _list_sections(self, server_manager: ServerManager, server: PlexServer) -> list[object]:
+        data = self._data_service(server_manager)
+        if data is not None:
+            return data.sections(server)
+        return list(server.library.sections())
+
+    @staticmethod
+    def _default_server_down(server_manager: ServerManager) -> bool:
+        """True if the health prober has marked the default server down."""
+        try:
+            name = server_manager.get_default_server_name()
+            return name is not None and not server_manager.is_server_available(name)
+        except Exception:
+            return False
+
     def compose(self) -> ComposeResult:
         """Compose the Gallery Screen layout."""
         yield Header()
@@ -275,6 +300,9 @@ class GalleryScreen(Screen):
         app = self.app
         server_manager = getattr(app, "server_manager", None)
         if server_manager is not None:
+            if self._default_server_down(server_manager):
+                results_display.set_results({"error": "Default server is down"})
+                return
             try:
                 server = server_manager.connect_to_default()
             except ConnectionError as exc:
@@ -288,11 +316,17 @@ class GalleryScreen(Screen):
             results_display.set_results({"error": error})
             return
 
+        data = self._data_service(server_manager)
+        demo.data_service = data
         try:
             results = demo.execute(server, params)
         except Exception as exc:  # noqa: BLE001
             results_display.set_results({"error": str(exc)})
             return
+        finally:
+            # A write may have changed anything the shared cache holds for this server.
+            if data is not None and server is not None and demo.operation_type == "WRITE":
+                data.invalidate(server)
 
         results_display.set_results(results)
 
@@ -5,8 +5,12 @@ Provides memory-efficient patterns and cleanup strategies.
 """
 
 import gc
+import itertools
+import os
 import sys
+import types
 from typing import Any
+from xml.etree.ElementTree import Element
 
 
 class MemoryOptimizer:
@@ -24,6 +28,10 @@ class MemoryOptimizer:
     WARNING_THRESHOLD = 100 * 1024 * 1024  # 100 MB
     CRITICAL_THRESHOLD = 200 * 1024 * 1024  # 200 MB
 
+    # Attributes linking plexapi objects to the connection they all share;
+    # estimate_size doesn't charge each object for it.
+    SHARED_ATTRIBUTES = ("_server", "_parent")
+
     @staticmethod
     def get_memory_usage() -> dict[str, int]:
         """
@@ -31,8 +39,9 @@ class MemoryOptimizer:
 
         Returns:
             Dictionary with memory statistics:
-            - current: Current memory usage in bytes
-            - peak: Peak memory usage in bytes
+            - current: Current resident memory in bytes (see get_current_rss;
+              the peak when that is unavailable)
+            - peak: Peak resident memory in bytes
             - system_total: Total system memory in bytes
             - system_available: Available system memory in bytes
         """
@@ -45,7 +54,9 @@ class MemoryOptimizer:
             import resource
 
             usage = resource.getrusage(resource.RUSAGE_SELF)
-            current = usage.ru_maxrss * 1024  # Convert KB to bytes
+            # ru_maxrss is in kilobytes on Linux but already in bytes on macOS.
+            peak = usage.ru_maxrss if sys.platform == "darwin" else usage.ru_maxrss * 1024
+            current = MemoryOptimizer.get_current_rss() or peak
 
             # Get system memory
             try:
@@ -62,14 +73,12 @@ class MemoryOptimizer:
 
             return {
                 "current": current,
-                "peak": current,
+                "peak": peak,
                 "system_total": system_total,
                 "system_available": system_available,
             }
         except ImportError:
             # Fallback: estimate from sys module
-            import sys
-
             return {
                 "current": sys.getsizeof([]),  # Rough estimate
                 "peak": sys.getsizeof([]),
@@ -77,6 +86,34 @@ class MemoryOptimizer:
                 "system_available": 0,
             }
 
+    @staticmethod
+    def get_current_rss() -> int | None:
+        """
+        Get the process's current resident set size.
+
+        Uses psutil when installed, else ``/proc/self/statm``. Unlike
+        ``ru_maxrss`` (the peak) this drops again when memory is released.
+
+        Returns:
+            Resident memory in bytes, or None if it can't be read on this platform
+        """
+        try:
+            import psutil
+        except ImportError:
+            pass
+        else:
+            try:
+                return int(psutil.Process().memory_info().rss)
+            except Exception:
+                # Fall through to /proc.
+                pass
+        try:
+            with open("/proc/self/statm") as f:
+                resident_pages = int(f.read().split()[1])
+            return resident_pages * os.sysconf("SC_PAGE_SIZE")
+        except (OSError, ValueError, IndexError, AttributeError):
+            return None
+
     @staticmethod
     def format_bytes(size_bytes: int | float) -> str:
         """
@@ -95,6 +132,67 @@ class MemoryOptimizer:
             size_float /= 1024
         return f"{size_float:.1f} TB"
 
+    @staticmethod
+    def estimate_size(obj: Any, max_depth: int = 6, sample_size: int = 32) -> int:
+        """
+        Estimate the memory retained by an object graph.
+
+        Walks containers, instance ``__dict__``s and XML elements (plexapi
+        objects keep their response in ``_data``) with ``sys.getsizeof``,
+        counting each object once. SHARED_ATTRIBUTES are not followed. Large
+        containers are sampled: only the first ``sample_size`` items are
+        measured and the total is extrapolated, so the cost stays bounded for
+        something like a 50,000-item library listing.
+
+        Args:
+            obj: Object to measure
+            max_depth: Nesting depth below which children are not followed
+            sample_size: Items measured per container
+
+        Returns:
+            Estimated size in bytes
+        """
+        seen: set[int] = set()
+        leaf_types = (str, bytes, bytearray, int, float, complex, bool, type(None))
+        opaque_types = (type, types.ModuleType, types.FunctionType, types.MethodType)
+
+        def size_of(o: Any, depth: int) -> int:
+            if id(o) in seen:
+                return 0
+            seen.add(id(o))
+            size = sys.getsizeof(o, 0)
+            if depth >= max_depth or isinstance(o, leaf_types) or isinstance(o, opaque_types):
+                return size
+
+            if isinstance(o, dict):
+                pairs = list(itertools.islice(o.items(), sample_size))
+                children = [part for pair in pairs for part in pair]
+                sampled, total = len(pairs), len(o)
+            elif isinstance(o, (list, tuple, set, frozenset)):
+                children = list(itertools.islice(o, sample_size))
+                sampled, total = len(children), len(o)
+            elif isinstance(o, Element):
+                size += size_of(o.attrib, depth + 1) + size_of(o.text, depth + 1)
+                size += size_of(o.tail, depth + 1)
+                children = list(itertools.islice(o, sample_size))
+                sampled, total = len(children), len(o)
+            else:
+                attrs = getattr(o, "__dict__", None)
+                if not isinstance(attrs, dict):
+                    return size
+                for name in MemoryOptimizer.SHARED_ATTRIBUTES:
+                    shared = attrs.get(name)
+                    if shared is not None:
+                        seen.add(id(shared))
+                return size + size_of(attrs, depth + 1)
+
+            if sampled:
+                measured = sum(size_of(child, depth + 1) for child in children)
+                size += measured * total // sampled
+            return size
+
+        return size_of(obj, 0)
+
     @staticmethod
     def force_garbage_collection() -> dict[str, Any]:
         """
@@ -0,0 +1,335 @@
+"""
+Unit tests for AlertInvalidator.
+
+Tests mapping Plex alerts to cache invalidations, listener lifecycle, and
+the longer TTLs used while a server's alerts are live.
+"""
+
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from plexiglass.services.alert_invalidator import AlertInvalidator
+from plexiglass.services.plex_data_service import PlexDataService
+
+
+def make_server(identifier: str = "machine-1") -> MagicMock:
+    server = MagicMock()
+    server.machineIdentifier = identifier
+    server.sessions.return_value = []
+    server.library.sections.return_value = []
+    server.history.return_value = []
+    server.startAlertListener.return_value.is_alive.return_value = True
+    return server
+
+
+def playing(session_key: str, state: str, view_offset: int = 0) -> dict:
+    return {
+        "type": "playing",
+        "PlaySessionStateNotification": [
+            {"sessionKey": session_key, "state": state, "viewOffset": view_offset}
+        ],
+    }
+
+
+@pytest.fixture
+def alerts():
+    with patch.object(AlertInvalidator, "available", return_value=True):
+        yield AlertInvalidator(PlexDataService())
+
+
+class TestAlertMapping:
+    """Test which alerts invalidate what."""
+
+    def _fill(self, data: PlexDataService, server: MagicMock) -> None:
+        data.sessions(server)
+        data.sections(server)
+        data.history(server, 10)
+
+    def test_playing_state_change_drops_sessions(self, alerts):
+        """A new or changed session drops the session list only."""
+        server = make_server()
+        self._fill(alerts.data, server)
+
+        assert alerts.handle_alert(server, playing("1", "playing")) == {"sessions"}
+        self._fill(alerts.data, server)
+        assert alerts.handle_alert(server, playing("1", "paused")) == {"sessions"}
+        self._fill(alerts.data, server)
+
+        assert server.sessions.call_count == 3
+        assert server.history.call_count == 1
+        assert server.library.sections.call_count == 1
+
+    def test_progress_updates_are_ignored(self, alerts):
+        """Repeated notifications in the same state don't invalidate."""
+        server = make_server()
+        alerts.handle_alert(server, playing("1", "playing", 1000))
+
+        assert alerts.handle_alert(server, playing("1", "playing", 11000)) == set()
+
+    def test_stop_drops_sessions_and_history(self, alerts):
+        """A stopped session also drops play history."""
+        server = make_server()
+        alerts.handle_alert(server, playing("1", "playing"))
+
+        assert alerts.handle_alert(server, playing("1", "stopped")) == {"sessions", "history"}
+
+    def test_timeline_done_drops_sections(self, alerts):
+        """Processed or deleted items drop the section list; progress states don't."""
+        server = make_server()
+        progress = {"type": "timeline", "TimelineEntry": [{"state": 3, "sectionID": "1"}]}
+        done = {"type": "timeline", "TimelineEntry": [{"state": 5, "sectionID": "1"}]}
+        deleted = {"type": "timeline", "TimelineEntry": [{"state": 9, "sectionID": "1"}]}
+
+        assert alerts.handle_alert(server, progress) == set()
+        assert alerts.handle_alert(server, done) == {"sections"}
+        assert alerts.handle_alert(server, deleted) == {"sections"}
+
+    def test_library_activity_end_drops_sections(self, alerts):
+        """A finished library scan drops the section list."""
+        server = make_server()
+        started = {
+            "type": "activity",
+            "ActivityNotification": [
+                {"event": "started", "Activity": {"type": "library.update.section"}}
+            ],
+        }
+        ended = {
+            "type": "activity",
+            "ActivityNotification": [
+                {"event": "ended", "Activity": {"type": "library.update.section"}}
+            ],
+        }
+
+        assert alerts.handle_alert(server, started) == set()
+        assert alerts.handle_alert(server, ended) == {"sections"}
+
+    def test_only_the_alerting_server_is_invalidated(self, alerts):
+        """Alerts from one server leave other servers' data alone."""
+        office, home = make_server("office"), make_server("home")
+        alerts.data.sessions(office)
+        alerts.data.sessions(home)
+
+        alerts.handle_alert(office, playing("1", "playing"))
+        alerts.data.sessions(office)
+        alerts.data.sessions(home)
+
+        assert office.sessions.call_count == 2
+        assert home.sessions.call_count == 1
+
+
+class TestSessionListeners:
+    """Test play state subscribers (live sessions panel)."""
+
+    def test_listeners_receive_play_states(self, alerts):
+        """Subscribers get every PlaySessionStateNotification with its server."""
+        server = make_server()
+        received = []
+        alerts.add_session_listener(lambda srv, notes: received.append((srv, notes)))
+
+        alerts.handle_alert(server, playing("1", "playing", 5000))
+        alerts.handle_alert(server, {"type": "timeline", "TimelineEntry": []})
+
+        assert received == [(server, playing("1", "playing", 5000)["PlaySessionStateNotification"])]
+
+    def test_known_session_state_change_is_left_to_listeners(self, alerts):
+        """With a subscriber, only sessions appearing or stopping drop the list."""
+        server = make_server()
+        alerts.add_session_listener(lambda srv, notes: None)
+
+        assert alerts.handle_alert(server, playing("1", "playing")) == {"sessions"}
+        assert alerts.handle_alert(server, playing("1", "paused")) == set()
+        assert alerts.handle_alert(server, playing("2", "playing")) == {"sessions"}
+        assert alerts.handle_alert(server, playing("1", "stopped")) == {"sessions", "history"}
+
+    def test_failing_listener_is_contained(self, alerts):
+        """A subscriber raising doesn't stop invalidation or other subscribers."""
+        server = make_server()
+        received = []
+
+        def broken(srv, notes):
+            raise RuntimeError("widget gone")
+
+        alerts.add_session_listener(broken)
+        alerts.add_session_listener(lambda srv, notes: received.append(notes))
+
+        assert alerts.handle_alert(server, playing("1", "playing")) == {"sessions"}
+        assert len(received) == 1
+
+    def test_removed_listener_restores_invalidation(self, alerts):
+        """Without subscribers, state changes drop the session list again."""
+        server = make_server()
+        listener = MagicMock()
+        alerts.add_session_listener(listener)
+        alerts.handle_alert(server, playing("1", "playing"))
+        alerts.remove_session_listener(listener)
+
+        assert alerts.handle_alert(server, playing("1", "paused")) == {"sessions"}
+        listener.assert_called_once()
+
+    def test_server_manager_dispatches_by_server_name(self, tmp_path, monkeypatch):
+        """ServerManager listeners are called with the configured server name."""
+        from plexiglass.config.loader import ConfigLoader
+        from plexiglass.services.server_manager import ServerManager
+
+        monkeypatch.setenv("PLEX_TOKEN_HOME", "home-token-12345")
+        config_file = tmp_path / "servers.yaml"
+        config_file.write_text(
+            """
+servers:
+  - name: "Home Server"
+    url: "http://192.168.1.100:32400"
+    token: "${PLEX_TOKEN_HOME}"
+    default: true
+"""
+        )
+        loader = ConfigLoader(config_file)
+        loader.load()
+        with patch.object(AlertInvalidator, "available", return_value=True):
+            manager = ServerManager(loader)
+        received = []
+        listener = lambda name, notes: received.append((name, notes))  # noqa: E731
+
+        with patch("plexiglass.services.server_manager.PlexServer") as mock_plex:
+            server = make_server()
+            mock_plex.return_value = server
+            manager.connect_to_default()
+        manager.add_session_listener(listener)
+        callback = server.startAlertListener.call_args.kwargs["callback"]
+        callback(playing("3", "buffering"))
+        manager.remove_session_listener(listener)
+        callback(playing("3", "playing"))
+
+        assert [name for name, _ in received] == ["Home Server"]
+        assert received[0][1][0]["state"] == "buffering"
+
+
+class TestAlertListeners:
+    """Test listener lifecycle and alert-aware TTLs."""
+
+    def test_watch_starts_one_listener_per_server(self, alerts):
+        """Watching twice keeps the existing live listener."""
+        server = make_server()
+
+        assert alerts.watch(server) is True
+        assert alerts.watch(server) is True
+
+        server.startAlertListener.assert_called_once()
+        assert alerts.is_live(server) is True
+
+    def test_listener_callback_invalidates(self, alerts):
+        """Alerts delivered through the listener callback reach the cache."""
+        server = make_server()
+        alerts.watch(server)
+        alerts.data.sessions(server)
+        callback = server.startAlertListener.call_args.kwargs["callback"]
+
+        callback(playing("7", "playing"))
+        alerts.data.sessions(server)
+
+        assert server.sessions.call_count == 2
+        assert alerts.get_stats()["invalidations"] == 1
+
+    def test_listener_error_drops_server_data(self, alerts):
+        """A failed listener clears the server's cache and stops counting as live."""
+        server = make_server()
+        alerts.watch(server)
+        alerts.data.sections(server)
+
+        server.startAlertListener.call_args.kwargs["callbackError"](RuntimeError("closed"))
+
+        assert alerts.is_live(server) is False
+        assert alerts.data.cache.size() == 0
+        assert alerts.get_stats()["listener_failures"] == 1
+
+    def test_lost_listener_is_reported_to_session_listeners(self, alerts):
+        """Subscribers get None for a server whose alerts stopped, once."""
+        server = make_server()
+        received = []
+        alerts.add_session_listener(lambda srv, notes: received.append((srv, notes)))
+        alerts.watch(server)
+
+        on_error = server.startAlertListener.call_args.kwargs["callbackError"]
+        on_error(RuntimeError("closed"))
+        on_error(RuntimeError("closed"))
+
+        assert received == [(server, None)]
+
+    def test_dead_listener_is_detected(self, alerts):
+        """A listener thread that exits quietly is treated as failed."""
+        server = make_server()
+        alerts.watch(server)
+        server.startAlertListener.return_value.is_alive.return_value = False
+
+        assert alerts.is_live(server) is False
+        assert alerts.get_stats()["watched"] == 0
+
+    def test_unwatch_stops_listener(self, alerts):
+        """Unwatching stops the listener."""
+        server = make_server()
+        alerts.watch(server)
+        listener = server.startAlertListener.return_value
+
+        alerts.unwatch(server)
+
+        assert alerts.is_live(server) is False
+        for _ in range(100):
+            if listener.stop.called:
+                break
+            time.sleep(0.01)
+        listener.stop.assert_called_once()
+
+    def test_disabled_without_websocket_client(self):
+        """Without websocket-client nothing is started."""
+        with patch.object(AlertInvalidator, "available", return_value=False):
+            alerts = AlertInvalidator(PlexDataService())
+        server = make_server()
+
+        assert alerts.watch(server) is False
+        server.startAlertListener.assert_not_called()
+
+    def test_live_alerts_lengthen_ttls(self):
+        """Servers with a live listener use alert_cache_ttls."""
+        data = PlexDataService(ttls={"sessions": 10}, alert_ttls={"sessions": 300})
+        with patch.object(AlertInvalidator, "available", return_value=True):
+            alerts = AlertInvalidator(data)
+        data.alerts_live = alerts.is_live
+        server = make_server()
+
+        assert data.ttl_for(server, "sessions") == 10
+        alerts.watch(server)
+        assert data.ttl_for(server, "sessions") == 300
+
+    def test_server_manager_watches_connected_servers(self, tmp_path, monkeypatch):
+        """ServerManager listens while connected and stops on disconnect."""
+        from plexiglass.config.loader import ConfigLoader
+        from plexiglass.services.server_manager import ServerManager
+
+        monkeypatch.setenv("PLEX_TOKEN_HOME", "home-token-12345")
+        config_file = tmp_path / "servers.yaml"
+        config_file.write_text(
+            """
+servers:
+  - name: "Home Server"
+    url: "http://192.168.1.100:32400"
+    token: "${PLEX_TOKEN_HOME}"
+    default: true
+"""
+        )
+        loader = ConfigLoader(config_file)
+        loader.load()
+        with patch.object(AlertInvalidator, "available", return_value=True):
+            manager = ServerManager(loader)
+
+        with patch("plexiglass.services.server_manager.PlexServer") as mock_plex:
+            server = make_server()
+            mock_plex.return_value = server
+            manager.connect_to_default()
+
+        assert manager.alerts.is_live(server) is True
+        assert (
+            manager.data.ttl_for(server, "library_list") == manager.data.alert_ttls["library_list"]
+        )
+        manager.disconnect_server("Home Server")
+        assert manager.alerts.is_live(server) is False
@@ -0,0 +1,305 @@
+"""
+Unit tests for the shared cache daemon.
+
+Tests fetch coalescing across clients, TTL expiry, error replies, the
+client's unavailable-daemon handling, and ServerManager's daemon path.
+"""
+
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from plexiglass.services.cache_daemon import CacheDaemon, CacheDaemonClient
+from plexiglass.services.exceptions import ConnectionError, ServiceError
+
+
+@pytest.fixture
+def socket_path():
+    # Unix socket paths are length-limited, so stay out of pytest's long tmp_path.
+    directory = tempfile.mkdtemp(prefix="pg-")
+    yield Path(directory) / "cache.sock"
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+@pytest.fixture
+def running_daemon(socket_path):
+    daemons = []
+
+    def start(fetch, **kwargs):
+        daemon = CacheDaemon(fetch, socket_path, **kwargs)
+        daemon.start()
+        daemons.append(daemon)
+        return daemon
+
+    yield start
+    for daemon in daemons:
+        daemon.shutdown()
+
+
+class TestCacheDaemon:
+    """Test the daemon and its client."""
+
+    def test_client_round_trip(self, running_daemon, socket_path):
+        """Test that a client receives the fetched value."""
+        running_daemon(lambda server, resource: [{"server": server, "resource": resource}])
+
+        value = CacheDaemonClient(socket_path).fetch("Home", "now_playing")
+
+        assert value == [{"server": "Home", "resource": "now_playing"}]
+
+    def test_concurrent_clients_share_one_fetch(self, running_daemon, socket_path):
+        """Test that many clients missing at once cause a single upstream fetch."""
+        calls = []
+
+        def fetch(server, resource):
+            calls.append((server, resource))
+            time.sleep(0.05)
+            return {"library_count": 3, "library_items": 42}
+
+        daemon = running_daemon(fetch, ttls={"library_stats": 60})
+        results = []
+        barrier = threading.Barrier(8)
+
+        def client():
+            barrier.wait()
+            results.append(CacheDaemonClient(socket_path).fetch("Home", "library_stats"))
+
+        threads = [threading.Thread(target=client) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+        assert results == [{"library_count": 3, "library_items": 42}] * 8
+        assert daemon.get_stats()["requests"] == 8
+        assert daemon.get_stats()["fetches"] == 1
+
+    def test_refetches_after_ttl(self, running_daemon, socket_path):
+        """Test that a resource is fetched again once its TTL has passed."""
+        calls = []
+
+        def fetch(server, resource):
+            calls.append(server)
+            return len(calls)
+
+        running_daemon(fetch, ttls={"now_playing": 0.05})
+        client = CacheDaemonClient(socket_path)
+
+        assert client.fetch("Home", "now_playing") == 1
+        assert client.fetch("Home", "now_playing") == 1
+        time.sleep(0.1)
+        assert client.fetch("Home", "now_playing") == 2
+
+    def test_failed_fetch_is_reported_and_cached(self, running_daemon, socket_path):
+        """Test that a failure reaches the client as ServiceError and isn't retried per client."""
+        calls = []
+
+        def fetch(server, resource):
+            calls.append(server)
+            raise RuntimeError("server unreachable")
+
+        running_daemon(fetch, error_ttl=60)
+        client = CacheDaemonClient(socket_path)
+
+        for _ in range(3):
+            with pytest.raises(ServiceError, match="server unreachable"):
+                client.fetch("Home", "now_playing")
+        assert len(calls) == 1
+
+    def test_unknown_resource_is_rejected(self, running_daemon, socket_path):
+        """Test that only known resources are served."""
+        fetch = MagicMock()
+        running_daemon(fetch)
+
+        with pytest.raises(ServiceError, match="Unknown resource"):
+            CacheDaemonClient(socket_path).fetch("Home", "everything")
+        fetch.assert_not_called()
+
+    def test_client_raises_connection_error_without_daemon(self, socket_path):
+        """Test that a missing daemon surfaces as ConnectionError."""
+        client = CacheDaemonClient(socket_path, timeout=0.2)
+
+        assert client.is_available() is False
+        with pytest.raises(ConnectionError):
+            client.fetch("Home", "now_playing")
+
+    def test_slow_reply_is_not_a_connection_error(self, running_daemon, socket_path):
+        """Test that a connected daemon answering too slowly raises ServiceError only."""
+        release = threading.Event()
+
+        def fetch(server, resource):
+            release.wait(5)
+            return "late"
+
+        running_daemon(fetch)
+        client = CacheDaemonClient(socket_path, read_timeout=0.1)
+        try:
+            with pytest.raises(ServiceError, match="did not answer") as excinfo:
+                client.fetch("Home", "now_playing")
+            assert not isinstance(excinfo.value, ConnectionError)
+        finally:
+            release.set()
+
+    def test_stale_socket_is_replaced_and_live_one_refused(self, running_daemon, socket_path):
+        """Test that a leftover socket file is reused but a running daemon isn't displaced."""
+        socket_path.touch()
+        running_daemon(lambda server, resource: "ok")
+
+        assert CacheDaemonClient(socket_path).fetch("Home", "now_playing") == "ok"
+        with pytest.raises(ServiceError, match="already listening"):
+            CacheDaemon(MagicMock(), socket_path).start()
+
+    def test_shutdown_removes_socket(self, socket_path):
+        """Test that shutting down cleans up the socket file."""
+        daemon = CacheDaemon(MagicMock(), socket_path)
+        daemon.start()
+        assert socket_path.exists()
+
+        daemon.shutdown()
+
+        assert not socket_path.exists()
+
+
+class TestServerManagerCacheDaemon:
+    """Test ServerManager fetching through the daemon."""
+
+    def _manager(self, tmp_path, monkeypatch, socket_path):
+        from plexiglass.config.loader import ConfigLoader
+        from plexiglass.services.server_manager import ServerManager
+
+        monkeypatch.setenv("PLEX_TOKEN_HOME", "home-token-12345")
+        config_file = tmp_path / "servers.yaml"
+        config_file.write_text(
+            f"""
+servers:
+  - name: "Home Server"
+    url: "http://192.168.1.100:32400"
+    token: "${{PLEX_TOKEN_HOME}}"
+    default: true
+
+settings:
+  performance:
+    cache_daemon_socket: "{socket_path}"
+"""
+        )
+        loader = ConfigLoader(config_file)
+        loader.load()
+        return ServerManager(loader)
+
+    def _plex_server(self):
+        server = MagicMock()
+        server.sessions.return_value = [MagicMock(title="Direct", usernames=["bob"])]
+        server.library.sections.return_value = [MagicMock(totalSize=5)]
+        return server
+
+    def test_status_uses_daemon(self, tmp_path, monkeypatch, socket_path, running_daemon):
+        """Test that sessions and library stats come from the daemon, not the server."""
+        running_daemon(
+            lambda server, resource: (
+                [{"title": "Shared", "user": "alice", "state": "playing", "progress_percent": 50}]
+                if resource == "now_playing"
+                else {"library_count": 2, "library_items": 99}
+            )
+        )
+        manager = self._manager(tmp_path, monkeypatch, socket_path)
+
+        with patch("plexiglass.services.server_manager.PlexServer") as mock_plex:
+            server = self._plex_server()
+            mock_plex.return_value = server
+            manager.connect_to_default()
+            status = manager.get_server_status("Home Server")
+
+        assert status["session_count"] == 1
+        assert status["now_playing"][0]["title"] == "Shared"
+        assert status["library_items"] == 99
+        server.sessions.assert_not_called()
+        server.library.sections.assert_not_called()
+
+    def test_status_falls_back_when_daemon_is_down(self, tmp_path, monkeypatch, socket_path):
+        """Test that an unreachable daemon means fetching directly."""
+        manager = self._manager(tmp_path, monkeypatch, socket_path)
+
+        with patch("plexiglass.services.server_manager.PlexServer") as mock_plex:
+            mock_plex.return_value = self._plex_server()
+            manager.connect_to_default()
+            status = manager.get_server_status("Home Server")
+
+        assert status["now_playing"][0]["title"] == "Direct"
+        assert status["library_items"] == 5
+
+    def test_status_does_not_refetch_when_daemon_is_slow(
+        self, tmp_path, monkeypatch, socket_path, running_daemon
+    ):
+        """Test that a slow daemon reply yields the fallback instead of a direct fetch."""
+        release = threading.Event()
+
+        def fetch(server, resource):
+            release.wait(5)
+            return []
+
+        running_daemon(fetch)
+        manager = self._manager(tmp_path, monkeypatch, socket_path)
+        manager.cache_daemon.read_timeout = 0.1
+
+        try:
+            with patch("plexiglass.services.server_manager.PlexServer") as mock_plex:
+                server = self._plex_server()
+                mock_plex.return_value = server
+                manager.connect_to_default()
+                status = manager.get_server_status("Home Server")
+        finally:
+            release.set()
+
+        assert status["now_playing"] == []
+        assert status["library_count"] == 0
+        server.sessions.assert_not_called()
+        server.library.sections.assert_not_called()
+
+    def test_daemon_read_timeout_follows_connection_timeout(
+        self, tmp_path, monkeypatch, socket_path
+    ):
+        """Test that the client waits for replies as long as a fetch may take."""
+        manager = self._manager(tmp_path, monkeypatch, socket_path)
+
+        assert manager.cache_daemon.read_timeout == 30.0
+
+    def test_status_does_not_refetch_when_daemon_reports_failure(
+        self, tmp_path, monkeypatch, socket_path, running_daemon
+    ):
+        """Test that a server failure seen by the daemon isn't retried by each client."""
+
+        def fetch(server, resource):
+            raise RuntimeError("timed out")
+
+        running_daemon(fetch)
+        manager = self._manager(tmp_path, monkeypatch, socket_path)
+
+        with patch("plexiglass.services.server_manager.PlexServer") as mock_plex:
+            server = self._plex_server()
+            mock_plex.return_value = server
+            manager.connect_to_default()
+            status = manager.get_server_status("Home Server")
+
+        assert status["now_playing"] == []
+        assert status["library_count"] == 0
+        server.sessions.assert_not_called()
+
+    def test_fetch_resource_returns_serializable_values(self, tmp_path, monkeypatch, socket_path):
+        """Test the direct fetch the daemon performs."""
+        manager = self._manager(tmp_path, monkeypatch, socket_path)
+
+        with patch("plexiglass.services.server_manager.PlexServer") as mock_plex:
+            mock_plex.return_value = self._plex_server()
+            now_playing = manager.fetch_resource("Home Server", "now_playing")
+            library_stats = manager.fetch_resource("Home Server", "library_stats")
+
+        assert now_playing[0]["title"] == "Direct"
+        assert library_stats == {"library_count": 1, "library_items": 5}
+        with pytest.raises(ValueError):
+            manager.fetch_resource("Home Server", "everything")
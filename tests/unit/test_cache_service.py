@@ -9,7 +9,7 @@ from datetime import datetime, timedelta
 
 import pytest
 
-from plexiglass.services.cache_service import CacheService
+from plexiglass.services.cache_service import MISSING, CacheKey, CacheService
 
 
 class TestCacheServiceInitialization:
@@ -137,6 +137,46 @@ class TestCacheServiceTTL:
         # Size should reflect cleanup
         assert cache.size() == 0
 
+    def test_expiry_uses_monotonic_clock(self):
+        """Test that expiry follows time.monotonic, not wall-clock time."""
+        from unittest.mock import patch
+
+        clock = [1000.0]
+        with patch("plexiglass.services.cache_service.time.monotonic", lambda: clock[0]):
+            cache = CacheService(default_ttl=10)
+            cache.set("short", "value", ttl=5)
+            cache.set("long", "value")
+
+            clock[0] += 6
+            assert cache.size() == 1
+            assert cache.has("long") is True
+
+            clock[0] += 5
+            assert cache.size() == 0
+
+    def test_overwritten_entry_keeps_new_ttl(self):
+        """Test that the expiry record of a replaced entry does not evict its successor."""
+        from unittest.mock import patch
+
+        clock = [0.0]
+        with patch("plexiglass.services.cache_service.time.monotonic", lambda: clock[0]):
+            cache = CacheService()
+            cache.set("key", "old", ttl=1)
+            cache.set("key", "new", ttl=100)
+
+            clock[0] += 2
+            assert cache.size() == 1
+            assert cache.get("key") == "new"
+
+    def test_expiry_heap_stays_bounded(self):
+        """Test that repeated overwrites don't grow the expiry heap without bound."""
+        cache = CacheService()
+        for i in range(10_000):
+            cache.set("key", i)
+
+        assert cache.size() == 1
+        assert len(cache._expiry_heap) <= 2 * cache.size() + 65
+
     def test_get_or_set_with_factory_function(self):
         """Test get_or_set() method with factory function."""
         cache = CacheService()
@@ -200,6 +240,453 @@ class TestCacheServiceStatistics:
         assert stats["hit_rate"] == pytest.approx(0.666, abs=0.01)
 
 
+class TestCacheServiceBounds:
+    """Test size-bounded LRU eviction."""
+
+    def test_default_capacity_is_cache_size(self):
+        """Test the default capacity comes from PerformanceConfig."""
+        from plexiglass.config.performance import PerformanceConfig
+
+        assert CacheService().max_entries == PerformanceConfig.DEFAULT_CACHE_SIZE
+
+    def test_from_settings_honors_cache_size(self):
+        """Test performance.cache_size and cache_ttl configure the cache."""
+        cache = CacheService.from_settings({"performance": {"cache_size": 50, "cache_ttl": 30}})
+
+        assert cache.max_entries == 50
+        assert cache.default_ttl == 30
+
+    def test_evicts_least_recently_used(self):
+        """Test inserting past capacity evicts the least recently used entry."""
+        cache = CacheService(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # "b" is now least recently used
+        cache.set("c", 3)
+
+        assert cache.has("a") is True
+        assert cache.has("b") is False
+        assert cache.has("c") is True
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_overwrite_does_not_evict(self):
+        """Test updating an existing key never evicts another entry."""
+        cache = CacheService(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("a", 10)
+
+        assert cache.size() == 2
+        assert cache.get("a") == 10
+        assert cache.get_stats()["evictions"] == 0
+
+    def test_unbounded_when_disabled(self):
+        """Test max_entries=None disables eviction."""
+        cache = CacheService(max_entries=None)
+        for i in range(2000):
+            cache.set(f"key{i}", i)
+
+        assert cache.size() == 2000
+        assert cache.get_stats()["max_entries"] is None
+
+
+class TestCacheServiceNegativeCaching:
+    """Test cached None values, cached failures and stale-if-error."""
+
+    def test_get_or_set_caches_none(self):
+        """Test that a factory returning None is only called once."""
+        cache = CacheService()
+        calls = []
+
+        def factory():
+            calls.append(1)
+            return None
+
+        assert cache.get_or_set("key", factory) is None
+        assert cache.get_or_set("key", factory) is None
+        assert len(calls) == 1
+
+    def test_get_with_missing_sentinel(self):
+        """Test that MISSING distinguishes a miss from a cached None."""
+        cache = CacheService()
+        cache.set("none", None)
+
+        assert cache.get("none", MISSING) is None
+        assert cache.get("absent", MISSING) is MISSING
+        assert cache.get("absent") is None
+
+    def test_failure_is_cached_for_error_ttl(self):
+        """Test that a failure is re-raised from cache until error_ttl passes."""
+        from unittest.mock import patch
+
+        clock = [0.0]
+        calls = []
+
+        def factory():
+            calls.append(1)
+            raise ConnectionError("server down")
+
+        with patch("plexiglass.services.cache_service.time.monotonic", lambda: clock[0]):
+            cache = CacheService()
+            for _ in range(3):
+                with pytest.raises(ConnectionError):
+                    cache.get_or_set("key", factory, error_ttl=5)
+            assert len(calls) == 1
+            assert cache.has("key") is False
+            assert cache.get("key") is None
+            assert cache.get_stats()["negative_hits"] == 2
+
+            clock[0] += 6
+            with pytest.raises(ConnectionError):
+                cache.get_or_set("key", factory, error_ttl=5)
+            assert len(calls) == 2
+
+    def test_failure_not_cached_without_error_ttl(self):
+        """Test that failures are retried on every call by default."""
+        cache = CacheService()
+        calls = []
+
+        def factory():
+            calls.append(1)
+            raise ValueError("boom")
+
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                cache.get_or_set("key", factory)
+        assert len(calls) == 2
+
+    def test_stale_if_error_serves_last_good_value(self):
+        """Test that the last good value is served while the factory fails."""
+        from unittest.mock import patch
+
+        clock = [0.0]
+        results = ["fresh"]
+
+        def factory():
+            value = results.pop(0)
+            if isinstance(value, Exception):
+                raise value
+            return value
+
+        with patch("plexiglass.services.cache_service.time.monotonic", lambda: clock[0]):
+            cache = CacheService()
+            assert cache.get_or_set("key", factory, ttl=10, stale_if_error=30) == "fresh"
+
+            clock[0] += 15
+            results.append(ConnectionError("down"))
+            assert cache.get_or_set("key", factory, ttl=10, stale_if_error=30) == "fresh"
+            assert cache.get_stats()["stale_served"] == 1
+
+            clock[0] += 30
+            results.append(ConnectionError("down"))
+            with pytest.raises(ConnectionError):
+                cache.get_or_set("key", factory, ttl=10, stale_if_error=30)
+
+    def test_stale_if_error_with_cached_failure(self):
+        """Test that a cached failure still falls back to the stale value."""
+        from unittest.mock import patch
+
+        clock = [0.0]
+        results = ["fresh", ConnectionError("down")]
+
+        def factory():
+            value = results.pop(0)
+            if isinstance(value, Exception):
+                raise value
+            return value
+
+        with patch("plexiglass.services.cache_service.time.monotonic", lambda: clock[0]):
+            cache = CacheService()
+            kwargs = {"ttl": 10, "error_ttl": 5, "stale_if_error": 60}
+            cache.get_or_set("key", factory, **kwargs)
+            clock[0] += 11
+            assert cache.get_or_set("key", factory, **kwargs) == "fresh"
+            assert cache.get_or_set("key", factory, **kwargs) == "fresh"
+            assert results == []
+            assert cache.get_stats()["negative_hits"] == 1
+
+    def test_delete_drops_stale_value(self):
+        """Test that an explicit delete also forgets the stale fallback."""
+        cache = CacheService()
+        cache.get_or_set("key", lambda: "fresh", stale_if_error=60)
+        cache.delete("key")
+
+        def failing():
+            raise ConnectionError("down")
+
+        with pytest.raises(ConnectionError):
+            cache.get_or_set("key", failing)
+
+
+class TestCacheServiceStaleWhileRevalidate:
+    """Test stale-while-revalidate background refresh in get_or_set."""
+
+    def test_stale_value_served_and_refreshed_once(self):
+        """Test that a stale hit returns immediately and schedules one refresh."""
+        import threading
+        from unittest.mock import patch
+
+        clock = [0.0]
+        release = threading.Event()
+        calls = []
+
+        def factory():
+            calls.append(1)
+            if len(calls) > 1:
+                release.wait(5)
+            return f"v{len(calls)}"
+
+        with patch("plexiglass.services.cache_service.time.monotonic", lambda: clock[0]):
+            cache = CacheService()
+            assert cache.get_or_set("key", factory, ttl=10, stale_ttl=30) == "v1"
+
+            clock[0] += 15
+            for _ in range(5):
+                assert cache.get_or_set("key", factory, ttl=10, stale_ttl=30) == "v1"
+            assert cache.get_stats()["background_refreshes"] == 1
+
+            release.set()
+            deadline = time.time() + 5
+            while cache.get("key") != "v2" and time.time() < deadline:
+                time.sleep(0.01)
+            assert cache.get("key") == "v2"
+            assert len(calls) == 2
+        cache.shutdown()
+
+    def test_refresh_runs_off_the_calling_thread(self):
+        """Test that the refresh runs on the cache's worker pool."""
+        import threading
+        from unittest.mock import patch
+
+        clock = [0.0]
+        threads = []
+        done = threading.Event()
+
+        def factory():
+            threads.append(threading.current_thread().name)
+            if len(threads) > 1:
+                done.set()
+            return "value"
+
+        with patch("plexiglass.services.cache_service.time.monotonic", lambda: clock[0]):
+            cache = CacheService()
+            cache.get_or_set("key", factory, ttl=1, stale_ttl=10)
+            clock[0] += 2
+            cache.get_or_set("key", factory, ttl=1, stale_ttl=10)
+            assert done.wait(5)
+        assert threads[1].startswith("cache-refresh")
+        cache.shutdown()
+
+    def test_blocks_past_stale_window(self):
+        """Test that the caller recomputes synchronously once the stale window passes."""
+        from unittest.mock import patch
+
+        clock = [0.0]
+        values = iter(["old", "new"])
+
+        with patch("plexiglass.services.cache_service.time.monotonic", lambda: clock[0]):
+            cache = CacheService()
+            cache.get_or_set("key", lambda: next(values), ttl=10, stale_ttl=5)
+            clock[0] += 16
+            assert cache.get_or_set("key", lambda: next(values), ttl=10, stale_ttl=5) == "new"
+            assert cache.get_stats()["background_refreshes"] == 0
+
+    def test_failed_refresh_keeps_stale_value(self):
+        """Test that a failing background refresh leaves the stale value in place."""
+        import threading
+        from unittest.mock import patch
+
+        clock = [0.0]
+        attempted = threading.Event()
+
+        def failing():
+            attempted.set()
+            raise ConnectionError("down")
+
+        with patch("plexiglass.services.cache_service.time.monotonic", lambda: clock[0]):
+            cache = CacheService()
+            cache.get_or_set("key", lambda: "old", ttl=10, stale_ttl=30)
+            clock[0] += 15
+            assert cache.get_or_set("key", failing, ttl=10, stale_ttl=30) == "old"
+            assert attempted.wait(5)
+            deadline = time.time() + 5
+            while "key" in cache._refreshing and time.time() < deadline:
+                time.sleep(0.01)
+            assert cache.get("key") == "old"
+        cache.shutdown()
+
+
+class TestCacheServiceByteBudget:
+    """Test byte-budgeted eviction and memory-pressure shrinking."""
+
+    @pytest.fixture(autouse=True)
+    def _low_memory(self):
+        """Keep the test process's own memory use from shrinking budgets."""
+        from unittest.mock import patch
+
+        from plexiglass.utils.memory_optimizer import MemoryOptimizer
+
+        with patch.object(MemoryOptimizer, "get_current_rss", return_value=0):
+            yield
+
+    def test_sizes_are_only_measured_with_a_budget(self):
+        """Test that the sizer is not called for a cache without a byte budget."""
+        calls = []
+        cache = CacheService(sizer=lambda value: calls.append(value) or 1)
+        cache.set("key", "value")
+
+        assert calls == []
+        assert cache.get_stats()["bytes"] == 0
+
+    def test_tracks_bytes_across_overwrite_and_delete(self):
+        """Test that byte accounting follows overwrites and deletes."""
+        cache = CacheService(max_bytes=1000, sizer=len)
+        cache.set("a", "x" * 100)
+        cache.set("b", "x" * 50)
+        cache.set("a", "x" * 10)
+        assert cache.get_stats()["bytes"] == 60
+
+        cache.delete("b")
+        assert cache.get_stats()["bytes"] == 10
+
+    def test_evicts_largest_of_coldest_entries(self):
+        """Test that byte-budget eviction prefers the biggest cold entry."""
+        cache = CacheService(max_bytes=1000, sizer=len)
+        cache.set("small-cold", "x" * 100)
+        cache.set("big-cold", "x" * 600)
+        cache.set("small-warm", "x" * 200)
+
+        cache.set("new", "x" * 300)
+
+        assert cache.has("big-cold") is False
+        assert cache.has("small-cold") is True
+        assert cache.has("small-warm") is True
+        assert cache.has("new") is True
+        stats = cache.get_stats()
+        assert stats["bytes"] == 600
+        assert stats["evictions"] == 1
+
+    def test_expiry_releases_bytes(self):
+        """Test that expired entries give their bytes back."""
+        from unittest.mock import patch
+
+        clock = [0.0]
+        with patch("plexiglass.services.cache_service.time.monotonic", lambda: clock[0]):
+            cache = CacheService(max_bytes=1000, sizer=len)
+            cache.set("a", "x" * 100, ttl=5)
+            clock[0] += 10
+            assert cache.get_stats()["bytes"] == 0
+
+    def test_budget_shrinks_under_memory_pressure(self):
+        """Test that crossing WARNING_THRESHOLD halves the budget and trims the cache."""
+        from unittest.mock import patch
+
+        from plexiglass.utils.memory_optimizer import MemoryOptimizer
+
+        cache = CacheService(max_bytes=1000, sizer=len)
+        for i in range(8):
+            cache.set(f"k{i}", "x" * 100)
+        assert cache.get_stats()["bytes"] == 800
+
+        high = MemoryOptimizer.WARNING_THRESHOLD
+        with patch.object(MemoryOptimizer, "get_current_rss", return_value=high):
+            assert cache.check_memory_pressure() == 500
+        assert cache.get_stats()["bytes"] <= 500
+
+        critical = MemoryOptimizer.CRITICAL_THRESHOLD
+        with patch.object(MemoryOptimizer, "get_current_rss", return_value=critical):
+            assert cache.check_memory_pressure() == 250
+
+        # Current RSS, unlike the peak, comes back down and so does the budget.
+        with patch.object(MemoryOptimizer, "get_current_rss", return_value=0):
+            assert cache.check_memory_pressure() == 1000
+
+    def test_unreadable_rss_keeps_last_budget(self):
+        """Test that a platform without an RSS reading leaves the budget alone."""
+        from unittest.mock import patch
+
+        from plexiglass.utils.memory_optimizer import MemoryOptimizer
+
+        cache = CacheService(max_bytes=1000, sizer=len)
+        with patch.object(
+            MemoryOptimizer, "get_current_rss", return_value=MemoryOptimizer.WARNING_THRESHOLD
+        ):
+            cache.check_memory_pressure()
+        with patch.object(MemoryOptimizer, "get_current_rss", return_value=None):
+            assert cache.check_memory_pressure() == 500
+
+    def test_pressure_checked_during_set(self):
+        """Test that set() picks up memory pressure without an explicit check."""
+        from unittest.mock import patch
+
+        from plexiglass.utils.memory_optimizer import MemoryOptimizer
+
+        high = MemoryOptimizer.WARNING_THRESHOLD
+        with patch.object(MemoryOptimizer, "get_current_rss", return_value=high):
+            cache = CacheService(max_bytes=1000, sizer=len)
+            cache.set("a", "x" * 400)
+            cache.set("b", "x" * 400)
+
+        assert cache.get_stats()["effective_max_bytes"] == 500
+        assert cache.get_stats()["bytes"] <= 500
+
+    def test_stale_if_error_copies_count_once_orphaned(self):
+        """Test that a stale-if-error copy counts against the budget once its entry is gone."""
+        from unittest.mock import patch
+
+        clock = [0.0]
+        with patch("plexiglass.services.cache_service.time.monotonic", lambda: clock[0]):
+            cache = CacheService(max_bytes=1000, sizer=len)
+            cache.get_or_set("a", lambda: "x" * 300, ttl=5, stale_if_error=60)
+            # Shared with the live entry: counted once.
+            assert cache.get_stats()["bytes"] == 300
+
+            clock[0] += 10
+            cache.set("b", "x" * 100)
+            # The entry expired; its stale copy is still held.
+            assert cache.get_stats()["size"] == 1
+            assert cache.get_stats()["bytes"] == 400
+
+    def test_orphaned_stale_copies_are_evicted_first(self):
+        """Test that stale-if-error copies go before live entries when over budget."""
+        from unittest.mock import patch
+
+        clock = [0.0]
+        with patch("plexiglass.services.cache_service.time.monotonic", lambda: clock[0]):
+            cache = CacheService(max_bytes=1000, sizer=len)
+            cache.get_or_set("stale", lambda: "x" * 600, ttl=5, stale_if_error=60)
+            clock[0] += 10
+            cache.set("live", "x" * 300)
+            cache.set("new", "x" * 300)
+
+            assert cache.get_stats()["bytes"] == 600
+            assert cache.has("live") is True
+            assert cache.has("new") is True
+
+            def failing():
+                raise ConnectionError("down")
+
+            with pytest.raises(ConnectionError):
+                cache.get_or_set("stale", failing, ttl=5, stale_if_error=60)
+
+    def test_failing_sizer_does_not_break_set(self):
+        """Test that a sizer error counts the entry as zero bytes."""
+
+        def sizer(value):
+            raise TypeError("cannot size")
+
+        cache = CacheService(max_bytes=1000, sizer=sizer)
+        cache.set("key", object())
+
+        assert cache.has("key") is True
+
+    def test_from_settings_uses_cache_max_bytes(self):
+        """Test that from_settings applies performance.cache_max_bytes."""
+        cache = CacheService.from_settings({"performance": {"cache_max_bytes": 2 * 1024 * 1024}})
+
+        assert cache.max_bytes == 2 * 1024 * 1024
+
+
 class TestCacheServiceKeyGeneration:
     """Test cache key generation helpers."""
 
@@ -277,3 +764,194 @@ class TestCacheServiceInvalidation:
         assert cache.has("server:home:sessions") is False
         assert cache.has("server:work:sessions") is False
         assert cache.has("server:home:libraries") is True
+
+    def test_invalidate_prefix_does_not_match_other_keys(self):
+        """Test that prefix invalidation keeps exact startswith semantics."""
+        cache = CacheService()
+        cache.set("a", 1)
+        cache.set("ab", 2)
+        cache.set("abc", 3)
+        cache.set("b", 4)
+
+        cache.invalidate_prefix("ab")
+
+        assert cache.has("a") is True
+        assert cache.has("ab") is False
+        assert cache.has("abc") is False
+        assert cache.has("b") is True
+
+    def test_invalidate_prefix_within_and_across_key_groups(self):
+        """Test that prefixes shorter or longer than a key group keep startswith semantics."""
+        cache = CacheService()
+        for key in ("plex:1:sessions", "plex:1:sections", "plex:10:sessions", "plexus", "other"):
+            cache.set(key, key)
+
+        cache.invalidate_prefix("plex:1:se")
+        assert cache.has("plex:1:sessions") is False
+        assert cache.has("plex:1:sections") is False
+        assert cache.has("plex:10:sessions") is True
+
+        cache.invalidate_prefix("plex")
+        assert cache.has("plex:10:sessions") is False
+        assert cache.has("plexus") is False
+        assert cache.has("other") is True
+        assert cache._key_groups == {"other": {"other"}}
+
+    def test_invalidate_pattern_with_literal_prefix(self):
+        """Test pattern invalidation narrowed by the pattern's literal prefix."""
+        cache = CacheService()
+        cache.set("server:home:sessions", 1)
+        cache.set("server:home:libraries", 2)
+        cache.set("server:work:sessions", 3)
+
+        cache.invalidate_pattern("server:home:s*")
+
+        assert cache.has("server:home:sessions") is False
+        assert cache.has("server:home:libraries") is True
+        assert cache.has("server:work:sessions") is True
+
+    @pytest.mark.parametrize(
+        "invalidate",
+        [
+            lambda cache: cache.delete("plex:home:sessions"),
+            lambda cache: cache.invalidate_prefix("plex:home:"),
+            lambda cache: cache.invalidate_pattern("plex:*:sessions"),
+            lambda cache: cache.invalidate_tags({"server:home"}),
+            lambda cache: cache.clear(),
+        ],
+    )
+    def test_invalidation_during_fetch_skips_store(self, invalidate):
+        """Test that a value fetched across an invalidation is returned but not cached."""
+        cache = CacheService()
+        key = CacheKey.build("plex", "home", "sessions")
+
+        def factory():
+            invalidate(cache)
+            return "before-change"
+
+        assert cache.get_or_set(key, factory) == "before-change"
+        assert cache.get(key, MISSING) is MISSING
+        assert cache.get_or_set(key, lambda: "after-change") == "after-change"
+        assert cache.get(key) == "after-change"
+        assert cache._computing == {}
+
+    def test_unrelated_invalidation_during_fetch_still_stores(self):
+        """Test that invalidating other keys mid-fetch doesn't discard the result."""
+        cache = CacheService()
+
+        def factory():
+            cache.invalidate_prefix("plex:work:")
+            return "value"
+
+        cache.get_or_set("plex:home:sessions", factory)
+
+        assert cache.get("plex:home:sessions") == "value"
+
+    def test_invalidation_during_background_refresh_skips_store(self):
+        """Test that a stale-while-revalidate refresh doesn't undo an invalidation."""
+        import threading
+        from unittest.mock import patch
+
+        clock = [0.0]
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_refresh():
+            started.set()
+            release.wait(5)
+            return "before-change"
+
+        with patch("plexiglass.services.cache_service.time.monotonic", lambda: clock[0]):
+            cache = CacheService()
+            cache.get_or_set("key", lambda: "old", ttl=10, stale_ttl=30)
+            clock[0] += 15
+            assert cache.get_or_set("key", slow_refresh, ttl=10, stale_ttl=30) == "old"
+            assert started.wait(5)
+
+            cache.delete("key")
+            release.set()
+            deadline = time.time() + 5
+            while "key" in cache._refreshing and time.time() < deadline:
+                time.sleep(0.01)
+
+            assert cache.get("key", MISSING) is MISSING
+        cache.shutdown()
+
+
+class TestCacheServiceTags:
+    """Test structured keys and tag-based invalidation."""
+
+    def test_cache_key_renders_structure(self):
+        """Test that a CacheKey renders as namespace:server:resource[:params]."""
+        assert str(CacheKey("plex", "Office", "sessions")) == "plex:Office:sessions"
+        keyed = CacheKey.build("plex", "Office", "library", section=3, sort="title")
+        assert str(keyed).startswith("plex:Office:library:")
+        assert keyed == CacheKey.build("plex", "Office", "library", sort="title", section=3)
+        assert keyed != CacheKey.build("plex", "Office", "library", section=4, sort="title")
+
+    def test_cache_key_usable_for_get_and_delete(self):
+        """Test that CacheKey and its string form address the same entry."""
+        cache = CacheService()
+        key = CacheKey("plex", "Office", "sessions")
+        cache.set(key, [1, 2])
+
+        assert cache.get(key) == [1, 2]
+        assert cache.get("plex:Office:sessions") == [1, 2]
+        cache.delete(key)
+        assert cache.has(key) is False
+
+    def test_invalidate_tags(self):
+        """Test that only entries carrying a matching tag are invalidated."""
+        cache = CacheService()
+        cache.set(CacheKey("plex", "office", "library"), "lib3", tags={"library:3"})
+        cache.set(CacheKey("plex", "office", "sessions"), "sessions")
+        cache.set(CacheKey("plex", "home", "library"), "lib3-home", tags={"library:3"})
+        cache.set(CacheKey("plex", "home", "sessions"), "home-sessions")
+
+        removed = cache.invalidate_tags({"server:office", "library:3"})
+
+        assert removed == 3
+        assert cache.get(CacheKey("plex", "home", "sessions")) == "home-sessions"
+        assert cache.size() == 1
+
+    def test_invalidate_tags_on_plain_keys(self):
+        """Test that explicit tags work with plain string keys."""
+        cache = CacheService()
+        cache.set("a", 1, tags={"group"})
+        cache.set("b", 2)
+
+        assert cache.invalidate_tags(["group"]) == 1
+        assert cache.has("a") is False
+        assert cache.has("b") is True
+
+    def test_overwrite_replaces_tags(self):
+        """Test that re-setting a key replaces its tags."""
+        cache = CacheService()
+        cache.set("key", 1, tags={"old"})
+        cache.set("key", 2, tags={"new"})
+
+        assert cache.invalidate_tags({"old"}) == 0
+        assert cache.invalidate_tags({"new"}) == 1
+
+    def test_get_or_set_tags_computed_value(self):
+        """Test that get_or_set indexes the tags of the value it computes."""
+        cache = CacheService()
+        cache.get_or_set(CacheKey("plex", "office", "info"), lambda: "info")
+
+        assert cache.invalidate_tags({"server:office"}) == 1
+
+    def test_indexes_follow_eviction_and_expiry(self):
+        """Test that evicted and expired keys leave no index records behind."""
+        from unittest.mock import patch
+
+        clock = [0.0]
+        with patch("plexiglass.services.cache_service.time.monotonic", lambda: clock[0]):
+            cache = CacheService(max_entries=2)
+            cache.set("a", 1, tags={"t"})
+            cache.set("b", 2, ttl=5, tags={"t"})
+            cache.set("c", 3, tags={"t"})
+            clock[0] += 10
+            cache.size()
+
+            assert cache._key_groups == {"c": {"c"}}
+            assert cache._tag_index == {"t": {"c"}}
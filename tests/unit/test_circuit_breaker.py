@@ -0,0 +1,91 @@
+"""
+Unit tests for CircuitBreaker.
+
+Tests closed / open / half-open transitions per key.
+"""
+
+from unittest.mock import patch
+
+from plexiglass.services.circuit_breaker import CircuitBreaker, CircuitState
+
+
+class TestCircuitBreaker:
+    """Test CircuitBreaker state transitions."""
+
+    def test_opens_after_threshold(self):
+        """A circuit opens after the configured number of consecutive failures."""
+        breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=30)
+
+        breaker.record_failure("Home")
+        assert breaker.get_state("Home") is CircuitState.CLOSED
+        assert breaker.allow("Home") is True
+
+        breaker.record_failure("Home")
+        assert breaker.get_state("Home") is CircuitState.OPEN
+        assert breaker.allow("Home") is False
+
+    def test_keys_are_independent(self):
+        """Failures on one key never affect another."""
+        breaker = CircuitBreaker(failure_threshold=1)
+
+        breaker.record_failure("Home")
+
+        assert breaker.allow("Home") is False
+        assert breaker.allow("Lab") is True
+
+    def test_success_resets_failure_count(self):
+        """A success closes the circuit and clears the failure count."""
+        breaker = CircuitBreaker(failure_threshold=2)
+
+        breaker.record_failure("Home")
+        breaker.record_success("Home")
+        breaker.record_failure("Home")
+
+        assert breaker.get_state("Home") is CircuitState.CLOSED
+
+    def test_half_open_admits_single_trial(self):
+        """After the recovery timeout exactly one trial call is admitted."""
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=30)
+        with patch("plexiglass.services.circuit_breaker.time.monotonic", return_value=100.0):
+            breaker.record_failure("Home")
+
+        with patch("plexiglass.services.circuit_breaker.time.monotonic", return_value=131.0):
+            assert breaker.allow("Home") is True
+            assert breaker.get_state("Home") is CircuitState.HALF_OPEN
+            assert breaker.allow("Home") is False
+
+    def test_half_open_trial_outcome(self):
+        """A successful trial closes the circuit; a failed one re-opens it."""
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0)
+
+        breaker.record_failure("Home")
+        assert breaker.allow("Home") is True
+        breaker.record_failure("Home")
+        assert breaker.get_state("Home") is CircuitState.OPEN
+
+        assert breaker.allow("Home") is True
+        breaker.record_success("Home")
+        assert breaker.get_state("Home") is CircuitState.CLOSED
+
+    def test_release_frees_trial_slot(self):
+        """Releasing a trial lets the next caller run it."""
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0)
+        breaker.record_failure("Home")
+        assert breaker.allow("Home") is True
+
+        breaker.release("Home")
+
+        assert breaker.allow("Home") is True
+
+    def test_retry_after_and_reset(self):
+        """retry_after reports the remaining open time; reset closes circuits."""
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=30)
+        breaker.record_failure("Home")
+
+        assert 0 < breaker.retry_after("Home") <= 30
+        assert breaker.get_stats()["circuits"] == {"Home": "open"}
+
+        breaker.reset()
+
+        assert breaker.get_state("Home") is CircuitState.CLOSED
+        assert breaker.retry_after("Home") == 0.0
@@ -569,6 +569,64 @@ servers:
         assert config["servers"][0]["tags"][0] == "testing"
         assert config["servers"][0]["tags"][1] == "development"
 
+    def test_server_with_url_list(self, tmp_path: Path) -> None:
+        """
+        Test that servers may declare several candidate URLs.
+
+        Expected behavior:
+        - `urls` is accepted in place of `url`
+        - `url` is merged in first and duplicates are dropped
+        - `url` always holds the first candidate
+        """
+        config_content = """
+servers:
+  - name: "LAN only"
+    urls: ["http://192.168.1.100:32400", "https://relay.plex.direct:443"]
+    token: "token"
+  - name: "Mixed"
+    url: "http://192.168.1.100:32400"
+    urls: ["https://wan.example.com:32400", "http://192.168.1.100:32400"]
+    token: "token"
+"""
+        config_file = tmp_path / "servers.yaml"
+        config_file.write_text(config_content)
+
+        from plexiglass.config.loader import ConfigLoader
+
+        loader = ConfigLoader(config_file)
+        lan_only, mixed = loader.load()["servers"]
+
+        assert lan_only["url"] == "http://192.168.1.100:32400"
+        assert lan_only["urls"] == ["http://192.168.1.100:32400", "https://relay.plex.direct:443"]
+        assert mixed["urls"] == ["http://192.168.1.100:32400", "https://wan.example.com:32400"]
+
+    def test_server_requires_url_or_urls(self, tmp_path: Path) -> None:
+        """
+        Test that a server without `url` or `urls` is rejected.
+        """
+        config_content = """
+servers:
+  - name: "No address"
+    token: "token"
+  - name: "Bad list"
+    urls: "http://localhost:32400"
+    token: "token"
+"""
+        config_file = tmp_path / "servers.yaml"
+        config_file.write_text(config_content)
+
+        from plexiglass.config.loader import ConfigLoader
+        from plexiglass.config.exceptions import ConfigurationError
+
+        loader = ConfigLoader(config_file)
+        with pytest.raises(ConfigurationError, match="url"):
+            loader.load()
+
+        no_address = '  - name: "No address"\n    token: "token"\n'
+        config_file.write_text(config_content.replace(no_address, ""))
+        with pytest.raises(ConfigurationError, match="must be a list of URLs"):
+            loader.load()
+
 
 # Fixtures
 
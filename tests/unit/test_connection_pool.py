@@ -5,12 +5,16 @@ Tests advanced connection pooling features including health checking,
 statistics tracking, and pool management.
 """
 
+import threading
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
+import requests
 from plexapi.exceptions import Unauthorized
 
 from plexiglass.config.loader import ConfigLoader
+from plexiglass.config.performance import PerformanceConfig
 from plexiglass.services.exceptions import ConnectionError, ServerNotFoundError
 
 
@@ -76,6 +80,271 @@ class TestConnectionHealthChecking:
 
         assert is_healthy is False
 
+    def test_health_check_probes_identity(self, mock_config, mock_server):
+        """Health checks issue a live /identity request instead of reading cached attributes."""
+        from plexiglass.services.server_manager import ServerManager
+
+        manager = ServerManager(mock_config)
+
+        with patch("plexiglass.services.server_manager.PlexServer") as mock_plex:
+            mock_plex.return_value = mock_server
+            manager.connect_to_server("test_server")
+            manager.check_connection_health("test_server")
+
+        mock_server.query.assert_called_once()
+        assert mock_server.query.call_args.args[0] == "/identity"
+
+    def test_failed_probes_mark_server_down(self, mock_config, mock_server):
+        """Repeated probe failures mark the server down and unavailable."""
+        from plexiglass.services.server_manager import ServerManager
+
+        manager = ServerManager(mock_config)
+        mock_server.query.side_effect = TimeoutError("timed out")
+
+        with patch("plexiglass.services.server_manager.PlexServer") as mock_plex:
+            mock_plex.return_value = mock_server
+            manager.connect_to_server("test_server")
+
+            assert manager.check_connection_health("test_server") is False
+            manager.check_connection_health("test_server")
+
+        assert manager.get_server_health("test_server").state.value == "down"
+        assert manager.is_server_available("test_server") is False
+
+    def test_status_skips_fetches_for_down_server(self, mock_config, mock_server):
+        """Status for a down server does not wait on sessions or library requests."""
+        from plexiglass.services.server_manager import ServerManager
+
+        manager = ServerManager(mock_config)
+
+        with patch("plexiglass.services.server_manager.PlexServer") as mock_plex:
+            mock_plex.return_value = mock_server
+            manager.connect_to_server("test_server")
+            manager.health.record_failure("test_server", TimeoutError())
+            manager.health.record_failure("test_server", TimeoutError())
+
+            status = manager.get_server_status("test_server")
+
+        assert status["health"] == "down"
+        mock_server.sessions.assert_not_called()
+        mock_server.library.sections.assert_not_called()
+
+    def test_disconnect_forgets_health(self, mock_config, mock_server):
+        """Disconnecting drops the server's health record."""
+        from plexiglass.services.server_manager import ServerManager
+
+        manager = ServerManager(mock_config)
+
+        with patch("plexiglass.services.server_manager.PlexServer") as mock_plex:
+            mock_plex.return_value = mock_server
+            manager.connect_to_server("test_server")
+            manager.check_connection_health("test_server")
+            manager.disconnect_server("test_server")
+
+        assert manager.get_server_health("test_server").state.value == "unknown"
+
+
+class TestCircuitBreaking:
+    """Test that failing servers fail fast instead of timing out repeatedly."""
+
+    def test_status_fetches_stop_once_circuit_opens(self, mock_config, mock_server):
+        """A flapping server is called a bounded number of times across refreshes."""
+        from plexiglass.services.server_manager import ServerManager
+
+        manager = ServerManager(mock_config)
+        mock_server.sessions.side_effect = TimeoutError("timed out")
+        mock_server.library.sections.side_effect = TimeoutError("timed out")
+
+        with (
+            patch("plexiglass.services.server_manager.PlexServer") as mock_plex,
+            patch("plexiglass.services.error_handler.time.sleep"),
+        ):
+            mock_plex.return_value = mock_server
+            manager.connect_to_server("test_server")
+            for _ in range(3):
+                status = manager.get_server_status("test_server")
+
+        assert status["session_count"] == 0
+        calls = mock_server.sessions.call_count + mock_server.library.sections.call_count
+        assert calls == PerformanceConfig.DEFAULT_CIRCUIT_FAILURE_THRESHOLD
+
+    def test_cache_hits_bypass_the_circuit_breaker(self, mock_config, mock_server):
+        """Cached data is served while the circuit is open, and hits don't count as successes."""
+        from plexiglass.services.server_manager import ServerManager
+
+        manager = ServerManager(mock_config)
+        mock_server.sessions.return_value = [MagicMock(title="Movie", sessionKey=1)]
+        breaker = manager.error_handler.circuit_breaker
+
+        with patch("plexiglass.services.server_manager.PlexServer") as mock_plex:
+            mock_plex.return_value = mock_server
+            manager.connect_to_server("test_server")
+            assert len(manager.fetch_resource("test_server", "now_playing")) == 1
+
+            with patch.object(breaker, "record_success") as record_success:
+                manager.fetch_resource("test_server", "now_playing")
+            record_success.assert_not_called()
+
+            for _ in range(PerformanceConfig.DEFAULT_CIRCUIT_FAILURE_THRESHOLD):
+                breaker.record_failure("test_server")
+            entries = manager.fetch_resource("test_server", "now_playing")
+
+        assert [entry["title"] for entry in entries] == ["Movie"]
+        assert mock_server.sessions.call_count == 1
+
+    def test_connect_fails_fast_when_circuit_open(self, mock_config):
+        """Connecting to a server with an open circuit raises without a network call."""
+        from plexiglass.services.exceptions import CircuitOpenError
+        from plexiglass.services.server_manager import ServerManager
+
+        manager = ServerManager(mock_config)
+        for _ in range(PerformanceConfig.DEFAULT_CIRCUIT_FAILURE_THRESHOLD):
+            manager.error_handler.circuit_breaker.record_failure("test_server")
+
+        with patch("plexiglass.services.server_manager.PlexServer") as mock_plex:
+            with pytest.raises(CircuitOpenError):
+                manager.connect_to_server("test_server")
+
+        mock_plex.assert_not_called()
+
+
+class TestEndpointFailover:
+    """Test multi-URL endpoint racing and failover."""
+
+    URLS = ["http://lan:32400", "https://wan:32400", "https://relay:443"]
+
+    @pytest.fixture
+    def multi_url_config(self, mock_config):
+        server = mock_config.get_servers.return_value[0]
+        server["url"] = self.URLS[0]
+        server["urls"] = list(self.URLS)
+        return mock_config
+
+    def test_connect_picks_fastest_responsive_endpoint(self, multi_url_config, mock_server):
+        """The first candidate to answer /identity wins; dead ones are ignored."""
+        from plexiglass.services.server_manager import ServerManager
+
+        def measure(server_config, url, timeout):
+            if url == self.URLS[0]:
+                raise requests.exceptions.ConnectTimeout("LAN unreachable")
+            if url == self.URLS[2]:
+                time.sleep(0.2)
+            return 12.0
+
+        manager = ServerManager(multi_url_config)
+        with (
+            patch.object(ServerManager, "_measure_endpoint", side_effect=measure),
+            patch("plexiglass.services.server_manager.PlexServer") as mock_plex,
+        ):
+            mock_plex.return_value = mock_server
+            manager.connect_to_server("test_server")
+
+        assert mock_plex.call_args.kwargs["baseurl"] == self.URLS[1]
+        endpoint = manager.get_endpoint("test_server")
+        assert endpoint.url == self.URLS[1]
+        assert endpoint.rtt_ms == 12.0
+
+        status = manager.get_server_status("test_server")
+        assert status["url"] == self.URLS[1]
+        assert status["endpoint_rtt_ms"] == 12.0
+
+    def test_single_url_is_not_raced(self, mock_config, mock_server):
+        """Servers with one URL connect directly without probing."""
+        from plexiglass.services.server_manager import ServerManager
+
+        manager = ServerManager(mock_config)
+        with (
+            patch.object(ServerManager, "_measure_endpoint") as mock_measure,
+            patch("plexiglass.services.server_manager.PlexServer") as mock_plex,
+        ):
+            mock_plex.return_value = mock_server
+            manager.connect_to_server("test_server")
+
+        mock_measure.assert_not_called()
+        assert manager.get_endpoint("test_server").url == "http://localhost:32400"
+
+    def test_failing_requests_fail_over_to_next_endpoint(self, multi_url_config):
+        """Transport failures on the active endpoint move the server to another URL."""
+        from plexiglass.services.server_manager import ServerManager
+
+        failing = MagicMock()
+        failing.sessions.side_effect = requests.exceptions.ConnectionError("reset")
+        healthy = MagicMock()
+        healthy.sessions.return_value = ["session"]
+        healthy.library.sections.return_value = []
+
+        manager = ServerManager(multi_url_config)
+        with (
+            patch.object(ServerManager, "_measure_endpoint", return_value=5.0),
+            patch("plexiglass.services.server_manager.PlexServer", side_effect=[failing, healthy]),
+            patch("plexiglass.services.error_handler.time.sleep"),
+        ):
+            manager.connect_to_server("test_server")
+            first_url = manager.get_endpoint("test_server").url
+            status = manager.get_server_status("test_server")
+
+        assert status["session_count"] == 1
+        assert manager.get_endpoint("test_server").url != first_url
+        assert manager._connection_pool["test_server"] is healthy
+
+    def test_failed_probe_fails_over_to_answering_endpoint(self, multi_url_config):
+        """A probe failure re-races the other URLs, so the server isn't left down."""
+        from plexiglass.services.server_manager import ServerManager
+
+        failing = MagicMock()
+        failing.query.side_effect = requests.exceptions.ConnectionError("route lost")
+        healthy = MagicMock()
+
+        # The LAN URL wins the connect race; afterwards only the relay answers.
+        answering = {self.URLS[0]}
+
+        def measure(server_config, url, timeout):
+            if url not in answering:
+                raise requests.exceptions.ConnectTimeout("unreachable")
+            return 5.0
+
+        manager = ServerManager(multi_url_config)
+        with (
+            patch.object(ServerManager, "_measure_endpoint", side_effect=measure),
+            patch("plexiglass.services.server_manager.PlexServer", side_effect=[failing, healthy]),
+        ):
+            manager.connect_to_server("test_server")
+            answering.clear()
+            answering.add(self.URLS[2])
+            manager.probe_server("test_server")
+
+        healthy.query.assert_called_once()
+        assert manager.get_endpoint("test_server").url == self.URLS[2]
+        assert manager._connection_pool["test_server"] is healthy
+
+    def test_probe_does_not_fail_over_when_nothing_answers(self, multi_url_config):
+        """With every URL unreachable the probe fails without reconnecting."""
+        from plexiglass.services.server_manager import ServerManager
+
+        failing = MagicMock()
+        failing.query.side_effect = requests.exceptions.ConnectionError("down")
+        reached = {"connect": False}
+
+        def measure(server_config, url, timeout):
+            if not reached["connect"]:
+                reached["connect"] = True
+                return 5.0
+            raise requests.exceptions.ConnectTimeout("unreachable")
+
+        manager = ServerManager(multi_url_config)
+        with (
+            patch.object(ServerManager, "_measure_endpoint", side_effect=measure),
+            patch(
+                "plexiglass.services.server_manager.PlexServer", return_value=failing
+            ) as mock_plex,
+        ):
+            manager.connect_to_server("test_server")
+            with pytest.raises(requests.exceptions.ConnectionError):
+                manager.probe_server("test_server")
+
+        assert mock_plex.call_count == 1
+        assert manager._connection_pool["test_server"] is failing
+
 
 class TestConnectionPoolStatistics:
     """Test connection pool statistics tracking."""
@@ -192,3 +461,443 @@ class TestConnectionReuse:
 
             manager.disconnect_all()
             assert manager.get_pool_statistics()["pool_size"] == 0
+
+
+class TestConcurrentConnect:
+    """Test parallel connect_many / connect_all."""
+
+    @staticmethod
+    def _add_servers(mock_config, count):
+        mock_config.get_servers.return_value[:] = [
+            {"name": f"server{idx}", "url": f"http://host{idx}:32400", "token": "t"}
+            for idx in range(count)
+        ]
+
+    def test_connect_all_connects_every_server(self, mock_config, mock_server):
+        """connect_all returns a successful result per configured server."""
+        from plexiglass.services.server_manager import ServerManager
+
+        self._add_servers(mock_config, 3)
+        manager = ServerManager(mock_config)
+
+        with patch("plexiglass.services.server_manager.PlexServer") as mock_plex:
+            mock_plex.return_value = mock_server
+            results = manager.connect_all()
+
+        assert list(results) == ["server0", "server1", "server2"]
+        assert all(result.ok for result in results.values())
+        assert sorted(manager.get_connected_servers()) == ["server0", "server1", "server2"]
+
+    def test_connect_many_runs_in_parallel_within_limit(self, mock_config, mock_server):
+        """Handshakes overlap, but never beyond max_concurrent_requests."""
+        from plexiglass.services.server_manager import ServerManager
+
+        self._add_servers(mock_config, 6)
+        mock_config.get_settings.return_value["performance"]["max_concurrent_requests"] = 3
+        manager = ServerManager(mock_config)
+
+        lock = threading.Lock()
+        active = {"now": 0, "peak": 0}
+
+        def slow_connect(**kwargs):
+            with lock:
+                active["now"] += 1
+                active["peak"] = max(active["peak"], active["now"])
+            time.sleep(0.05)
+            with lock:
+                active["now"] -= 1
+            return mock_server
+
+        with patch("plexiglass.services.server_manager.PlexServer") as mock_plex:
+            mock_plex.side_effect = slow_connect
+            results = manager.connect_many([f"server{idx}" for idx in range(6)])
+
+        assert len(results) == 6
+        assert active["peak"] == 3
+
+    def test_one_bad_server_does_not_abort_batch(self, mock_config, mock_server):
+        """Failures are reported per server while the rest still connect."""
+        from plexiglass.services.server_manager import ServerManager
+
+        self._add_servers(mock_config, 3)
+        manager = ServerManager(mock_config)
+
+        def connect(**kwargs):
+            if kwargs["baseurl"] == "http://host1:32400":
+                raise Unauthorized("bad token")
+            return mock_server
+
+        with patch("plexiglass.services.server_manager.PlexServer") as mock_plex:
+            mock_plex.side_effect = connect
+            results = manager.connect_many(["server0", "server1", "server2", "missing"])
+
+        assert results["server0"].ok
+        assert results["server2"].ok
+        assert isinstance(results["server1"].error, ConnectionError)
+        assert isinstance(results["missing"].error, ServerNotFoundError)
+        assert sorted(manager.get_connected_servers()) == ["server0", "server2"]
+
+    def test_connect_many_with_no_names(self, mock_config):
+        """An empty batch is a no-op."""
+        from plexiglass.services.server_manager import ServerManager
+
+        manager = ServerManager(mock_config)
+
+        assert manager.connect_many([]) == {}
+
+
+class TestSharedHttpSessions:
+    """Test per-server keep-alive HTTP sessions."""
+
+    def test_plex_server_receives_pooled_session(self, mock_config, mock_server):
+        """Each server connection is built on a session sized from the settings."""
+        from plexiglass.services.server_manager import ServerManager
+
+        mock_config.get_settings.return_value["performance"]["max_concurrent_requests"] = 4
+        manager = ServerManager(mock_config)
+
+        with patch("plexiglass.services.server_manager.PlexServer") as mock_plex:
+            mock_plex.return_value = mock_server
+            manager.connect_to_server("test_server")
+
+        session = mock_plex.call_args.kwargs["session"]
+        adapter = session.get_adapter("http://localhost:32400")
+        assert adapter._pool_maxsize == 4
+        assert manager.get_pool_statistics()["connections_per_server"] == 4
+
+    def test_pool_max_size_caps_connections_per_server(self, mock_config):
+        """pool_max_size caps sockets per server below max_concurrent_requests."""
+        from plexiglass.services.server_manager import ServerManager
+
+        mock_config.get_settings.return_value["performance"].update(
+            {"max_concurrent_requests": 8, "pool_max_size": 2}
+        )
+        manager = ServerManager(mock_config)
+
+        assert manager.get_pool_statistics()["connections_per_server"] == 2
+
+    def test_hedging_session_when_enabled(self, mock_config, mock_server):
+        """hedge_requests switches servers to the hedging transport and reports its counters."""
+        from plexiglass.services.server_manager import ServerManager
+        from plexiglass.services.transport import HedgingSession
+
+        mock_config.get_settings.return_value["performance"].update(
+            {"hedge_requests": True, "hedge_percentile": 90}
+        )
+        manager = ServerManager(mock_config)
+
+        with patch("plexiglass.services.server_manager.PlexServer") as mock_plex:
+            mock_plex.return_value = mock_server
+            manager.connect_to_server("test_server")
+
+        session = mock_plex.call_args.kwargs["session"]
+        assert isinstance(session, HedgingSession)
+        assert session.percentile == 90
+        stats = manager.get_pool_statistics()["http_pools"]["test_server"]
+        assert stats["hedging"] == {"requests": 0, "hedged": 0, "hedge_wins": 0}
+        manager.disconnect_all()
+
+    def test_coalescing_session_by_default(self, mock_config, mock_server):
+        """Servers get a coalescing transport unless coalesce_requests is off."""
+        from plexiglass.services.server_manager import ServerManager
+        from plexiglass.services.transport import CoalescingSession
+
+        manager = ServerManager(mock_config)
+        with patch("plexiglass.services.server_manager.PlexServer") as mock_plex:
+            mock_plex.return_value = mock_server
+            manager.connect_to_server("test_server")
+
+        assert isinstance(mock_plex.call_args.kwargs["session"], CoalescingSession)
+        stats = manager.get_pool_statistics()
+        assert stats["http_pools"]["test_server"]["coalescing"]["coalesced"] == 0
+        assert stats["requests_coalesced"] == 0
+        manager.disconnect_all()
+
+        mock_config.get_settings.return_value["performance"]["coalesce_requests"] = False
+        manager = ServerManager(mock_config)
+        with patch("plexiglass.services.server_manager.PlexServer") as mock_plex:
+            mock_plex.return_value = mock_server
+            manager.connect_to_server("test_server")
+
+        assert not isinstance(mock_plex.call_args.kwargs["session"], CoalescingSession)
+        manager.disconnect_all()
+
+    def test_ssl_verify_is_applied_to_session(self, mock_config, mock_server):
+        """ssl_verify: false in the server config disables certificate checks."""
+        from plexiglass.services.server_manager import ServerManager
+
+        mock_config.get_servers.return_value[0]["ssl_verify"] = False
+        manager = ServerManager(mock_config)
+
+        with patch("plexiglass.services.server_manager.PlexServer") as mock_plex:
+            mock_plex.return_value = mock_server
+            manager.connect_to_server("test_server")
+
+        assert mock_plex.call_args.kwargs["session"].verify is False
+
+    def test_disconnect_closes_session(self, mock_config, mock_server):
+        """Disconnecting a server closes its HTTP session."""
+        from plexiglass.services.server_manager import ServerManager
+
+        manager = ServerManager(mock_config)
+
+        with patch("plexiglass.services.server_manager.PlexServer") as mock_plex:
+            mock_plex.return_value = mock_server
+            manager.connect_to_server("test_server")
+            session = mock_plex.call_args.kwargs["session"]
+
+        with patch.object(session, "close") as mock_close:
+            manager.disconnect_server("test_server")
+
+        mock_close.assert_called_once()
+        assert manager.get_pool_statistics()["http_pools"] == {}
+
+    def test_session_closed_when_connect_fails(self, mock_config):
+        """A failed handshake does not leak its session."""
+        from plexiglass.services.server_manager import ServerManager
+
+        manager = ServerManager(mock_config)
+
+        with patch("plexiglass.services.server_manager.PlexServer") as mock_plex:
+            mock_plex.side_effect = Unauthorized("bad token")
+            with patch("requests.Session.close") as mock_close:
+                with pytest.raises(ConnectionError):
+                    manager.connect_to_server("test_server")
+
+        mock_close.assert_called_once()
+
+    def test_statistics_report_connection_reuse(self, mock_config, mock_server):
+        """Repeated requests reuse one keep-alive socket and show up in stats."""
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        from plexiglass.services.server_manager import ServerManager
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                body = b"<MediaContainer/>"
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+        thread.start()
+        base_url = f"http://127.0.0.1:{httpd.server_address[1]}"
+        mock_config.get_servers.return_value[0]["url"] = base_url
+
+        try:
+            manager = ServerManager(mock_config)
+            with patch("plexiglass.services.server_manager.PlexServer") as mock_plex:
+                mock_plex.return_value = mock_server
+                manager.connect_to_server("test_server")
+            session = mock_plex.call_args.kwargs["session"]
+
+            for _ in range(3):
+                session.get(f"{base_url}/identity", timeout=5).raise_for_status()
+
+            stats = manager.get_pool_statistics()
+        finally:
+            manager.disconnect_all()
+            httpd.shutdown()
+            httpd.server_close()
+
+        pool = stats["http_pools"]["test_server"]
+        assert pool["requests"] == 3
+        assert pool["opened"] == 1
+        assert pool["in_use"] == 0
+        assert stats["http_connections_opened"] == 1
+
+
+class TestBoundedPool:
+    """Test LRU bounding and idle eviction of the connection pool."""
+
+    @staticmethod
+    def _add_servers(mock_config, count):
+        mock_config.get_servers.return_value[:] = [
+            {"name": f"server{idx}", "url": f"http://host{idx}:32400", "token": "t"}
+            for idx in range(count)
+        ]
+
+    def test_pool_evicts_least_recently_used(self, mock_config, mock_server):
+        """Exceeding max_connected_servers evicts the least-recently-used connection."""
+        from plexiglass.services.server_manager import ServerManager
+
+        self._add_servers(mock_config, 3)
+        mock_config.get_settings.return_value["performance"]["max_connected_servers"] = 2
+        manager = ServerManager(mock_config)
+
+        with patch("plexiglass.services.server_manager.PlexServer") as mock_plex:
+            mock_plex.return_value = mock_server
+            manager.connect_to_server("server0")
+            manager.connect_to_server("server1")
+            manager.connect_to_server("server0")  # server1 is now least recently used
+            manager.connect_to_server("server2")
+
+        stats = manager.get_pool_statistics()
+        assert sorted(stats["connected_servers"]) == ["server0", "server2"]
+        assert stats["evictions"] == 1
+
+    def test_eviction_closes_http_session(self, mock_config, mock_server):
+        """Evicted connections release their sockets."""
+        from plexiglass.services.server_manager import ServerManager
+
+        self._add_servers(mock_config, 2)
+        mock_config.get_settings.return_value["performance"]["max_connected_servers"] = 1
+        manager = ServerManager(mock_config)
+
+        with patch("plexiglass.services.server_manager.PlexServer") as mock_plex:
+            mock_plex.return_value = mock_server
+            manager.connect_to_server("server0")
+            first_session = mock_plex.call_args.kwargs["session"]
+            with patch.object(first_session, "close") as mock_close:
+                manager.connect_to_server("server1")
+
+        mock_close.assert_called_once()
+
+    def test_hit_and_miss_counters(self, mock_config, mock_server):
+        """Pool lookups are counted as hits or misses."""
+        from plexiglass.services.server_manager import ServerManager
+
+        manager = ServerManager(mock_config)
+
+        with patch("plexiglass.services.server_manager.PlexServer") as mock_plex:
+            mock_plex.return_value = mock_server
+            manager.connect_to_server("test_server")
+            manager.connect_to_server("test_server")
+            manager.connect_to_server("test_server")
+
+        stats = manager.get_pool_statistics()
+        assert stats["misses"] == 1
+        assert stats["hits"] == 2
+        assert stats["evictions"] == 0
+
+    def test_idle_connections_are_closed(self, mock_config, mock_server):
+        """Connections idle past pool_idle_timeout are evicted."""
+        from plexiglass.services.server_manager import ServerManager
+
+        self._add_servers(mock_config, 2)
+        mock_config.get_settings.return_value["performance"]["pool_idle_timeout"] = 0.05
+        manager = ServerManager(mock_config)
+
+        with patch("plexiglass.services.server_manager.PlexServer") as mock_plex:
+            mock_plex.return_value = mock_server
+            manager.connect_to_server("server0")
+            time.sleep(0.08)
+            manager.connect_to_server("server1")
+
+        assert manager.get_connected_servers() == ["server1"]
+        assert manager.evict_idle_connections() == []
+        time.sleep(0.08)
+        assert manager.evict_idle_connections() == ["server1"]
+        assert manager.get_pool_statistics()["evictions"] == 2
+
+    def test_zero_max_connected_servers_is_unbounded(self, mock_config, mock_server):
+        """max_connected_servers of 0 keeps the historical unlimited behavior."""
+        from plexiglass.services.server_manager import ServerManager
+
+        self._add_servers(mock_config, 5)
+        mock_config.get_settings.return_value["performance"]["max_connected_servers"] = 0
+        manager = ServerManager(mock_config)
+
+        with patch("plexiglass.services.server_manager.PlexServer") as mock_plex:
+            mock_plex.return_value = mock_server
+            manager.connect_all()
+
+        assert manager.get_pool_statistics()["pool_size"] == 5
+
+    def test_pool_max_size_does_not_cap_servers(self, mock_config, mock_server):
+        """pool_max_size only sizes each server's sockets, never the server count."""
+        from plexiglass.services.server_manager import ServerManager
+
+        self._add_servers(mock_config, 3)
+        mock_config.get_settings.return_value["performance"]["pool_max_size"] = 1
+        manager = ServerManager(mock_config)
+
+        with patch("plexiglass.services.server_manager.PlexServer") as mock_plex:
+            mock_plex.return_value = mock_server
+            manager.connect_all()
+
+        stats = manager.get_pool_statistics()
+        assert stats["pool_size"] == 3
+        assert stats["evictions"] == 0
+
+    def test_pinned_servers_are_never_evicted(self, mock_config, mock_server):
+        """Servers the dashboard polls stay connected beyond max_connected_servers."""
+        from plexiglass.services.server_manager import ServerManager
+
+        self._add_servers(mock_config, 3)
+        mock_config.get_settings.return_value["performance"]["max_connected_servers"] = 1
+        manager = ServerManager(mock_config)
+        manager.set_pinned_servers(["server0", "server1"])
+
+        with patch("plexiglass.services.server_manager.PlexServer") as mock_plex:
+            mock_plex.return_value = mock_server
+            for name in ("server2", "server0", "server1"):
+                manager.connect_to_server(name)
+
+        stats = manager.get_pool_statistics()
+        assert sorted(stats["connected_servers"]) == ["server0", "server1"]
+        assert stats["pinned_servers"] == ["server0", "server1"]
+        assert stats["evictions"] == 1
+
+    def test_new_connection_is_kept_when_the_rest_are_pinned(self, mock_config, mock_server):
+        """A fresh connection is never its own eviction victim, and is watched for alerts."""
+        from plexiglass.services.server_manager import ServerManager
+
+        self._add_servers(mock_config, 3)
+        mock_config.get_settings.return_value["performance"]["max_connected_servers"] = 2
+        manager = ServerManager(mock_config)
+        manager.set_pinned_servers(["server0", "server1"])
+
+        with (
+            patch("plexiglass.services.server_manager.PlexServer") as mock_plex,
+            patch.object(manager.alerts, "watch") as watch,
+        ):
+            mock_plex.return_value = mock_server
+            manager.connect_to_server("server0")
+            manager.connect_to_server("server1")
+            server = manager.connect_to_server("server2")
+            assert manager.connect_to_server("server2") is server
+
+        stats = manager.get_pool_statistics()
+        assert sorted(stats["connected_servers"]) == ["server0", "server1", "server2"]
+        assert stats["evictions"] == 0
+        assert stats["misses"] == 3
+        assert watch.call_count == 3
+
+
+class TestShutdown:
+    """Test releasing a manager that is being replaced."""
+
+    def test_shutdown_releases_connections_and_listeners(self, mock_config, mock_server):
+        """shutdown() stops probing, drops listeners and closes every connection."""
+        from plexiglass.services.server_manager import ServerManager
+
+        manager = ServerManager(mock_config)
+        listener = MagicMock()
+        with patch("plexiglass.services.server_manager.PlexServer") as mock_plex:
+            mock_plex.return_value = mock_server
+            manager.connect_to_server("test_server")
+            session = mock_plex.call_args.kwargs["session"]
+        manager.add_session_listener(listener)
+        manager.start_health_probing()
+
+        with (
+            patch.object(session, "close") as mock_close,
+            patch.object(manager.alerts, "remove_session_listener") as mock_remove,
+            patch.object(manager.data.cache, "shutdown") as mock_cache_shutdown,
+        ):
+            manager.shutdown()
+
+        mock_close.assert_called_once()
+        mock_remove.assert_called_once()
+        mock_cache_shutdown.assert_called_once()
+        assert manager.get_connected_servers() == []
+        assert manager._session_listeners == []
+        assert manager.health._stop.is_set()
@@ -0,0 +1,436 @@
+"""
+Unit tests for DashboardRefreshWorker.
+
+Tests background refresh execution and tick coalescing.
+"""
+
+import threading
+
+from plexiglass.services.dashboard_refresh import DashboardRefreshWorker, StatusCollector
+
+
+class TestDashboardRefreshWorker:
+    """Test DashboardRefreshWorker behavior."""
+
+    def test_from_settings_uses_dashboard_refresh_pool_size(self):
+        """Pool size comes from performance.worker_pools.dashboard_refresh."""
+        worker = DashboardRefreshWorker.from_settings(
+            {"performance": {"worker_pools": {"dashboard_refresh": 3}}}
+        )
+        try:
+            assert worker.max_workers == 3
+        finally:
+            worker.shutdown()
+
+    def test_from_settings_defaults_to_one_worker(self):
+        """Without overrides the default pool size is used."""
+        worker = DashboardRefreshWorker.from_settings(None)
+        try:
+            assert worker.max_workers == 1
+        finally:
+            worker.shutdown()
+
+    def test_result_delivered_from_worker_thread(self):
+        """Jobs run off the calling thread and deliver results via callback."""
+        worker = DashboardRefreshWorker()
+        done = threading.Event()
+        seen: dict[str, object] = {}
+
+        def on_result(value):
+            seen["value"] = value
+            seen["thread"] = threading.current_thread().name
+            done.set()
+
+        try:
+            assert worker.request(lambda: 42, on_result) is True
+            assert done.wait(2)
+        finally:
+            worker.shutdown()
+
+        assert seen["value"] == 42
+        assert str(seen["thread"]).startswith("dashboard-refresh")
+
+    def test_ticks_while_in_flight_are_coalesced(self):
+        """Requests during an in-flight refresh collapse into one follow-up run."""
+        worker = DashboardRefreshWorker()
+        release = threading.Event()
+        finished = threading.Event()
+        runs: list[str] = []
+
+        def slow_job():
+            runs.append("slow")
+            release.wait(2)
+            return "slow"
+
+        def fast_job(label):
+            def job():
+                runs.append(label)
+                return label
+
+            return job
+
+        results: list[str] = []
+
+        def on_result(value):
+            results.append(value)
+            if len(results) == 2:
+                finished.set()
+
+        try:
+            assert worker.request(slow_job, on_result) is True
+            assert worker.request(fast_job("second"), on_result) is False
+            assert worker.request(fast_job("third"), on_result) is False
+            release.set()
+            assert finished.wait(2)
+        finally:
+            worker.shutdown()
+
+        # Only the latest coalesced request runs after the slow one.
+        assert runs == ["slow", "third"]
+        assert results == ["slow", "third"]
+        assert worker.get_stats()["coalesced"] == 2
+
+    def test_failed_job_does_not_block_next_request(self):
+        """A failing job is counted and the worker becomes idle again."""
+        worker = DashboardRefreshWorker()
+        done = threading.Event()
+
+        def failing_job():
+            raise RuntimeError("boom")
+
+        try:
+            worker.request(failing_job, lambda value: None)
+            for _ in range(100):
+                if not worker.is_busy:
+                    break
+                threading.Event().wait(0.01)
+            worker.request(lambda: "ok", lambda value: done.set())
+            assert done.wait(2)
+        finally:
+            worker.shutdown()
+
+        assert worker.get_stats()["failed"] == 1
+
+    def test_shutdown_rejects_new_requests(self):
+        """No work is accepted after shutdown."""
+        worker = DashboardRefreshWorker()
+        worker.shutdown()
+
+        assert worker.request(lambda: 1, lambda value: None) is False
+
+
+class TestStatusCollector:
+    """Test deadline-bounded status collection."""
+
+    @staticmethod
+    def _manager(fetch):
+        from unittest.mock import MagicMock
+
+        manager = MagicMock()
+        manager.get_all_server_names.return_value = ["Fast", "Slow"]
+        manager.get_server_status.side_effect = fetch
+        return manager
+
+    def test_from_settings_reads_deadline(self):
+        """The deadline comes from performance.refresh_deadline."""
+        collector = StatusCollector.from_settings({"performance": {"refresh_deadline": 0.25}})
+        try:
+            assert collector.deadline == 0.25
+        finally:
+            collector.shutdown()
+
+    def test_tick_never_waits_past_deadline(self):
+        """A hung server is shown as stale instead of holding up the tick."""
+        import time
+
+        release = threading.Event()
+
+        def fetch(name):
+            if name == "Slow":
+                release.wait(5)
+            return {"name": name, "connected": True, "session_count": 1, "now_playing": []}
+
+        collector = StatusCollector(deadline=0.1)
+        try:
+            started = time.perf_counter()
+            snapshot = collector.collect(self._manager(fetch))
+            elapsed = time.perf_counter() - started
+
+            assert elapsed < 1
+            assert snapshot.stale_servers == ["Slow"]
+            assert snapshot.status_for("Fast")["fetched_at"] is not None
+            assert snapshot.status_for("Slow")["fetched_at"] is None
+        finally:
+            release.set()
+            collector.shutdown()
+
+    def test_fetched_servers_are_pinned(self):
+        """Servers a tick fetches from are exempt from eviction; backed-off ones are not."""
+        collector = StatusCollector(deadline=1)
+        manager = self._manager(lambda name: {"name": name, "connected": True})
+        try:
+            collector.collect(manager)
+            collector.scheduler.snap_back("Fast")
+            collector.collect(manager, scheduled=True)
+        finally:
+            collector.shutdown()
+
+        pinned = [set(call.args[0]) for call in manager.set_pinned_servers.call_args_list]
+        assert pinned == [{"Fast", "Slow"}, {"Fast"}]
+
+    def test_late_result_becomes_last_known_and_notifies(self):
+        """A fetch finishing after its tick is reported and reused as stale data."""
+        gates = [threading.Event(), threading.Event()]
+        late = threading.Event()
+        slow_calls: list[int] = []
+
+        def fetch(name):
+            if name == "Slow":
+                slow_calls.append(1)
+                gates[len(slow_calls) - 1].wait(5)
+            return {"name": name, "connected": True, "session_count": 2, "now_playing": []}
+
+        collector = StatusCollector(deadline=0.05, on_late_result=late.set)
+        manager = self._manager(fetch)
+        try:
+            collector.collect(manager)
+            gates[0].set()
+            assert late.wait(2)
+
+            # The next fetch misses the deadline too, but last known data now exists.
+            snapshot = collector.collect(manager)
+            slow = snapshot.status_for("Slow")
+            assert slow["stale"] is True
+            assert slow["session_count"] == 2
+            assert slow["fetched_at"] is not None
+        finally:
+            for gate in gates:
+                gate.set()
+            collector.shutdown()
+
+    def test_in_flight_fetch_is_not_duplicated(self):
+        """A server still being fetched from an earlier tick is not fetched again."""
+        release = threading.Event()
+        slow_calls = []
+
+        def fetch(name):
+            if name == "Slow":
+                slow_calls.append(name)
+                release.wait(5)
+            return {"name": name, "connected": True, "session_count": 0, "now_playing": []}
+
+        collector = StatusCollector(deadline=0.05)
+        manager = self._manager(fetch)
+        try:
+            collector.collect(manager)
+            collector.collect(manager)
+
+            assert slow_calls == ["Slow"]
+            assert collector.get_stats()["late"] == 2
+        finally:
+            release.set()
+            collector.shutdown()
+
+    def test_hung_fetch_does_not_hold_a_worker_slot(self):
+        """A fetch past its deadline stops counting against max_workers."""
+        release = threading.Event()
+
+        def fetch(name):
+            if name == "Slow":
+                release.wait(5)
+            return {"name": name, "connected": True, "session_count": 0, "now_playing": []}
+
+        collector = StatusCollector(deadline=0.1, max_workers=1)
+        manager = self._manager(fetch)
+        manager.get_all_server_names.return_value = ["Slow"]
+        try:
+            collector.collect(manager)
+            manager.get_all_server_names.return_value = ["Slow", "Fast"]
+            snapshot = collector.collect(manager)
+
+            assert snapshot.stale_servers == ["Slow"]
+            assert snapshot.status_for("Fast")["fetched_at"] is not None
+            assert collector.get_stats()["overdue"] == 1
+        finally:
+            release.set()
+            collector.shutdown()
+
+    def test_last_known_statuses_persist_through_disk_cache(self, tmp_path):
+        """Fresh statuses are written to disk and seed the next collector."""
+        from plexiglass.services.disk_cache import DiskCache
+
+        def fetch(name):
+            return {"name": name, "connected": True, "session_count": 4, "now_playing": []}
+
+        disk = DiskCache(tmp_path / "cache.sqlite3")
+        collector = StatusCollector(deadline=1, disk_cache=disk)
+        try:
+            collector.collect(self._manager(fetch))
+        finally:
+            collector.shutdown()
+        stored = disk.items(StatusCollector.DISK_NAMESPACE)
+        assert stored["Fast"]["session_count"] == 4
+        assert stored["Fast"]["fetched_at"] is not None
+
+        release = threading.Event()
+
+        def hung(name):
+            release.wait(5)
+            return {"name": name}
+
+        restarted = StatusCollector(deadline=0.05, disk_cache=DiskCache(tmp_path / "cache.sqlite3"))
+        try:
+            snapshot = restarted.collect(self._manager(hung))
+            assert snapshot.stale_servers == ["Fast", "Slow"]
+            assert snapshot.status_for("Fast")["session_count"] == 4
+        finally:
+            release.set()
+            restarted.shutdown()
+
+    def test_unchanged_statuses_are_not_rewritten(self, tmp_path):
+        """Only a status that changed (beyond timestamps and progress) is written to disk."""
+        from plexiglass.services.disk_cache import DiskCache
+
+        sessions = [{"session_key": "1", "title": "Film", "view_offset": 0}]
+
+        def fetch(name):
+            sessions[0]["view_offset"] += 1000
+            return {
+                "name": name,
+                "connected": True,
+                "latency_ms": float(sessions[0]["view_offset"]),
+                "session_count": len(sessions),
+                "now_playing": [dict(entry) for entry in sessions],
+            }
+
+        disk = DiskCache(tmp_path / "cache.sqlite3")
+        collector = StatusCollector(deadline=1, disk_cache=disk)
+        manager = self._manager(fetch)
+        try:
+            collector.collect(manager)
+            collector.collect(manager)
+            assert disk.get_stats()["writes"] == 2
+
+            sessions.append({"session_key": "2", "title": "Show", "view_offset": 0})
+            collector.collect(manager)
+            assert disk.get_stats()["writes"] == 4
+        finally:
+            collector.shutdown()
+
+
+class TestScheduledCollection:
+    """Test collection driven by the per-server refresh schedule."""
+
+    @staticmethod
+    def _manager(names, fetch):
+        from unittest.mock import MagicMock
+
+        manager = MagicMock()
+        manager.get_all_server_names.return_value = names
+        manager.get_server_status.side_effect = fetch
+        return manager
+
+    def test_only_due_servers_are_fetched(self):
+        """Servers that aren't due are shown from their last fetch, not re-fetched."""
+        from plexiglass.services.refresh_scheduler import RefreshScheduler
+
+        calls = []
+
+        def fetch(name, resources=None):
+            calls.append((name, resources))
+            return {"name": name, "connected": True, "session_count": 0, "now_playing": []}
+
+        scheduler = RefreshScheduler(base_interval=60, jitter=0)
+        collector = StatusCollector(deadline=1, scheduler=scheduler)
+        manager = self._manager(["Home", "Lab"], fetch)
+        try:
+            collector.collect(manager, scheduled=True)
+            assert collector.has_due(manager) is False
+
+            scheduler.snap_back("Lab", "now_playing")
+            assert collector.has_due(manager) is True
+            snapshot = collector.collect(manager, scheduled=True)
+        finally:
+            collector.shutdown()
+
+        assert calls == [("Home", None), ("Lab", None), ("Lab", ("now_playing",))]
+        assert snapshot.stale_servers == []
+        assert snapshot.status_for("Home")["fetched_at"] is not None
+
+    def test_partial_fetch_keeps_other_endpoints(self):
+        """Endpoints that weren't due keep their last fetched values."""
+        from plexiglass.services.refresh_scheduler import RefreshScheduler
+
+        libraries = iter([3, 99])
+
+        def fetch(name, resources=None):
+            status = {"name": name, "connected": True, "session_count": 1, "now_playing": []}
+            status["library_count"] = next(libraries)
+            return status
+
+        scheduler = RefreshScheduler(base_interval=60, jitter=0)
+        collector = StatusCollector(deadline=1, scheduler=scheduler)
+        manager = self._manager(["Home"], fetch)
+        try:
+            collector.collect(manager, scheduled=True)
+            scheduler.snap_back("Home", "now_playing")
+            snapshot = collector.collect(manager, scheduled=True)
+        finally:
+            collector.shutdown()
+
+        assert snapshot.status_for("Home")["library_count"] == 3
+
+    def test_changes_snap_back_and_progress_does_not(self):
+        """A new session resets the interval; a moving viewOffset alone doesn't."""
+        from plexiglass.services.refresh_scheduler import RefreshScheduler
+
+        playing = {"session_key": "1", "state": "playing", "title": "Movie"}
+        responses = iter(
+            [
+                [],
+                [{**playing, "view_offset": 1000}],
+                [{**playing, "view_offset": 6000}],
+            ]
+        )
+
+        def fetch(name, resources=None):
+            now_playing = next(responses)
+            return {
+                "name": name,
+                "connected": True,
+                "session_count": len(now_playing),
+                "now_playing": now_playing,
+            }
+
+        scheduler = RefreshScheduler(base_interval=5, max_interval=60, backoff=2, jitter=0)
+        collector = StatusCollector(deadline=1, scheduler=scheduler)
+        manager = self._manager(["Home"], fetch)
+        key = ("Home", "now_playing")
+        try:
+            collector.collect(manager)
+            collector.collect(manager)
+            assert scheduler.interval(key) == 5
+            collector.collect(manager)
+            assert scheduler.interval(key) == 10
+        finally:
+            collector.shutdown()
+
+    def test_failed_fetch_backs_off(self):
+        """An erroring server is polled less often."""
+        from plexiglass.services.refresh_scheduler import RefreshScheduler
+
+        def fetch(name, resources=None):
+            raise RuntimeError("unreachable")
+
+        scheduler = RefreshScheduler(base_interval=5, backoff=2, jitter=0)
+        collector = StatusCollector(deadline=1, scheduler=scheduler)
+        manager = self._manager(["Home"], fetch)
+        try:
+            collector.collect(manager, scheduled=True)
+            snapshot = collector.collect(manager)
+        finally:
+            collector.shutdown()
+
+        assert scheduler.interval(("Home", "now_playing")) == 10
+        assert snapshot.stale_servers == ["Home"]
+        assert collector.has_due(manager) is False
@@ -0,0 +1,272 @@
+"""
+Tests for DashboardSnapshot data model.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+
+from plexiglass.models.dashboard_snapshot import (
+    MAX_PROGRESS_EXTRAPOLATION,
+    DashboardSnapshot,
+    extrapolate_progress,
+    format_age,
+)
+
+
+def _status(name: str, **overrides):
+    status = {
+        "name": name,
+        "connected": True,
+        "session_count": 0,
+        "now_playing": [],
+        "library_count": 0,
+        "library_items": 0,
+    }
+    status.update(overrides)
+    return status
+
+
+class TestDashboardSnapshot:
+    """Unit tests for DashboardSnapshot behavior."""
+
+    def test_capture_fetches_each_server_once(self):
+        manager = MagicMock()
+        manager.get_all_server_names.return_value = ["Home", "Lab"]
+        manager.get_server_status.side_effect = lambda name: _status(name)
+
+        snapshot = DashboardSnapshot.capture(manager)
+        _ = snapshot.summary
+        _ = snapshot.sessions
+        _ = [snapshot.status_for(name) for name in snapshot.server_names]
+
+        assert manager.get_server_status.call_count == 2
+        assert snapshot.server_names == ["Home", "Lab"]
+
+    def test_capture_uses_last_known_statuses_as_stale(self):
+        manager = MagicMock()
+        manager.get_all_server_names.return_value = ["Home", "Lab"]
+        manager.get_server_status.side_effect = lambda name: _status(name, connected=False)
+        fetched_at = datetime(2024, 1, 1, 12, 0)
+
+        snapshot = DashboardSnapshot.capture(
+            manager, last_known={"Home": _status("Home", session_count=3, fetched_at=fetched_at)}
+        )
+
+        manager.get_server_status.assert_called_once_with("Lab")
+        assert snapshot.stale_servers == ["Home"]
+        assert snapshot.status_for("Home")["session_count"] == 3
+        assert snapshot.status_for("Home")["fetched_at"] == fetched_at
+
+    def test_capture_without_manager_is_empty(self):
+        snapshot = DashboardSnapshot.capture(None)
+
+        assert snapshot.statuses == ()
+        assert snapshot.summary["total_servers"] == 0
+
+    def test_snapshot_is_immutable(self):
+        snapshot = DashboardSnapshot.from_statuses([_status("Home")])
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            snapshot.captured_at = datetime.now()  # type: ignore[misc]
+        with pytest.raises(TypeError):
+            snapshot.statuses[0]["connected"] = False  # type: ignore[index]
+
+    def test_records_capture_time(self):
+        captured_at = datetime(2024, 1, 1, 12, 0, 0)
+        snapshot = DashboardSnapshot.from_statuses([], captured_at=captured_at)
+
+        assert snapshot.captured_at == captured_at
+
+    def test_summary_aggregates_statuses(self):
+        snapshot = DashboardSnapshot.from_statuses(
+            [
+                _status("Home", session_count=2, library_count=3, library_items=40),
+                _status("Lab", connected=False),
+            ]
+        )
+
+        assert snapshot.summary == {
+            "total_servers": 2,
+            "connected_servers": 1,
+            "active_sessions": 2,
+            "total_libraries": 3,
+            "total_library_items": 40,
+        }
+
+    def test_sessions_are_tagged_with_server(self):
+        snapshot = DashboardSnapshot.from_statuses(
+            [_status("Home", now_playing=[{"title": "Movie", "state": "playing"}])]
+        )
+
+        assert snapshot.sessions == [{"title": "Movie", "state": "playing", "server": "Home"}]
+
+    def test_status_for_returns_copy(self):
+        snapshot = DashboardSnapshot.from_statuses([_status("Home")])
+
+        status = snapshot.status_for("Home")
+        status["connected"] = False
+
+        assert snapshot.status_for("Home")["connected"] is True
+        assert snapshot.status_for("Missing")["connected"] is False
+
+    def test_stale_statuses_tag_sessions(self):
+        fetched_at = datetime(2024, 1, 1, 12, 0, 0)
+        snapshot = DashboardSnapshot.from_statuses(
+            [
+                _status("Home"),
+                _status(
+                    "Lab",
+                    stale=True,
+                    fetched_at=fetched_at,
+                    now_playing=[{"title": "Show", "state": "paused"}],
+                ),
+            ]
+        )
+
+        assert snapshot.stale_servers == ["Lab"]
+        assert snapshot.sessions == [
+            {
+                "title": "Show",
+                "state": "paused",
+                "server": "Lab",
+                "stale": True,
+                "fetched_at": fetched_at,
+            }
+        ]
+
+    def test_with_play_states_patches_matching_sessions(self):
+        playing = {
+            "title": "Movie",
+            "state": "playing",
+            "session_key": "7",
+            "view_offset": 1_000,
+            "duration": 100_000,
+            "progress_percent": 1,
+        }
+        other = {"title": "Show", "state": "playing", "session_key": "8"}
+        snapshot = DashboardSnapshot.from_statuses(
+            [_status("Home", now_playing=[playing, other]), _status("Lab")]
+        )
+
+        patched = snapshot.with_play_states(
+            {"Home": {"7": {"state": "paused", "view_offset": 50_000}}}
+        )
+
+        movie, show = patched.status_for("Home")["now_playing"]
+        assert movie["state"] == "paused"
+        assert movie["view_offset"] == 50_000
+        assert movie["progress_percent"] == 50
+        assert show == other
+        assert patched.captured_at == snapshot.captured_at
+        assert snapshot.status_for("Home")["now_playing"][0]["state"] == "playing"
+        assert patched.session_keys("Home") == {"7", "8"}
+        assert patched.session_keys("Lab") == set()
+
+    def test_play_states_older_than_the_poll_are_ignored(self):
+        polled_at = datetime(2024, 1, 1, 12, 0, 0)
+        entry = {"state": "playing", "session_key": "7", "view_offset": 60_000, "duration": 100_000}
+        snapshot = DashboardSnapshot.from_statuses(
+            [_status("Home", now_playing=[{**entry, "observed_at": polled_at}])]
+        )
+        older = {
+            "state": "paused",
+            "view_offset": 10_000,
+            "observed_at": polled_at - timedelta(seconds=5),
+        }
+        newer = {
+            "state": "paused",
+            "view_offset": 70_000,
+            "observed_at": polled_at + timedelta(seconds=5),
+        }
+
+        kept = snapshot.with_play_states({"Home": {"7": older}}).status_for("Home")
+        patched = snapshot.with_play_states({"Home": {"7": newer}}).status_for("Home")
+
+        assert kept["now_playing"][0]["state"] == "playing"
+        assert kept["now_playing"][0]["observed_at"] == polled_at
+        assert patched["now_playing"][0]["state"] == "paused"
+        assert patched["now_playing"][0]["observed_at"] == newer["observed_at"]
+
+    def test_current_play_states_drops_superseded_and_gone_sessions(self):
+        polled_at = datetime(2024, 1, 1, 12, 0, 0)
+        snapshot = DashboardSnapshot.from_statuses(
+            [
+                _status(
+                    "Home",
+                    now_playing=[
+                        {"session_key": "7", "observed_at": polled_at},
+                        {"session_key": "8", "observed_at": polled_at},
+                    ],
+                ),
+                _status("Lab"),
+            ]
+        )
+        newer = {"state": "paused", "observed_at": polled_at + timedelta(seconds=1)}
+        older = {"state": "paused", "observed_at": polled_at - timedelta(seconds=1)}
+
+        current = snapshot.current_play_states(
+            {"Home": {"7": newer, "8": older, "9": newer}, "Lab": {"1": newer}}
+        )
+
+        assert current == {"Home": {"7": newer}}
+
+    def test_extrapolate_progress_advances_playing_sessions(self):
+        observed_at = datetime(2024, 1, 1, 12, 0, 0)
+        entry = {
+            "state": "playing",
+            "view_offset": 60_000,
+            "duration": 600_000,
+            "observed_at": observed_at,
+            "progress_percent": 10,
+        }
+
+        assert extrapolate_progress(entry, now=observed_at) == 10
+        assert extrapolate_progress(entry, now=observed_at + timedelta(seconds=60)) == 20
+        assert extrapolate_progress(entry, now=observed_at + timedelta(hours=2)) == 100
+        assert extrapolate_progress(entry, now=observed_at - timedelta(seconds=5)) == 10
+
+    def test_extrapolate_progress_is_capped_past_the_anchor(self):
+        observed_at = datetime(2024, 1, 1, 12, 0, 0)
+        entry = {
+            "state": "playing",
+            "view_offset": 0,
+            "duration": 3_600_000,
+            "observed_at": observed_at,
+        }
+        cap = int(MAX_PROGRESS_EXTRAPOLATION.total_seconds() / 3600 * 100)
+
+        assert extrapolate_progress(entry, now=observed_at + timedelta(hours=1)) == cap
+
+    @pytest.mark.parametrize(
+        "overrides",
+        [
+            {"state": "paused"},
+            {"stale": True},
+            {"observed_at": None},
+            {"duration": None},
+        ],
+    )
+    def test_extrapolate_progress_keeps_reported_value(self, overrides):
+        entry = {
+            "state": "playing",
+            "view_offset": 60_000,
+            "duration": 600_000,
+            "observed_at": datetime(2024, 1, 1, 12, 0, 0),
+            "progress_percent": 10,
+        }
+        entry.update(overrides)
+
+        assert extrapolate_progress(entry, now=datetime(2024, 1, 1, 13, 0, 0)) == 10
+
+    def test_format_age(self):
+        now = datetime(2024, 1, 1, 12, 0, 0)
+
+        assert format_age(None) == "-"
+        assert format_age(now - timedelta(seconds=12), now=now) == "12s"
+        assert format_age(now - timedelta(minutes=4, seconds=5), now=now) == "4m"
+        assert format_age(now - timedelta(hours=2), now=now) == "2h"
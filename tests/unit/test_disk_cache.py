@@ -0,0 +1,129 @@
+"""
+Unit tests for DiskCache.
+
+Tests the persistent SQLite tier: round trips, per-namespace TTLs,
+persistence across instances and error tolerance.
+"""
+
+from datetime import datetime
+from unittest.mock import patch
+
+from plexiglass.services.disk_cache import DiskCache
+
+
+class TestDiskCacheBasics:
+    """Test storing and reading values."""
+
+    def test_round_trip_preserves_values(self, tmp_path):
+        """Test that nested values, None and datetimes survive a round trip."""
+        disk = DiskCache(tmp_path / "cache.sqlite3")
+        status = {
+            "name": "Home",
+            "connected": True,
+            "now_playing": [{"title": "Movie", "progress": 0.5}],
+            "latency_ms": None,
+            "fetched_at": datetime(2024, 5, 1, 20, 30, 15),
+        }
+
+        assert disk.set("server_status", "Home", status) is True
+        assert disk.get("server_status", "Home") == status
+
+    def test_missing_key_returns_default(self, tmp_path):
+        """Test that a miss returns the default."""
+        disk = DiskCache(tmp_path / "cache.sqlite3")
+
+        assert disk.get("server_status", "Nope") is None
+        assert disk.get("server_status", "Nope", default={}) == {}
+
+    def test_namespaces_are_separate(self, tmp_path):
+        """Test that the same key in two namespaces holds two values."""
+        disk = DiskCache(tmp_path / "cache.sqlite3")
+        disk.set("server_info", "Home", {"version": "1.40"})
+        disk.set("library_list", "Home", ["Movies", "TV"])
+
+        assert disk.items("server_info") == {"Home": {"version": "1.40"}}
+        assert disk.items("library_list") == {"Home": ["Movies", "TV"]}
+
+    def test_values_persist_across_instances(self, tmp_path):
+        """Test that a new instance on the same file sees earlier writes."""
+        DiskCache(tmp_path / "cache.sqlite3").set("server_info", "Home", {"version": "1.40"})
+
+        assert DiskCache(tmp_path / "cache.sqlite3").get("server_info", "Home") == {
+            "version": "1.40"
+        }
+
+    def test_values_are_compressed(self, tmp_path):
+        """Test that large repetitive values are stored compressed."""
+        path = tmp_path / "cache.sqlite3"
+        disk = DiskCache(path)
+        disk.set("library_list", "Home", ["Some Library Title"] * 20_000)
+
+        assert path.stat().st_size < 100_000
+
+    def test_delete_and_clear(self, tmp_path):
+        """Test removing one value, one namespace and everything."""
+        disk = DiskCache(tmp_path / "cache.sqlite3")
+        disk.set("a", "1", 1)
+        disk.set("a", "2", 2)
+        disk.set("b", "1", 3)
+
+        disk.delete("a", "1")
+        assert disk.items("a") == {"2": 2}
+        disk.clear("a")
+        assert disk.items("a") == {}
+        assert disk.items("b") == {"1": 3}
+        disk.clear()
+        assert disk.items("b") == {}
+
+
+class TestDiskCacheTTL:
+    """Test per-namespace expiry."""
+
+    def test_namespace_ttls(self, tmp_path):
+        """Test that each namespace expires on its own TTL."""
+        clock = [1_000_000.0]
+        with patch("plexiglass.services.disk_cache.time.time", lambda: clock[0]):
+            disk = DiskCache(tmp_path / "cache.sqlite3", ttls={"short": 10}, default_ttl=100)
+            disk.set("short", "k", 1)
+            disk.set("long", "k", 2)
+
+            clock[0] += 20
+            assert disk.get("short", "k") is None
+            assert disk.get("long", "k") == 2
+            assert disk.items("short") == {}
+
+            assert disk.purge_expired() == 1
+            clock[0] += 100
+            assert disk.purge_expired() == 1
+
+
+class TestDiskCacheErrors:
+    """Test that storage problems degrade to misses."""
+
+    def test_unserializable_value_is_rejected(self, tmp_path):
+        """Test that a value JSON can't encode is not stored."""
+        disk = DiskCache(tmp_path / "cache.sqlite3")
+
+        assert disk.set("a", "k", object()) is False
+        assert disk.get("a", "k") is None
+        assert disk.get_stats()["errors"] == 1
+
+    def test_closed_connection_returns_defaults(self, tmp_path):
+        """Test that SQLite errors don't propagate."""
+        disk = DiskCache(tmp_path / "cache.sqlite3")
+        disk.close()
+
+        assert disk.set("a", "k", 1) is False
+        assert disk.get("a", "k", default="fallback") == "fallback"
+        assert disk.items("a") == {}
+
+    def test_from_settings(self, tmp_path):
+        """Test that the file lives next to the config and can be disabled."""
+        config_path = tmp_path / "servers.yaml"
+
+        disk = DiskCache.from_settings(config_path, None)
+        assert disk is not None
+        assert disk.path == tmp_path / "cache.sqlite3"
+        assert disk.ttl_for("server_status") == 24 * 3600
+
+        assert DiskCache.from_settings(config_path, {"performance": {"disk_cache": False}}) is None
@@ -6,9 +6,16 @@ retry logic, and graceful degradation functionality.
 """
 
 import pytest
+import requests
 from unittest.mock import Mock, AsyncMock, patch
+from plexiglass.services.circuit_breaker import CircuitBreaker, CircuitState
 from plexiglass.services.error_handler import ErrorHandler, ErrorSeverity
-from plexiglass.services.exceptions import ServiceError, ConnectionError, ServerNotFoundError
+from plexiglass.services.exceptions import (
+    CircuitOpenError,
+    ServiceError,
+    ConnectionError,
+    ServerNotFoundError,
+)
 from plexiglass.config.exceptions import ConfigurationError
 
 
@@ -159,6 +166,67 @@ class TestErrorHandler:
             calls = [call.args[0] for call in mock_sleep.call_args_list]
             assert calls[1] > calls[0]  # Exponential increase
 
+    def test_call_with_retry_success_after_failures(self):
+        """Test sync retry succeeds after transient failures."""
+        handler = ErrorHandler(retry_count=3, retry_delay=0.01)
+        mock_func = Mock(side_effect=[ConnectionError("Timeout"), "success"])
+
+        with patch("plexiglass.services.error_handler.time.sleep"):
+            result = handler.call_with_retry(mock_func)
+
+        assert result == "success"
+        assert mock_func.call_count == 2
+
+    def test_call_with_retry_non_retryable_error(self):
+        """Test sync retry doesn't retry non-retryable errors."""
+        handler = ErrorHandler(retry_count=3, retry_delay=0.01)
+        mock_func = Mock(side_effect=ServerNotFoundError("Not found"))
+
+        with pytest.raises(ServerNotFoundError):
+            handler.call_with_retry(mock_func, key="server")
+
+        assert mock_func.call_count == 1
+        assert handler.circuit_breaker.get_state("server") is CircuitState.CLOSED
+
+    def test_call_with_retry_opens_circuit_and_fails_fast(self):
+        """Test a flapping server costs one fast failure once its circuit opens."""
+        handler = ErrorHandler(
+            retry_count=3,
+            retry_delay=0.01,
+            circuit_breaker=CircuitBreaker(failure_threshold=2, recovery_timeout=60),
+        )
+        mock_func = Mock(side_effect=TimeoutError("timed out"))
+
+        with patch("plexiglass.services.error_handler.time.sleep"):
+            with pytest.raises(TimeoutError):
+                handler.call_with_retry(mock_func, key="server")
+
+        # Retrying stopped as soon as the circuit opened
+        assert mock_func.call_count == 2
+        assert handler.circuit_breaker.get_state("server") is CircuitState.OPEN
+
+        with pytest.raises(CircuitOpenError):
+            handler.call_with_retry(mock_func, key="server")
+        assert mock_func.call_count == 2
+
+    def test_next_backoff_delay_is_jittered_and_capped(self):
+        """Test decorrelated-jitter delays stay within [base, min(cap, 3 * previous)]."""
+        handler = ErrorHandler(retry_delay=0.1, max_retry_delay=1.0)
+
+        delay = handler.retry_delay
+        for _ in range(50):
+            upper = min(handler.max_retry_delay, delay * 3)
+            delay = handler.next_backoff_delay(delay)
+            assert handler.retry_delay <= delay <= upper
+
+    def test_is_retryable_error_network_errors(self):
+        """Test transport errors raised by plexapi/requests are retryable."""
+        handler = ErrorHandler()
+
+        assert handler.is_retryable_error(requests.exceptions.ConnectTimeout())
+        assert handler.is_retryable_error(TimeoutError())
+        assert not handler.is_retryable_error(CircuitOpenError("server"))
+
     def test_is_retryable_error_connection_errors(self):
         """Test retryable error detection - connection errors are retryable."""
         handler = ErrorHandler()
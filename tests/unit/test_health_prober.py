@@ -0,0 +1,126 @@
+"""
+Unit tests for HealthProber.
+
+Tests the per-server health state machine, latency EWMA and background probing.
+"""
+
+import threading
+import time
+
+from plexiglass.services.health_prober import HealthProber, HealthState
+
+
+class TestHealthProber:
+    """Test HealthProber behavior."""
+
+    def test_unprobed_server_is_unknown(self):
+        """Servers that were never probed report UNKNOWN and are not down."""
+        prober = HealthProber(probe=lambda name: None, targets=lambda: [])
+
+        health = prober.get_health("Home")
+
+        assert health.state is HealthState.UNKNOWN
+        assert prober.is_down("Home") is False
+
+    def test_successful_probe_is_healthy(self):
+        """A fast successful probe marks the server healthy and records latency."""
+        prober = HealthProber(probe=lambda name: None, targets=lambda: ["Home"])
+
+        health = prober.probe_now("Home")
+
+        assert health.state is HealthState.HEALTHY
+        assert health.latency_ewma_ms is not None
+        assert health.last_success is not None
+
+    def test_failures_degrade_then_mark_down(self):
+        """First failure degrades, repeated failures mark the server down."""
+
+        def probe(name):
+            raise TimeoutError("timed out")
+
+        prober = HealthProber(probe=probe, targets=lambda: ["Home"], down_after_failures=2)
+
+        assert prober.probe_now("Home").state is HealthState.DEGRADED
+        health = prober.probe_now("Home")
+
+        assert health.state is HealthState.DOWN
+        assert health.consecutive_failures == 2
+        assert health.last_error == "timed out"
+
+    def test_success_recovers_down_server(self):
+        """A single successful probe brings a down server back."""
+        prober = HealthProber(probe=lambda name: None, targets=lambda: ["Home"])
+        prober.record_failure("Home", TimeoutError())
+        prober.record_failure("Home", TimeoutError())
+
+        health = prober.probe_now("Home")
+
+        assert health.state is HealthState.HEALTHY
+        assert health.consecutive_failures == 0
+
+    def test_slow_latency_is_degraded(self):
+        """A responsive server whose latency EWMA exceeds the threshold is degraded."""
+        prober = HealthProber(
+            probe=lambda name: None, targets=lambda: ["Home"], degraded_latency_ms=100.0
+        )
+
+        health = prober.record_success("Home", 250.0)
+
+        assert health.state is HealthState.DEGRADED
+
+    def test_latency_is_smoothed(self):
+        """Latency is tracked as an exponentially weighted moving average."""
+        prober = HealthProber(probe=lambda name: None, targets=lambda: ["Home"])
+        prober.record_success("Home", 100.0)
+
+        health = prober.record_success("Home", 200.0)
+
+        assert health.last_latency_ms == 200.0
+        assert health.latency_ewma_ms == 100.0 + HealthProber.EWMA_ALPHA * 100.0
+
+    def test_probe_all_runs_probes_concurrently(self):
+        """One slow server does not serialize the probe round."""
+        barrier = threading.Barrier(3, timeout=2)
+
+        def probe(name):
+            barrier.wait()
+
+        prober = HealthProber(probe=probe, targets=lambda: ["A", "B", "C"], max_workers=3)
+
+        results = prober.probe_all()
+
+        assert {name: h.state for name, h in results.items()} == {
+            "A": HealthState.HEALTHY,
+            "B": HealthState.HEALTHY,
+            "C": HealthState.HEALTHY,
+        }
+
+    def test_background_thread_probes_targets(self):
+        """start() probes targets in the background until stop()."""
+        probed = threading.Event()
+
+        def probe(name):
+            probed.set()
+
+        prober = HealthProber(probe=probe, targets=lambda: ["Home"], interval=0.01)
+        prober.start()
+        try:
+            assert probed.wait(2)
+            assert prober.is_running is True
+        finally:
+            prober.stop()
+
+        deadline = time.monotonic() + 2
+        while prober.get_health("Home").state is HealthState.UNKNOWN:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+        assert prober.get_health("Home").state is HealthState.HEALTHY
+
+    def test_forget_drops_record(self):
+        """forget() resets a server back to UNKNOWN."""
+        prober = HealthProber(probe=lambda name: None, targets=lambda: ["Home"])
+        prober.probe_now("Home")
+
+        prober.forget("Home")
+
+        assert prober.get_health("Home").state is HealthState.UNKNOWN
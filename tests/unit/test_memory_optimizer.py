@@ -33,6 +33,57 @@ class TestMemoryOptimizerFormatting:
         assert "GB" in result
 
 
+class TestMemoryOptimizerEstimateSize:
+    """Test object size estimation."""
+
+    def test_estimate_size_grows_with_content(self):
+        """Test that bigger object graphs estimate larger."""
+        small = {"title": "x"}
+        large = {"items": [{"title": "x" * 100, "index": i} for i in range(1000)]}
+
+        assert MemoryOptimizer.estimate_size(large) > 100 * MemoryOptimizer.estimate_size(small)
+
+    def test_estimate_size_counts_shared_objects_once(self):
+        """Test that an object referenced twice is only counted once."""
+        payload = "y" * 10_000
+        once = MemoryOptimizer.estimate_size([payload])
+        twice = MemoryOptimizer.estimate_size([payload, payload])
+
+        assert twice - once < 100
+
+    def test_estimate_size_follows_instance_attributes(self):
+        """Test that plain objects are measured through their __dict__."""
+
+        class Item:
+            def __init__(self):
+                self.data = "z" * 10_000
+
+        assert MemoryOptimizer.estimate_size(Item()) > 10_000
+
+    def test_estimate_size_handles_cycles(self):
+        """Test that self-referencing structures terminate."""
+        cycle: list = []
+        cycle.append(cycle)
+
+        assert MemoryOptimizer.estimate_size(cycle) > 0
+
+    def test_estimate_size_measures_plexapi_xml_payloads(self):
+        """Test that a plexapi object's _data element is measured, its server is not."""
+        from xml.etree.ElementTree import Element, SubElement
+
+        from plexapi.library import MovieSection
+
+        server = type("Server", (), {})()
+        server.connection_state = ["w" * 1000 for _ in range(1000)]
+        data = Element("Directory", {"key": "1", "type": "movie", "summary": "x" * 1_000_000})
+        SubElement(data, "Location", {"path": "/media/" + "p" * 10_000})
+        sections = [MovieSection(server, data) for _ in range(3)]
+
+        size = MemoryOptimizer.estimate_size(sections)
+
+        assert 1_010_000 < size < 1_100_000
+
+
 class TestMemoryOptimizerGarbageCollection:
     """Test garbage collection functionality."""
 
@@ -73,6 +124,51 @@ class TestMemoryOptimizerStatus:
         assert "MB" in result or "GB" in result or "KB" in result
 
 
+class TestMemoryOptimizerUsage:
+    """Test process memory readings."""
+
+    def test_current_rss_reads_proc_statm(self, monkeypatch):
+        """Test that current RSS is resident pages times the page size."""
+        import builtins
+        import io
+        import os
+        import sys
+
+        monkeypatch.setitem(sys.modules, "psutil", None)
+        real_open = builtins.open
+
+        def fake_open(path, *args, **kwargs):
+            if path == "/proc/self/statm":
+                return io.StringIO("5000 1200 300 1 0 900 0\n")
+            return real_open(path, *args, **kwargs)
+
+        monkeypatch.setattr(builtins, "open", fake_open)
+        monkeypatch.setattr(os, "sysconf", lambda name: 4096)
+
+        assert MemoryOptimizer.get_current_rss() == 1200 * 4096
+
+    def test_current_rss_is_none_when_unreadable(self, monkeypatch):
+        """Test that platforms without psutil or /proc report None."""
+        import builtins
+        import sys
+
+        monkeypatch.setitem(sys.modules, "psutil", None)
+
+        def fake_open(path, *args, **kwargs):
+            raise FileNotFoundError(path)
+
+        monkeypatch.setattr(builtins, "open", fake_open)
+
+        assert MemoryOptimizer.get_current_rss() is None
+
+    def test_memory_usage_reports_current_and_peak(self):
+        """Test that both current and peak resident memory are reported."""
+        usage = MemoryOptimizer.get_memory_usage()
+
+        assert usage["current"] > 0
+        assert usage["peak"] > 0
+
+
 class TestMemoryOptimizerSuggestions:
     """Test memory cleanup suggestions."""
 
@@ -28,6 +28,7 @@ class TestPerformanceConfigDefaults:
         defaults = PerformanceConfig.get_defaults()
         assert "cache_ttl" in defaults
         assert "cache_size" in defaults
+        assert defaults["cache_max_bytes"] == PerformanceConfig.DEFAULT_CACHE_MAX_BYTES
 
     def test_defaults_have_connection_settings(self):
         """Test that defaults include connection settings."""
@@ -0,0 +1,185 @@
+"""
+Unit tests for PlexDataService.
+
+Tests per-category caching, invalidation, and sharing one fetch between the
+dashboard (ServerManager) and gallery demos.
+"""
+
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from plexiglass.gallery.demos.playback.list_recent_plays import ListRecentPlaysDemo
+from plexiglass.gallery.demos.server.list_server_sessions import ListServerSessionsDemo
+from plexiglass.services.plex_data_service import PlexDataService
+
+
+def make_server(identifier: str = "machine-1") -> MagicMock:
+    server = MagicMock()
+    server.machineIdentifier = identifier
+    server.sessions.return_value = [MagicMock(title="Movie", usernames=["alice"])]
+    server.library.sections.return_value = [MagicMock(title="Movies", totalSize=10)]
+    server.history.return_value = [MagicMock(title="Episode")]
+    return server
+
+
+class TestPlexDataService:
+    """Test cached accessors."""
+
+    def test_sessions_fetched_once_per_ttl(self):
+        """Test that repeated reads reuse one fetch."""
+        data = PlexDataService()
+        server = make_server()
+
+        first = data.sessions(server)
+        second = data.sessions(server)
+
+        assert server.sessions.call_count == 1
+        assert first == second
+        assert first is not second
+
+    def test_categories_use_their_own_ttls(self):
+        """Test that each accessor uses its cache_ttls entry."""
+        data = PlexDataService(ttls={"sessions": 0.05})
+        server = make_server()
+
+        data.sessions(server)
+        data.sections(server)
+        time.sleep(0.1)
+        data.sessions(server)
+        data.sections(server)
+
+        assert server.sessions.call_count == 2
+        assert server.library.sections.call_count == 1
+
+    def test_history_is_keyed_by_maxresults(self):
+        """Test that different history lengths are cached separately."""
+        data = PlexDataService()
+        server = make_server()
+
+        data.history(server, 5)
+        data.history(server, 5)
+        data.history(server, 20)
+
+        assert server.history.call_count == 2
+        server.history.assert_any_call(maxresults=20)
+
+    def test_servers_are_cached_separately(self):
+        """Test that servers with different identifiers don't share entries."""
+        data = PlexDataService()
+        office, home = make_server("office"), make_server("home")
+
+        data.sections(office)
+        data.sections(home)
+
+        assert office.library.sections.call_count == 1
+        assert home.library.sections.call_count == 1
+
+    def test_errors_are_not_cached(self):
+        """Test that a failed fetch is retried on the next read."""
+        data = PlexDataService()
+        server = make_server()
+        server.sessions.side_effect = [RuntimeError("timeout"), []]
+
+        with pytest.raises(RuntimeError):
+            data.sessions(server)
+        assert data.sessions(server) == []
+
+    def test_invalidate_one_resource(self):
+        """Test dropping one resource for one server."""
+        data = PlexDataService()
+        server = make_server()
+        data.sessions(server)
+        data.sections(server)
+
+        data.invalidate(server, ["sessions"])
+        data.sessions(server)
+        data.sections(server)
+
+        assert server.sessions.call_count == 2
+        assert server.library.sections.call_count == 1
+
+    def test_invalidate_server_and_everything(self):
+        """Test dropping a server's data, then all data."""
+        data = PlexDataService()
+        office, home = make_server("office"), make_server("home")
+        for server in (office, home):
+            data.sections(server)
+
+        data.invalidate(office)
+        assert data.cache.size() == 1
+        data.invalidate()
+        assert data.cache.size() == 0
+
+    def test_from_settings_reads_cache_ttls(self):
+        """Test building from performance settings."""
+        data = PlexDataService.from_settings({"performance": {"cache_ttls": {"sessions": 3}}})
+
+        assert data.ttls["sessions"] == 3
+        assert "history" in data.ttls
+
+
+class TestPlexDataServiceSharing:
+    """Test that the dashboard and demos share fetches."""
+
+    def test_demos_read_through_data_service(self):
+        """Test that demos use the shared service when it is set."""
+        data = PlexDataService()
+        server = make_server()
+        sessions_demo = ListServerSessionsDemo()
+        plays_demo = ListRecentPlaysDemo()
+        sessions_demo.data_service = data
+        plays_demo.data_service = data
+
+        sessions_demo.execute(server, {})
+        sessions_demo.execute(server, {})
+        plays_demo.execute(server, {"limit": 10})
+        data.history(server, 10)
+
+        assert server.sessions.call_count == 1
+        assert server.history.call_count == 1
+
+    def test_demo_without_data_service_queries_server(self):
+        """Test that demos still work without the shared service."""
+        server = make_server()
+        demo = ListServerSessionsDemo()
+
+        demo.execute(server, {})
+        demo.execute(server, {})
+
+        assert server.sessions.call_count == 2
+
+    def test_dashboard_and_demo_share_one_fetch(self, tmp_path: Path, monkeypatch):
+        """Test that ServerManager status and a demo reuse the same sessions fetch."""
+        from plexiglass.config.loader import ConfigLoader
+        from plexiglass.services.server_manager import ServerManager
+
+        monkeypatch.setenv("PLEX_TOKEN_HOME", "home-token-12345")
+        config_file = tmp_path / "servers.yaml"
+        config_file.write_text(
+            """
+servers:
+  - name: "Home Server"
+    url: "http://192.168.1.100:32400"
+    token: "${PLEX_TOKEN_HOME}"
+    default: true
+"""
+        )
+        loader = ConfigLoader(config_file)
+        loader.load()
+        manager = ServerManager(loader)
+
+        with patch("plexiglass.services.server_manager.PlexServer") as mock_plex:
+            server = make_server()
+            mock_plex.return_value = server
+            manager.connect_to_default()
+            manager.get_server_status("Home Server")
+            demo = ListServerSessionsDemo()
+            demo.data_service = manager.data
+            result = demo.execute(server, {})
+
+        assert result["sessions"][0]["title"] == "Movie"
+        assert server.sessions.call_count == 1
+        assert server.library.sections.call_count == 1
@@ -817,6 +817,187 @@ class TestMainScreen:
             assert hasattr(summary, "last_update")
             assert getattr(summary, "last_update") is not None
 
+    @pytest.mark.asyncio
+    async def test_dashboard_refresh_fetches_each_server_once(
+        self, sample_config_path: Path
+    ) -> None:
+        """
+        Refresh should capture one shared snapshot per tick.
+
+        Expected behavior:
+        - Summary, sessions panel and cards share a single status fetch per server
+        """
+        # Arrange
+        from plexiglass.app.plexiglass_app import PlexiGlassApp
+
+        app = PlexiGlassApp(config_path=sample_config_path)
+
+        # Act
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            screen = app.screen
+            server_manager = MagicMock()
+            server_manager.get_all_server_names.return_value = ["Home Server", "Test Server"]
+            server_manager.get_server_status.side_effect = lambda name: {
+                "name": name,
+                "connected": False,
+                "session_count": 0,
+                "now_playing": [],
+            }
+            app.server_manager = server_manager
+
+            getattr(screen, "_refresh_dashboard")()
+            for _ in range(50):
+                await pilot.pause(0.02)
+                if getattr(screen, "snapshot").server_names == ["Home Server", "Test Server"]:
+                    break
+
+            # Assert
+            assert server_manager.get_server_status.call_count == 2
+            assert getattr(screen, "snapshot").server_names == ["Home Server", "Test Server"]
+
+    @pytest.mark.asyncio
+    async def test_main_screen_connects_all_servers_on_mount(
+        self, sample_config_path: Path
+    ) -> None:
+        """
+        Dashboard should connect to the whole fleet in parallel at mount.
+
+        Expected behavior:
+        - ServerManager.connect_all is called from the refresh worker
+        """
+        # Arrange
+        from plexiglass.app.plexiglass_app import PlexiGlassApp
+        from plexiglass.services.server_manager import ServerManager
+
+        app = PlexiGlassApp(config_path=sample_config_path)
+
+        # Act
+        with patch.object(ServerManager, "connect_all", return_value={}) as mock_connect_all:
+            async with app.run_test() as pilot:
+                for _ in range(50):
+                    await pilot.pause(0.02)
+                    if mock_connect_all.called:
+                        break
+
+        # Assert
+        mock_connect_all.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_config_reload_replaces_server_manager(self, sample_config_path: Path) -> None:
+        """
+        Reloading the configuration should swap the dashboard onto a new manager.
+
+        Expected behavior:
+        - The old ServerManager is shut down
+        - The dashboard restarts probing and polling against the new one
+        """
+        # Arrange
+        from plexiglass.app.plexiglass_app import PlexiGlassApp
+        from plexiglass.services.server_manager import ServerManager
+
+        app = PlexiGlassApp(config_path=sample_config_path)
+
+        # Act
+        with patch.object(ServerManager, "connect_all", return_value={}):
+            async with app.run_test() as pilot:
+                await pilot.pause()
+                screen = app.screen
+                old_manager = app.server_manager
+                with patch.object(old_manager, "shutdown") as mock_shutdown:
+                    getattr(app, "_load_configuration")()
+                for _ in range(50):
+                    await pilot.pause(0.02)
+                    if getattr(screen, "services_manager") is app.server_manager:
+                        break
+
+                # Assert
+                mock_shutdown.assert_called_once()
+                assert app.server_manager is not old_manager
+                assert getattr(screen, "services_manager") is app.server_manager
+                assert app.server_manager.health.is_running
+                assert len(screen.query("ServerStatusCard")) == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_config_reload_closes_disk_cache(self, sample_config_path: Path) -> None:
+        """
+        A reload that fails to load the configuration drops the warm-start cache.
+
+        Expected behavior:
+        - The old manager is shut down and the old disk cache closed
+        - Neither stays attached to the app
+        """
+        # Arrange
+        from unittest.mock import MagicMock
+
+        from plexiglass.app.plexiglass_app import PlexiGlassApp
+        from plexiglass.config.loader import ConfigLoader
+        from plexiglass.services.server_manager import ServerManager
+
+        app = PlexiGlassApp(config_path=sample_config_path)
+
+        # Act
+        with patch.object(ServerManager, "connect_all", return_value={}):
+            async with app.run_test() as pilot:
+                await pilot.pause()
+                old_manager = app.server_manager
+                old_disk_cache = app.disk_cache = MagicMock()
+                with (
+                    patch.object(old_manager, "shutdown") as mock_shutdown,
+                    patch.object(ConfigLoader, "load", side_effect=ValueError("bad config")),
+                ):
+                    getattr(app, "_load_configuration")()
+                await pilot.pause()
+
+                # Assert
+                mock_shutdown.assert_called_once()
+                old_disk_cache.close.assert_called_once()
+                assert app.server_manager is None
+                assert app.disk_cache is None
+                assert app.error_message == "bad config"
+
+    @pytest.mark.asyncio
+    async def test_dashboard_refresh_runs_off_ui_thread(self, sample_config_path: Path) -> None:
+        """
+        Refresh fetches should run on the dashboard refresh worker pool.
+
+        Expected behavior:
+        - Status fetches happen on a worker thread, not the event loop thread
+        - Results are applied to widgets via a message
+        """
+        # Arrange
+        import threading
+
+        from plexiglass.app.plexiglass_app import PlexiGlassApp
+
+        app = PlexiGlassApp(config_path=sample_config_path)
+        fetch_threads: list[str] = []
+
+        def fake_status(name: str) -> dict:
+            fetch_threads.append(threading.current_thread().name)
+            return {"name": name, "connected": True, "session_count": 1, "now_playing": []}
+
+        # Act
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            screen = app.screen
+            server_manager = MagicMock()
+            server_manager.get_all_server_names.return_value = ["Home Server"]
+            server_manager.get_server_status.side_effect = fake_status
+            app.server_manager = server_manager
+
+            getattr(screen, "_refresh_dashboard")()
+            for _ in range(50):
+                await pilot.pause(0.02)
+                if getattr(screen, "snapshot").summary["active_sessions"] == 1:
+                    break
+
+            # Assert
+            assert fetch_threads
+            assert all(name.startswith("dashboard-refresh") for name in fetch_threads)
+            summary = screen.query_one("DashboardSummary")
+            assert "Active Sessions: 1" in str(summary.render())
+
     @pytest.mark.asyncio
     async def test_main_screen_has_header(self, sample_config_path: Path) -> None:
         """
@@ -861,6 +1042,204 @@ class TestMainScreen:
             footer = app.screen.query_one("Footer")
             assert footer is not None
 
+    def test_stale_status_shows_age(self) -> None:
+        """
+        Servers that missed the refresh deadline show how old their data is.
+
+        Expected behavior:
+        - Card renders a stale line with the data's age
+        - Sessions panel marks entries from stale servers
+        """
+        from datetime import datetime, timedelta
+
+        from plexiglass.app.plexiglass_app import ServerStatusCard, SessionDetailsPanel
+
+        fetched_at = datetime.now() - timedelta(seconds=30)
+        card = ServerStatusCard({"name": "Lab", "stale": True, "fetched_at": fetched_at})
+        panel = SessionDetailsPanel(
+            [{"server": "Lab", "title": "Show", "stale": True, "fetched_at": fetched_at}]
+        )
+
+        assert "Stale: last updated 3" in getattr(card, "_render_status")()
+        assert "(as of 3" in getattr(panel, "_render_sessions")()
+
+    @pytest.mark.asyncio
+    async def test_main_screen_warm_starts_from_disk_cache(self, sample_config_path: Path) -> None:
+        """
+        The first paint uses last known statuses saved by a previous run.
+
+        Expected behavior:
+        - App opens the disk cache next to servers.yaml
+        - Servers with a saved status are shown from it, flagged stale
+        """
+        from datetime import datetime
+
+        from plexiglass.app.plexiglass_app import MainScreen, PlexiGlassApp
+        from plexiglass.services.dashboard_refresh import StatusCollector
+        from plexiglass.services.disk_cache import DiskCache
+
+        saved = DiskCache(sample_config_path.with_name("cache.sqlite3"))
+        saved.set(
+            StatusCollector.DISK_NAMESPACE,
+            "Home Server",
+            {
+                "name": "Home Server",
+                "connected": True,
+                "session_count": 2,
+                "fetched_at": datetime.now(),
+            },
+        )
+        saved.close()
+
+        app = PlexiGlassApp(config_path=sample_config_path)
+
+        # Keep the first paint on screen: no refresh replaces it.
+        with patch.object(MainScreen, "_refresh_dashboard"):
+            async with app.run_test() as pilot:
+                await pilot.pause()
+                assert app.disk_cache is not None
+                snapshot = getattr(app.screen, "snapshot")
+
+        assert snapshot.stale_servers == ["Home Server"]
+        assert snapshot.status_for("Home Server")["session_count"] == 2
+        assert snapshot.status_for("Test Server")["connected"] is False
+
+    @pytest.mark.asyncio
+    async def test_play_state_alerts_patch_sessions_in_place(
+        self, sample_config_path: Path
+    ) -> None:
+        """
+        Live mode applies "playing" alerts to the session rows directly.
+
+        Expected behavior:
+        - A known session's state and progress change without a refresh
+        - An unknown session key triggers a refresh instead
+        """
+        from plexiglass.app.plexiglass_app import MainScreen, PlexiGlassApp
+        from plexiglass.models.dashboard_snapshot import DashboardSnapshot
+
+        snapshot = DashboardSnapshot.from_statuses(
+            [
+                {
+                    "name": "Home Server",
+                    "connected": True,
+                    "session_count": 1,
+                    "now_playing": [
+                        {
+                            "title": "Movie",
+                            "user": "alice",
+                            "state": "playing",
+                            "session_key": "7",
+                            "view_offset": 0,
+                            "duration": 200_000,
+                            "progress_percent": 0,
+                        }
+                    ],
+                }
+            ]
+        )
+        app = PlexiGlassApp(config_path=sample_config_path)
+
+        with patch.object(MainScreen, "_refresh_dashboard") as refresh:
+            async with app.run_test() as pilot:
+                await pilot.pause()
+                screen = app.screen
+                getattr(screen, "_apply_snapshot")(snapshot)
+                refresh.reset_mock()
+
+                screen.post_message(
+                    MainScreen.PlayStatesChanged(
+                        "Home Server",
+                        [{"sessionKey": "7", "state": "paused", "viewOffset": 100_000}],
+                    )
+                )
+                await pilot.pause()
+                panel_text = getattr(screen.query_one("SessionDetailsPanel"), "_render_sessions")()
+                refreshed_after_known = refresh.call_count
+
+                screen.post_message(
+                    MainScreen.PlayStatesChanged(
+                        "Home Server", [{"sessionKey": "8", "state": "playing", "viewOffset": 0}]
+                    )
+                )
+                await pilot.pause()
+
+        assert "Movie (alice) [paused] 50%" in panel_text
+        assert refreshed_after_known == 0
+        assert refresh.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_play_states_are_dropped_once_superseded_or_lost(
+        self, sample_config_path: Path
+    ) -> None:
+        """
+        Alert play states only outlive polls that haven't caught up with them.
+
+        Expected behavior:
+        - A poll observed after the alert replaces its play state
+        - A lost alert listener drops the server's play states and refreshes
+        """
+        from datetime import datetime, timedelta
+
+        from plexiglass.app.plexiglass_app import MainScreen, PlexiGlassApp
+        from plexiglass.models.dashboard_snapshot import DashboardSnapshot
+
+        def snapshot_at(observed_at: datetime, state: str = "playing") -> DashboardSnapshot:
+            entry = {
+                "title": "Movie",
+                "user": "alice",
+                "state": state,
+                "session_key": "7",
+                "view_offset": 0,
+                "duration": 200_000,
+                "progress_percent": 0,
+                "observed_at": observed_at,
+            }
+            return DashboardSnapshot.from_statuses(
+                [
+                    {
+                        "name": "Home Server",
+                        "connected": True,
+                        "session_count": 1,
+                        "now_playing": [entry],
+                    }
+                ]
+            )
+
+        app = PlexiGlassApp(config_path=sample_config_path)
+        paused = MainScreen.PlayStatesChanged(
+            "Home Server", [{"sessionKey": "7", "state": "paused", "viewOffset": 100_000}]
+        )
+
+        with patch.object(MainScreen, "_refresh_dashboard") as refresh:
+            async with app.run_test() as pilot:
+                await pilot.pause()
+                screen = app.screen
+                apply_snapshot = getattr(screen, "_apply_snapshot")
+                apply_snapshot(snapshot_at(datetime.now() - timedelta(minutes=1)))
+
+                screen.post_message(paused)
+                await pilot.pause()
+                apply_snapshot(snapshot_at(datetime.now() - timedelta(minutes=1)))
+                kept_by_stale_poll = dict(screen.play_states)
+
+                apply_snapshot(snapshot_at(datetime.now() + timedelta(seconds=1), "buffering"))
+                superseded = dict(screen.play_states)
+
+                screen.post_message(paused)
+                await pilot.pause()
+                refresh.reset_mock()
+                screen.post_message(MainScreen.PlayStatesChanged("Home Server", None))
+                await pilot.pause()
+                panel_text = getattr(screen.query_one("SessionDetailsPanel"), "_render_sessions")()
+                after_loss = dict(screen.play_states)
+
+        assert list(kept_by_stale_poll["Home Server"]) == ["7"]
+        assert superseded == {}
+        assert after_loss.get("Home Server", {}) == {}
+        assert "[buffering]" in panel_text
+        assert refresh.call_count == 1
+
 
 class TestGalleryScreen:
     """Test suite for the GalleryScreen (API Gallery)."""
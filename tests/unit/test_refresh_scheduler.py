@@ -0,0 +1,135 @@
+"""
+Unit tests for RefreshScheduler.
+
+Tests per-key next-due times, exponential backoff while data is unchanged,
+snapping back on change, and jitter.
+"""
+
+import random
+
+import pytest
+
+from plexiglass.services.refresh_scheduler import RefreshScheduler
+
+HOME = ("Home", "now_playing")
+LAB = ("Lab", "now_playing")
+
+
+def make_scheduler(**kwargs) -> RefreshScheduler:
+    options = {"base_interval": 5, "max_interval": 40, "backoff": 2, "jitter": 0}
+    options.update(kwargs)
+    return RefreshScheduler(**options)
+
+
+class TestRefreshScheduler:
+    """Test adaptive per-key intervals."""
+
+    def test_unknown_keys_are_due(self):
+        """A key that was never polled is due immediately."""
+        scheduler = make_scheduler()
+
+        assert scheduler.is_due(HOME, now=0)
+        assert scheduler.interval(HOME) == 5
+
+    def test_keys_are_scheduled_independently(self):
+        """Polling one server doesn't move another's next-due time."""
+        scheduler = make_scheduler()
+        scheduler.observe(HOME, "a", now=100)
+
+        assert not scheduler.is_due(HOME, now=104)
+        assert scheduler.is_due(HOME, now=105)
+        assert scheduler.is_due(LAB, now=101)
+
+    def test_unchanged_data_backs_off_exponentially(self):
+        """Each unchanged poll doubles the interval up to max_interval."""
+        scheduler = make_scheduler()
+        intervals = []
+        for now in range(6):
+            scheduler.observe(HOME, "same", now=now)
+            intervals.append(scheduler.interval(HOME))
+
+        assert intervals == [5, 10, 20, 40, 40, 40]
+
+    def test_change_snaps_back_to_base(self):
+        """A changed fingerprint resets the interval."""
+        scheduler = make_scheduler()
+        for now in range(4):
+            scheduler.observe(HOME, "same", now=now)
+
+        assert scheduler.observe(HOME, "different", now=10) is True
+        assert scheduler.interval(HOME) == 5
+        assert scheduler.is_due(HOME, now=15)
+
+    def test_failures_back_off(self):
+        """Failed polls back off like unchanged ones."""
+        scheduler = make_scheduler()
+        scheduler.observe_failure(HOME, now=0)
+        scheduler.observe_failure(HOME, now=5)
+
+        assert scheduler.interval(HOME) == 10
+        assert not scheduler.is_due(HOME, now=14)
+        assert scheduler.get_stats()["failures"] == 2
+        # The first successful poll counts as a change.
+        assert scheduler.observe(HOME, "a", now=15) is True
+
+    def test_snap_back_by_server_and_endpoint(self):
+        """snap_back makes matching keys due now at the base interval."""
+        scheduler = make_scheduler()
+        library = ("Home", "library_stats")
+        for key in (HOME, library, LAB):
+            scheduler.observe(key, "same", now=0)
+            scheduler.observe(key, "same", now=1)
+
+        scheduler.snap_back("Home", "now_playing")
+
+        assert scheduler.is_due(HOME, now=2)
+        assert scheduler.interval(HOME) == 5
+        assert not scheduler.is_due(library, now=2)
+        assert not scheduler.is_due(LAB, now=2)
+
+        scheduler.snap_back()
+        assert scheduler.is_due(library, now=2)
+        assert scheduler.is_due(LAB, now=2)
+
+    def test_jitter_spreads_next_due_times(self):
+        """Servers polled together get different, bounded next-due times."""
+        scheduler = make_scheduler(jitter=0.2, rng=random.Random(7))
+        keys = [(f"server-{index}", "now_playing") for index in range(50)]
+        for key in keys:
+            scheduler.observe(key, "a", now=0)
+
+        due_at = [
+            next(t / 10 for t in range(40, 61) if scheduler.is_due(key, now=t / 10)) for key in keys
+        ]
+
+        assert len(set(due_at)) > 5
+        assert min(due_at) >= 4.0
+        assert max(due_at) <= 6.0
+
+    @pytest.mark.parametrize(
+        ("settings", "expected"),
+        [
+            (None, (5, 60, 2.0, 0.2)),
+            (
+                {
+                    "ui": {"refresh_interval": 10},
+                    "performance": {
+                        "refresh_max_interval": 120,
+                        "refresh_backoff": 1.5,
+                        "refresh_jitter": 0.1,
+                    },
+                },
+                (10, 120, 1.5, 0.1),
+            ),
+        ],
+    )
+    def test_from_settings(self, settings, expected):
+        """Base interval comes from ui.refresh_interval, the rest from performance."""
+        scheduler = RefreshScheduler.from_settings(settings)
+
+        assert (
+            scheduler.base_interval,
+            scheduler.max_interval,
+            scheduler.backoff,
+            scheduler.jitter,
+        ) == expected
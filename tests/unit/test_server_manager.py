@@ -380,6 +380,84 @@ class TestServerManager:
         assert status["library_count"] == 1
         assert status["library_items"] == 12
 
+    def test_get_server_status_fetches_only_requested_resources(
+        self, sample_config_path: Path
+    ) -> None:
+        """
+        The refresh scheduler can poll one endpoint without the other.
+
+        Expected behavior:
+        - resources=("library_stats",) doesn't query sessions
+        - Skipped resources keep their zero defaults
+        """
+        # Arrange
+        from plexiglass.config.loader import ConfigLoader
+        from plexiglass.services.server_manager import ServerManager
+
+        loader = ConfigLoader(sample_config_path)
+        loader.load()
+        manager = ServerManager(loader)
+
+        # Act
+        with patch("plexiglass.services.server_manager.PlexServer") as mock_plex:
+            mock_server = MagicMock()
+            mock_server.sessions.return_value = [MagicMock()]
+            mock_server.library.sections.return_value = [MagicMock(totalSize=7)]
+            mock_plex.return_value = mock_server
+
+            manager.connect_to_default()
+            status = manager.get_server_status("Home Server", resources=("library_stats",))
+
+        # Assert
+        mock_server.sessions.assert_not_called()
+        assert status["session_count"] == 0
+        assert status["library_items"] == 7
+
+    def test_now_playing_observed_at_survives_cached_polls(self, sample_config_path: Path) -> None:
+        """
+        Sessions are anchored at the time their viewOffset was first seen.
+
+        Expected behavior:
+        - A poll repeating the same viewOffset/state keeps the original observed_at
+        - A new viewOffset re-anchors the session
+        """
+        # Arrange
+        from plexiglass.config.loader import ConfigLoader
+        from plexiglass.services.server_manager import ServerManager
+
+        loader = ConfigLoader(sample_config_path)
+        loader.load()
+        manager = ServerManager(loader)
+
+        session = MagicMock()
+        session.title = "The Matrix"
+        session.sessionKey = 12
+        session.state = "playing"
+        session.viewOffset = 30_000
+        session.duration = 120_000
+
+        # Act
+        with patch("plexiglass.services.server_manager.PlexServer") as mock_plex:
+            mock_server = MagicMock()
+            mock_server.sessions.return_value = [session]
+            mock_server.library.sections.return_value = []
+            mock_plex.return_value = mock_server
+
+            manager.connect_to_default()
+            first = manager.get_server_status("Home Server")["now_playing"][0]
+            manager.data.invalidate()
+            repeated = manager.get_server_status("Home Server")["now_playing"][0]
+            session.viewOffset = 40_000
+            manager.data.invalidate()
+            moved = manager.get_server_status("Home Server")["now_playing"][0]
+
+        # Assert
+        assert first["session_key"] == "12"
+        assert repeated["observed_at"] == first["observed_at"]
+        assert moved["observed_at"] >= first["observed_at"]
+        assert moved["view_offset"] == 40_000
+        assert manager._playback_anchors["Home Server"]["12"][0] == (40_000, "playing")
+
     def test_get_all_server_names(self, sample_config_path: Path) -> None:
         """
         RED TEST: Should return all server names from config.
@@ -0,0 +1,203 @@
+"""
+Unit tests for ShardedCacheService.
+
+Tests key routing, aggregated statistics, fan-out invalidation and
+per-shard locking.
+"""
+
+import threading
+import time
+
+import pytest
+
+from plexiglass.services.cache_service import CacheKey, CacheService
+from plexiglass.services.sharded_cache_service import ShardedCacheService
+
+
+class TestShardedCacheServiceBasics:
+    """Test the CacheService-compatible API."""
+
+    def test_set_get_has_delete(self):
+        """Test basic operations route to a consistent shard."""
+        cache = ShardedCacheService(shards=4)
+        for i in range(50):
+            cache.set(f"key:{i}", i)
+
+        assert all(cache.get(f"key:{i}") == i for i in range(50))
+        assert cache.has("key:7") is True
+        cache.delete("key:7")
+        assert cache.has("key:7") is False
+        assert cache.size() == 49
+
+    def test_keys_spread_across_shards(self):
+        """Test that keys are distributed over more than one shard."""
+        cache = ShardedCacheService(shards=4)
+        for i in range(100):
+            cache.set(f"key:{i}", i)
+
+        assert sum(1 for shard in cache._shards if shard.size() > 0) > 1
+
+    def test_capacity_split_across_shards(self):
+        """Test that entry and byte capacity are divided per shard."""
+        cache = ShardedCacheService(shards=4, max_entries=100, max_bytes=4000)
+
+        assert all(shard.max_entries == 25 for shard in cache._shards)
+        assert all(shard.max_bytes == 1000 for shard in cache._shards)
+
+    def test_refresh_workers_are_a_total_across_shards(self):
+        """Test that background refreshes on every shard share one bounded pool."""
+        from unittest.mock import patch
+
+        clock = [0.0]
+        lock = threading.Lock()
+        running = [0, 0]  # current, peak
+        release = threading.Event()
+
+        def refresh():
+            with lock:
+                running[0] += 1
+                running[1] = max(running[1], running[0])
+            release.wait(5)
+            with lock:
+                running[0] -= 1
+            return "new"
+
+        with patch("plexiglass.services.cache_service.time.monotonic", lambda: clock[0]):
+            cache = ShardedCacheService(shards=8, refresh_workers=2)
+            keys = [f"key:{i}" for i in range(32)]
+            for key in keys:
+                cache.get_or_set(key, lambda: "old", ttl=1, stale_ttl=60)
+            clock[0] += 2
+            for key in keys:
+                cache.get_or_set(key, refresh, ttl=1, stale_ttl=60)
+            time.sleep(0.2)
+            release.set()
+            cache.shutdown()
+
+        assert len({id(shard._refresh_executor) for shard in cache._shards}) == 1
+        assert running[1] == 2
+
+    def test_get_or_set_passes_options(self):
+        """Test that get_or_set forwards CacheService options."""
+        cache = ShardedCacheService(shards=2)
+        calls = []
+
+        def factory():
+            calls.append(1)
+            return None
+
+        cache.get_or_set("key", factory, ttl=30)
+        cache.get_or_set("key", factory, ttl=30)
+
+        assert len(calls) == 1
+
+    def test_invalidation_fans_out(self):
+        """Test that prefix, pattern and tag invalidation reach every shard."""
+        cache = ShardedCacheService(shards=4)
+        for i in range(20):
+            cache.set(CacheKey("plex", "office", f"r{i}"), i)
+            cache.set(CacheKey("plex", "home", f"r{i}"), i)
+            cache.set(f"tmp:{i}", i)
+
+        assert cache.invalidate_tags({"server:office"}) == 20
+        cache.invalidate_prefix("tmp:")
+        assert cache.size() == 20
+        cache.invalidate_pattern("plex:home:r1*")
+        assert cache.size() == 9
+
+    def test_stats_are_aggregated(self):
+        """Test that statistics are summed over shards."""
+        cache = ShardedCacheService(shards=4, max_entries=1000)
+        for i in range(10):
+            cache.set(f"key:{i}", i)
+        for i in range(10):
+            cache.get(f"key:{i}")
+        cache.get("absent")
+
+        stats = cache.get_stats()
+        assert stats["size"] == 10
+        assert stats["hits"] == 10
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == pytest.approx(10 / 11)
+        assert stats["shards"] == 4
+        assert stats["max_entries"] == 1000
+
+    def test_clear_resets_every_shard(self):
+        """Test that clear empties all shards."""
+        cache = ShardedCacheService(shards=3)
+        for i in range(30):
+            cache.set(f"key:{i}", i)
+        cache.clear()
+
+        assert cache.is_empty() is True
+
+    def test_from_settings(self):
+        """Test building from performance settings."""
+        cache = ShardedCacheService.from_settings(
+            {"performance": {"cache_shards": 2, "cache_ttl": 30}}
+        )
+
+        assert cache.shard_count == 2
+        assert cache.default_ttl == 30
+
+
+class TestShardedCacheServiceContention:
+    """Test that shards are locked independently."""
+
+    @staticmethod
+    def _get_in_thread(cache, key) -> threading.Event:
+        done = threading.Event()
+
+        def reader() -> None:
+            cache.get(key)
+            done.set()
+
+        threading.Thread(target=reader, daemon=True).start()
+        return done
+
+    @staticmethod
+    def _hold_lock(lock) -> tuple[threading.Event, threading.Event]:
+        held, release = threading.Event(), threading.Event()
+
+        def holder() -> None:
+            with lock:
+                held.set()
+                release.wait(5)
+
+        threading.Thread(target=holder, daemon=True).start()
+        assert held.wait(2)
+        return held, release
+
+    def test_get_is_not_blocked_by_another_shards_lock(self):
+        """Test that a held shard lock only blocks keys routed to that shard."""
+        cache = ShardedCacheService(shards=4)
+        busy_key = "key:0"
+        busy_shard = cache._shard(busy_key)
+        free_key = next(
+            f"key:{i}" for i in range(1, 100) if cache._shard(f"key:{i}") is not busy_shard
+        )
+        cache.set(busy_key, 0)
+        cache.set(free_key, 1)
+
+        _, release = self._hold_lock(busy_shard._lock)
+        try:
+            assert self._get_in_thread(cache, free_key).wait(1)
+            blocked = self._get_in_thread(cache, busy_key)
+            assert not blocked.wait(0.1)
+        finally:
+            release.set()
+        assert blocked.wait(2)
+
+    def test_single_lock_cache_blocks_every_key(self):
+        """Test the contrast: with one CacheService, any held lock blocks all gets."""
+        cache = CacheService()
+        cache.set("key:0", 0)
+        cache.set("key:1", 1)
+
+        _, release = self._hold_lock(cache._lock)
+        try:
+            blocked = self._get_in_thread(cache, "key:1")
+            assert not blocked.wait(0.1)
+        finally:
+            release.set()
+        assert blocked.wait(2)
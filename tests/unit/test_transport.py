@@ -0,0 +1,277 @@
+"""
+Unit tests for the hedging HTTP transport.
+
+Tests latency tracking, the hedge budget, hedged GET behavior and
+coalescing of identical in-flight GETs.
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from plexiglass.services.transport import (
+    CoalescingHedgingSession,
+    CoalescingSession,
+    HedgeBudget,
+    HedgingSession,
+    LatencyTracker,
+)
+
+URL = "http://plex.local:32400/status/sessions"
+
+
+def _seed(session: HedgingSession, latency_ms: float = 10.0) -> None:
+    for _ in range(session.min_samples):
+        session.tracker.record("/status/sessions", latency_ms)
+
+
+class TestLatencyTracker:
+    """Test LatencyTracker percentiles."""
+
+    def test_percentile_nearest_rank(self):
+        tracker = LatencyTracker(window=100)
+        for value in range(1, 101):
+            tracker.record("/a", float(value))
+
+        assert tracker.percentile("/a", 95) == 95.0
+        assert tracker.percentile("/a", 50) == 50.0
+        assert tracker.percentile("/missing", 95) is None
+
+    def test_window_keeps_recent_samples(self):
+        tracker = LatencyTracker(window=2)
+        for value in (1000.0, 5.0, 6.0):
+            tracker.record("/a", value)
+
+        assert tracker.sample_count("/a") == 2
+        assert tracker.percentile("/a", 100) == 6.0
+
+
+class TestHedgeBudget:
+    """Test HedgeBudget rate capping."""
+
+    def test_caps_hedges_to_ratio(self):
+        budget = HedgeBudget(ratio=0.1, burst=1)
+        spent = 0
+        for _ in range(100):
+            budget.deposit()
+            spent += budget.try_spend()
+
+        assert spent == 10
+
+    def test_zero_ratio_never_hedges(self):
+        budget = HedgeBudget(ratio=0)
+        budget.deposit()
+
+        assert budget.try_spend() is False
+
+
+class TestHedgingSession:
+    """Test hedged GET behavior."""
+
+    def test_no_hedge_without_latency_history(self):
+        """Endpoints without enough samples are never hedged."""
+        session = HedgingSession(max_extra_ratio=1.0)
+        with patch.object(requests.Session, "request", return_value=MagicMock()) as mock_request:
+            session.get(URL)
+
+        assert mock_request.call_count == 1
+        assert session.get_stats()["hedged"] == 0
+        assert session.tracker.sample_count("/status/sessions") == 1
+        session.close()
+
+    def test_slow_primary_is_hedged_and_hedge_wins(self):
+        """A GET slower than the percentile gets a duplicate; the first answer wins."""
+        session = HedgingSession(max_extra_ratio=1.0)
+        _seed(session)
+        release = threading.Event()
+        primary_response, hedge_response = MagicMock(), MagicMock()
+        calls = []
+
+        def fake_request(self, method, url, *args, **kwargs):
+            calls.append(url)
+            if len(calls) == 1:
+                release.wait(2)
+                return primary_response
+            return hedge_response
+
+        with patch.object(requests.Session, "request", fake_request):
+            started = time.perf_counter()
+            response = session.get(URL)
+            elapsed = time.perf_counter() - started
+            release.set()
+
+        assert response is hedge_response
+        assert elapsed < 1
+        assert session.get_stats() == {"requests": 1, "hedged": 1, "hedge_wins": 1}
+        session.close()
+
+    def test_fast_primary_is_not_hedged(self):
+        """GETs that finish within the hedge delay are never duplicated."""
+        session = HedgingSession(max_extra_ratio=1.0)
+        _seed(session, latency_ms=500.0)
+        with patch.object(requests.Session, "request", return_value=MagicMock()) as mock_request:
+            session.get(URL)
+
+        assert mock_request.call_count == 1
+        assert session.get_stats()["hedged"] == 0
+        session.close()
+
+    def test_writes_are_never_hedged(self):
+        """Only idempotent GETs are hedged."""
+        session = HedgingSession(max_extra_ratio=1.0)
+        _seed(session, latency_ms=0.0)
+        with patch.object(requests.Session, "request", return_value=MagicMock()) as mock_request:
+            session.post(URL)
+            session.get(URL, stream=True)
+
+        assert mock_request.call_count == 2
+        assert session.get_stats()["requests"] == 0
+        session.close()
+
+    def test_budget_exhausted_waits_for_primary(self):
+        """Without budget a slow GET simply waits for the primary."""
+        session = HedgingSession(max_extra_ratio=0.0)
+        _seed(session, latency_ms=1.0)
+
+        def slow_request(self, method, url, *args, **kwargs):
+            time.sleep(0.05)
+            return "primary"
+
+        with patch.object(requests.Session, "request", slow_request):
+            assert session.get(URL) == "primary"
+
+        assert session.get_stats()["hedged"] == 0
+        session.close()
+
+    def test_error_raised_only_when_both_fail(self):
+        """A failed primary is masked by a successful hedge; both failing raises."""
+        session = HedgingSession(max_extra_ratio=1.0)
+        _seed(session, latency_ms=1.0)
+
+        def failing(self, method, url, *args, **kwargs):
+            time.sleep(0.05)
+            raise requests.exceptions.ConnectionError("reset")
+
+        with patch.object(requests.Session, "request", failing):
+            with pytest.raises(requests.exceptions.ConnectionError):
+                session.get(URL)
+        session.close()
+
+
+class TestCoalescingSession:
+    """Test single-flighting of identical concurrent GETs."""
+
+    def _concurrent_gets(self, session, requests_args, delay=0.05):
+        calls = []
+        barrier = threading.Barrier(len(requests_args))
+        results = [None] * len(requests_args)
+
+        def fake_request(self, method, url, *args, **kwargs):
+            calls.append((url, kwargs.get("headers")))
+            time.sleep(delay)
+            return MagicMock(url=url)
+
+        def worker(index, kwargs):
+            barrier.wait()
+            results[index] = session.get(**kwargs)
+
+        with patch.object(requests.Session, "request", fake_request):
+            threads = [
+                threading.Thread(target=worker, args=(i, kwargs))
+                for i, kwargs in enumerate(requests_args)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        return calls, results
+
+    def test_identical_gets_share_one_response(self):
+        """Concurrent GETs for the same URL and headers go out once."""
+        session = CoalescingSession()
+        headers = {"X-Plex-Token": "abc"}
+        calls, results = self._concurrent_gets(
+            session, [{"url": URL, "headers": dict(headers)} for _ in range(5)]
+        )
+
+        assert len(calls) == 1
+        assert all(result is results[0] for result in results)
+        assert session.get_coalescing_stats() == {"requests": 1, "coalesced": 4, "in_flight": 0}
+
+    def test_different_queries_and_headers_are_not_shared(self):
+        """Query strings and paging headers are part of the key."""
+        session = CoalescingSession()
+        calls, _ = self._concurrent_gets(
+            session,
+            [
+                {"url": URL},
+                {"url": URL + "?type=1"},
+                {"url": URL, "headers": {"X-Plex-Container-Start": "0"}},
+                {"url": URL, "headers": {"X-Plex-Container-Start": "100"}},
+            ],
+        )
+
+        assert len(calls) == 4
+        assert session.get_coalescing_stats()["coalesced"] == 0
+
+    def test_sequential_gets_are_not_coalesced(self):
+        """Only requests that overlap in time share a response."""
+        session = CoalescingSession()
+        with patch.object(requests.Session, "request", return_value=MagicMock()) as mock_request:
+            session.get(URL)
+            session.get(URL)
+
+        assert mock_request.call_count == 2
+
+    def test_writes_and_streams_pass_through(self):
+        """POSTs and streamed GETs are never coalesced."""
+        session = CoalescingSession()
+        with patch.object(requests.Session, "request", return_value=MagicMock()) as mock_request:
+            session.post(URL)
+            session.get(URL, stream=True)
+
+        assert mock_request.call_count == 2
+        assert session.get_coalescing_stats()["requests"] == 0
+
+    def test_error_is_shared_with_waiters(self):
+        """A failed leader fails its followers without extra requests."""
+        session = CoalescingSession()
+        calls = []
+        barrier = threading.Barrier(3)
+        errors = []
+
+        def failing(self, method, url, *args, **kwargs):
+            calls.append(url)
+            time.sleep(0.05)
+            raise requests.exceptions.ConnectionError("reset")
+
+        def worker():
+            barrier.wait()
+            try:
+                session.get(URL)
+            except requests.exceptions.ConnectionError as e:
+                errors.append(e)
+
+        with patch.object(requests.Session, "request", failing):
+            threads = [threading.Thread(target=worker) for _ in range(3)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert len(calls) == 1
+        assert len(errors) == 3
+        assert session.get_coalescing_stats()["in_flight"] == 0
+
+    def test_coalescing_hedging_session_keeps_both_counters(self):
+        """The combined session coalesces first and still tracks hedging."""
+        session = CoalescingHedgingSession(max_extra_ratio=1.0)
+        calls, _ = self._concurrent_gets(session, [{"url": URL} for _ in range(3)])
+
+        assert len(calls) == 1
+        assert session.get_coalescing_stats()["coalesced"] == 2
+        assert session.get_stats()["requests"] == 1
+        session.close()